@@ -3,6 +3,7 @@
 import logging
 from rfg.core import AbstractRFG
 from rfg.core import RFGRegister
+from rfg.core import RFGRegisterInfo
 logger = logging.getLogger(__name__)
 
 
@@ -163,6 +164,81 @@ class main_rfg(AbstractRFG):
         LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH = 0xaf
     
     
+    ## Size in bytes, address increment and software access of each register
+    RegistersInfo = {
+        'HK_FIRMWARE_ID' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'HK_FIRMWARE_VERSION' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'CHIP_VERSION' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'CLOCK_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'HK_XADC_TEMPERATURE' : RFGRegisterInfo(size = 2, increment = True, read = True, write = False, fifo = False),
+        'HK_XADC_VCCINT' : RFGRegisterInfo(size = 2, increment = True, read = True, write = False, fifo = False),
+        'HK_CONVERSION_TRIGGER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'HK_STAT_CONVERSIONS_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'HK_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'HK_ADCDAC_MOSI_FIFO' : RFGRegisterInfo(size = 1, increment = False, read = False, write = True, fifo = True),
+        'HK_ADC_MISO_FIFO' : RFGRegisterInfo(size = 1, increment = False, read = True, write = False, fifo = True),
+        'HK_ADC_MISO_FIFO_READ_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'SPI_LAYERS_CKDIVIDER' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'SPI_HK_CKDIVIDER' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYER_0_CFG_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYER_1_CFG_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYER_2_CFG_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYER_0_STATUS' : RFGRegisterInfo(size = 1, increment = False, read = True, write = False, fifo = False),
+        'LAYER_1_STATUS' : RFGRegisterInfo(size = 1, increment = False, read = True, write = False, fifo = False),
+        'LAYER_2_STATUS' : RFGRegisterInfo(size = 1, increment = False, read = True, write = False, fifo = False),
+        'LAYER_0_STAT_FRAME_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYER_1_STAT_FRAME_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYER_2_STAT_FRAME_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYER_0_STAT_IDLE_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYER_1_STAT_IDLE_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYER_2_STAT_IDLE_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYER_0_STAT_WRONGLENGTH_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYER_1_STAT_WRONGLENGTH_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYER_2_STAT_WRONGLENGTH_COUNTER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYER_0_MOSI' : RFGRegisterInfo(size = 1, increment = False, read = False, write = True, fifo = True),
+        'LAYER_0_MOSI_WRITE_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYER_1_MOSI' : RFGRegisterInfo(size = 1, increment = False, read = False, write = True, fifo = True),
+        'LAYER_1_MOSI_WRITE_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYER_2_MOSI' : RFGRegisterInfo(size = 1, increment = False, read = False, write = True, fifo = True),
+        'LAYER_2_MOSI_WRITE_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYER_0_LOOPBACK_MISO' : RFGRegisterInfo(size = 1, increment = False, read = False, write = True, fifo = True),
+        'LAYER_0_LOOPBACK_MISO_WRITE_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYER_1_LOOPBACK_MISO' : RFGRegisterInfo(size = 1, increment = False, read = False, write = True, fifo = True),
+        'LAYER_1_LOOPBACK_MISO_WRITE_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYER_2_LOOPBACK_MISO' : RFGRegisterInfo(size = 1, increment = False, read = False, write = True, fifo = True),
+        'LAYER_2_LOOPBACK_MISO_WRITE_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYER_0_LOOPBACK_MOSI' : RFGRegisterInfo(size = 1, increment = False, read = True, write = False, fifo = True),
+        'LAYER_0_LOOPBACK_MOSI_READ_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYER_1_LOOPBACK_MOSI' : RFGRegisterInfo(size = 1, increment = False, read = True, write = False, fifo = True),
+        'LAYER_1_LOOPBACK_MOSI_READ_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYER_2_LOOPBACK_MOSI' : RFGRegisterInfo(size = 1, increment = False, read = True, write = False, fifo = True),
+        'LAYER_2_LOOPBACK_MOSI_READ_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYERS_FPGA_TIMESTAMP_CTRL' : RFGRegisterInfo(size = 2, increment = True, read = True, write = True, fifo = False),
+        'LAYERS_FPGA_TIMESTAMP_DIVIDER' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYERS_FPGA_TIMESTAMP_COUNTER' : RFGRegisterInfo(size = 8, increment = True, read = True, write = False, fifo = False),
+        'LAYERS_FPGA_TIMESTAMP_FORCED' : RFGRegisterInfo(size = 8, increment = True, read = True, write = True, fifo = False),
+        'LAYERS_TLU_TRIGGER_DELAY' : RFGRegisterInfo(size = 2, increment = True, read = True, write = True, fifo = False),
+        'LAYERS_TLU_BUSY_DURATION' : RFGRegisterInfo(size = 2, increment = True, read = True, write = True, fifo = False),
+        'LAYERS_CFG_NODATA_CONTINUE' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYERS_SR_OUT' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYERS_SR_IN' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYERS_SR_RB_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYERS_SR_CRC' : RFGRegisterInfo(size = 6, increment = True, read = True, write = False, fifo = False),
+        'LAYERS_SR_BYTES' : RFGRegisterInfo(size = 1, increment = False, read = True, write = False, fifo = True),
+        'LAYERS_SR_BYTES_READ_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'LAYERS_INJ_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYERS_INJ_WADDR' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYERS_INJ_WDATA' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYERS_READOUT_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'LAYERS_READOUT' : RFGRegisterInfo(size = 1, increment = False, read = True, write = False, fifo = True),
+        'LAYERS_READOUT_READ_SIZE' : RFGRegisterInfo(size = 4, increment = True, read = True, write = False, fifo = False),
+        'IO_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'IO_LED' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'GECCO_SR_CTRL' : RFGRegisterInfo(size = 1, increment = False, read = True, write = True, fifo = False),
+        'HK_CONVERSION_TRIGGER_MATCH' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+        'LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH' : RFGRegisterInfo(size = 4, increment = True, read = True, write = True, fifo = False),
+    }
+    
     
     def __init__(self):
         super().__init__()
@@ -174,961 +250,854 @@ class main_rfg(AbstractRFG):
     
     
     async def read_hk_firmware_id(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_FIRMWARE_ID'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_FIRMWARE_ID'].read(count,targetQueue)
         
     
     async def read_hk_firmware_id_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_FIRMWARE_ID'],count = count, increment = True)
+        return  await self.registerAccessors['HK_FIRMWARE_ID'].readRaw(count)
         
     
     
     
     async def read_hk_firmware_version(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_FIRMWARE_VERSION'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_FIRMWARE_VERSION'].read(count,targetQueue)
         
     
     async def read_hk_firmware_version_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_FIRMWARE_VERSION'],count = count, increment = True)
+        return  await self.registerAccessors['HK_FIRMWARE_VERSION'].readRaw(count)
         
     
     
     
     async def write_chip_version(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['CHIP_VERSION'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['CHIP_VERSION'].write(value,flush)
         
     
     async def read_chip_version(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['CHIP_VERSION'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['CHIP_VERSION'].read(count,targetQueue)
         
     
     async def read_chip_version_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['CHIP_VERSION'],count = count, increment = False)
+        return  await self.registerAccessors['CHIP_VERSION'].readRaw(count)
         
     
     
     
     async def write_clock_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['CLOCK_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['CLOCK_CTRL'].write(value,flush)
         
     
     async def read_clock_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['CLOCK_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['CLOCK_CTRL'].read(count,targetQueue)
         
     
     async def read_clock_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['CLOCK_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['CLOCK_CTRL'].readRaw(count)
         
     
     
     
     async def read_hk_xadc_temperature(self, count : int = 2 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_XADC_TEMPERATURE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_XADC_TEMPERATURE'].read(count,targetQueue)
         
     
     async def read_hk_xadc_temperature_raw(self, count : int = 2 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_XADC_TEMPERATURE'],count = count, increment = True)
+        return  await self.registerAccessors['HK_XADC_TEMPERATURE'].readRaw(count)
         
     
     
     
     async def read_hk_xadc_vccint(self, count : int = 2 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_XADC_VCCINT'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_XADC_VCCINT'].read(count,targetQueue)
         
     
     async def read_hk_xadc_vccint_raw(self, count : int = 2 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_XADC_VCCINT'],count = count, increment = True)
+        return  await self.registerAccessors['HK_XADC_VCCINT'].readRaw(count)
         
     
     
     
     async def write_hk_conversion_trigger(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['HK_CONVERSION_TRIGGER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['HK_CONVERSION_TRIGGER'].write(value,flush)
         
     
     async def read_hk_conversion_trigger(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_CONVERSION_TRIGGER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_CONVERSION_TRIGGER'].read(count,targetQueue)
         
     
     async def read_hk_conversion_trigger_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_CONVERSION_TRIGGER'],count = count, increment = True)
+        return  await self.registerAccessors['HK_CONVERSION_TRIGGER'].readRaw(count)
         
     
     
     
     async def read_hk_stat_conversions_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_STAT_CONVERSIONS_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_STAT_CONVERSIONS_COUNTER'].read(count,targetQueue)
         
     
     async def read_hk_stat_conversions_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_STAT_CONVERSIONS_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['HK_STAT_CONVERSIONS_COUNTER'].readRaw(count)
         
     
     
     
     async def write_hk_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['HK_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['HK_CTRL'].write(value,flush)
         
     
     async def read_hk_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_CTRL'].read(count,targetQueue)
         
     
     async def read_hk_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['HK_CTRL'].readRaw(count)
         
     
     
     
     async def write_hk_adcdac_mosi_fifo(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['HK_ADCDAC_MOSI_FIFO'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['HK_ADCDAC_MOSI_FIFO'].write(value,flush)
         
     
-    async def write_hk_adcdac_mosi_fifo_bytes(self,values : bytearray,flush = False):
-        for b in values:
-            self.addWrite(register = self.Registers['HK_ADCDAC_MOSI_FIFO'],value = b,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+    async def write_hk_adcdac_mosi_fifo_bytes(self,values : bytes | bytearray | memoryview,flush = False):
+        await self.registerAccessors['HK_ADCDAC_MOSI_FIFO'].writeBytes(values,flush)
         
     
     
     
     async def read_hk_adc_miso_fifo(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_ADC_MISO_FIFO'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_ADC_MISO_FIFO'].read(count,targetQueue)
         
     
     async def read_hk_adc_miso_fifo_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_ADC_MISO_FIFO'],count = count, increment = False)
+        return  await self.registerAccessors['HK_ADC_MISO_FIFO'].readRaw(count)
         
     
     
     
     async def read_hk_adc_miso_fifo_read_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_ADC_MISO_FIFO_READ_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_ADC_MISO_FIFO_READ_SIZE'].read(count,targetQueue)
         
     
     async def read_hk_adc_miso_fifo_read_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_ADC_MISO_FIFO_READ_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['HK_ADC_MISO_FIFO_READ_SIZE'].readRaw(count)
         
     
     
     
     async def write_spi_layers_ckdivider(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['SPI_LAYERS_CKDIVIDER'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['SPI_LAYERS_CKDIVIDER'].write(value,flush)
         
     
     async def read_spi_layers_ckdivider(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['SPI_LAYERS_CKDIVIDER'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['SPI_LAYERS_CKDIVIDER'].read(count,targetQueue)
         
     
     async def read_spi_layers_ckdivider_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['SPI_LAYERS_CKDIVIDER'],count = count, increment = False)
+        return  await self.registerAccessors['SPI_LAYERS_CKDIVIDER'].readRaw(count)
         
     
     
     
     async def write_spi_hk_ckdivider(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['SPI_HK_CKDIVIDER'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['SPI_HK_CKDIVIDER'].write(value,flush)
         
     
     async def read_spi_hk_ckdivider(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['SPI_HK_CKDIVIDER'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['SPI_HK_CKDIVIDER'].read(count,targetQueue)
         
     
     async def read_spi_hk_ckdivider_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['SPI_HK_CKDIVIDER'],count = count, increment = False)
+        return  await self.registerAccessors['SPI_HK_CKDIVIDER'].readRaw(count)
         
     
     
     
     async def write_layer_0_cfg_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_0_CFG_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_0_CFG_CTRL'].write(value,flush)
         
     
     async def read_layer_0_cfg_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_0_CFG_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_0_CFG_CTRL'].read(count,targetQueue)
         
     
     async def read_layer_0_cfg_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_0_CFG_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['LAYER_0_CFG_CTRL'].readRaw(count)
         
     
     
     
     async def write_layer_1_cfg_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_1_CFG_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_1_CFG_CTRL'].write(value,flush)
         
     
     async def read_layer_1_cfg_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_1_CFG_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_1_CFG_CTRL'].read(count,targetQueue)
         
     
     async def read_layer_1_cfg_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_1_CFG_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['LAYER_1_CFG_CTRL'].readRaw(count)
         
     
     
     
     async def write_layer_2_cfg_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_2_CFG_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_2_CFG_CTRL'].write(value,flush)
         
     
     async def read_layer_2_cfg_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_2_CFG_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_2_CFG_CTRL'].read(count,targetQueue)
         
     
     async def read_layer_2_cfg_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_2_CFG_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['LAYER_2_CFG_CTRL'].readRaw(count)
         
     
     
     
     async def read_layer_0_status(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_0_STATUS'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_0_STATUS'].read(count,targetQueue)
         
     
     async def read_layer_0_status_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_0_STATUS'],count = count, increment = False)
+        return  await self.registerAccessors['LAYER_0_STATUS'].readRaw(count)
         
     
     
     
     async def read_layer_1_status(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_1_STATUS'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_1_STATUS'].read(count,targetQueue)
         
     
     async def read_layer_1_status_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_1_STATUS'],count = count, increment = False)
+        return  await self.registerAccessors['LAYER_1_STATUS'].readRaw(count)
         
     
     
     
     async def read_layer_2_status(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_2_STATUS'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_2_STATUS'].read(count,targetQueue)
         
     
     async def read_layer_2_status_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_2_STATUS'],count = count, increment = False)
+        return  await self.registerAccessors['LAYER_2_STATUS'].readRaw(count)
         
     
     
     
     async def write_layer_0_stat_frame_counter(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_0_STAT_FRAME_COUNTER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_0_STAT_FRAME_COUNTER'].write(value,flush)
         
     
     async def read_layer_0_stat_frame_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_0_STAT_FRAME_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_0_STAT_FRAME_COUNTER'].read(count,targetQueue)
         
     
     async def read_layer_0_stat_frame_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_0_STAT_FRAME_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_0_STAT_FRAME_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layer_1_stat_frame_counter(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_1_STAT_FRAME_COUNTER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_1_STAT_FRAME_COUNTER'].write(value,flush)
         
     
     async def read_layer_1_stat_frame_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_1_STAT_FRAME_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_1_STAT_FRAME_COUNTER'].read(count,targetQueue)
         
     
     async def read_layer_1_stat_frame_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_1_STAT_FRAME_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_1_STAT_FRAME_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layer_2_stat_frame_counter(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_2_STAT_FRAME_COUNTER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_2_STAT_FRAME_COUNTER'].write(value,flush)
         
     
     async def read_layer_2_stat_frame_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_2_STAT_FRAME_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_2_STAT_FRAME_COUNTER'].read(count,targetQueue)
         
     
     async def read_layer_2_stat_frame_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_2_STAT_FRAME_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_2_STAT_FRAME_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layer_0_stat_idle_counter(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_0_STAT_IDLE_COUNTER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_0_STAT_IDLE_COUNTER'].write(value,flush)
         
     
     async def read_layer_0_stat_idle_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_0_STAT_IDLE_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_0_STAT_IDLE_COUNTER'].read(count,targetQueue)
         
     
     async def read_layer_0_stat_idle_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_0_STAT_IDLE_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_0_STAT_IDLE_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layer_1_stat_idle_counter(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_1_STAT_IDLE_COUNTER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_1_STAT_IDLE_COUNTER'].write(value,flush)
         
     
     async def read_layer_1_stat_idle_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_1_STAT_IDLE_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_1_STAT_IDLE_COUNTER'].read(count,targetQueue)
         
     
     async def read_layer_1_stat_idle_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_1_STAT_IDLE_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_1_STAT_IDLE_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layer_2_stat_idle_counter(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_2_STAT_IDLE_COUNTER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_2_STAT_IDLE_COUNTER'].write(value,flush)
         
     
     async def read_layer_2_stat_idle_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_2_STAT_IDLE_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_2_STAT_IDLE_COUNTER'].read(count,targetQueue)
         
     
     async def read_layer_2_stat_idle_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_2_STAT_IDLE_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_2_STAT_IDLE_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layer_0_stat_wronglength_counter(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_0_STAT_WRONGLENGTH_COUNTER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_0_STAT_WRONGLENGTH_COUNTER'].write(value,flush)
         
     
     async def read_layer_0_stat_wronglength_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_0_STAT_WRONGLENGTH_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_0_STAT_WRONGLENGTH_COUNTER'].read(count,targetQueue)
         
     
     async def read_layer_0_stat_wronglength_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_0_STAT_WRONGLENGTH_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_0_STAT_WRONGLENGTH_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layer_1_stat_wronglength_counter(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_1_STAT_WRONGLENGTH_COUNTER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_1_STAT_WRONGLENGTH_COUNTER'].write(value,flush)
         
     
     async def read_layer_1_stat_wronglength_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_1_STAT_WRONGLENGTH_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_1_STAT_WRONGLENGTH_COUNTER'].read(count,targetQueue)
         
     
     async def read_layer_1_stat_wronglength_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_1_STAT_WRONGLENGTH_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_1_STAT_WRONGLENGTH_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layer_2_stat_wronglength_counter(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_2_STAT_WRONGLENGTH_COUNTER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_2_STAT_WRONGLENGTH_COUNTER'].write(value,flush)
         
     
     async def read_layer_2_stat_wronglength_counter(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_2_STAT_WRONGLENGTH_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_2_STAT_WRONGLENGTH_COUNTER'].read(count,targetQueue)
         
     
     async def read_layer_2_stat_wronglength_counter_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_2_STAT_WRONGLENGTH_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_2_STAT_WRONGLENGTH_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layer_0_mosi(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_0_MOSI'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_0_MOSI'].write(value,flush)
         
     
-    async def write_layer_0_mosi_bytes(self,values : bytearray,flush = False):
-        for b in values:
-            self.addWrite(register = self.Registers['LAYER_0_MOSI'],value = b,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+    async def write_layer_0_mosi_bytes(self,values : bytes | bytearray | memoryview,flush = False):
+        await self.registerAccessors['LAYER_0_MOSI'].writeBytes(values,flush)
         
     
     
     
     async def read_layer_0_mosi_write_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_0_MOSI_WRITE_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_0_MOSI_WRITE_SIZE'].read(count,targetQueue)
         
     
     async def read_layer_0_mosi_write_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_0_MOSI_WRITE_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_0_MOSI_WRITE_SIZE'].readRaw(count)
         
     
     
     
     async def write_layer_1_mosi(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_1_MOSI'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_1_MOSI'].write(value,flush)
         
     
-    async def write_layer_1_mosi_bytes(self,values : bytearray,flush = False):
-        for b in values:
-            self.addWrite(register = self.Registers['LAYER_1_MOSI'],value = b,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+    async def write_layer_1_mosi_bytes(self,values : bytes | bytearray | memoryview,flush = False):
+        await self.registerAccessors['LAYER_1_MOSI'].writeBytes(values,flush)
         
     
     
     
     async def read_layer_1_mosi_write_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_1_MOSI_WRITE_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_1_MOSI_WRITE_SIZE'].read(count,targetQueue)
         
     
     async def read_layer_1_mosi_write_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_1_MOSI_WRITE_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_1_MOSI_WRITE_SIZE'].readRaw(count)
         
     
     
     
     async def write_layer_2_mosi(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_2_MOSI'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_2_MOSI'].write(value,flush)
         
     
-    async def write_layer_2_mosi_bytes(self,values : bytearray,flush = False):
-        for b in values:
-            self.addWrite(register = self.Registers['LAYER_2_MOSI'],value = b,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+    async def write_layer_2_mosi_bytes(self,values : bytes | bytearray | memoryview,flush = False):
+        await self.registerAccessors['LAYER_2_MOSI'].writeBytes(values,flush)
         
     
     
     
     async def read_layer_2_mosi_write_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_2_MOSI_WRITE_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_2_MOSI_WRITE_SIZE'].read(count,targetQueue)
         
     
     async def read_layer_2_mosi_write_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_2_MOSI_WRITE_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_2_MOSI_WRITE_SIZE'].readRaw(count)
         
     
     
     
     async def write_layer_0_loopback_miso(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_0_LOOPBACK_MISO'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_0_LOOPBACK_MISO'].write(value,flush)
         
     
-    async def write_layer_0_loopback_miso_bytes(self,values : bytearray,flush = False):
-        for b in values:
-            self.addWrite(register = self.Registers['LAYER_0_LOOPBACK_MISO'],value = b,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+    async def write_layer_0_loopback_miso_bytes(self,values : bytes | bytearray | memoryview,flush = False):
+        await self.registerAccessors['LAYER_0_LOOPBACK_MISO'].writeBytes(values,flush)
         
     
     
     
     async def read_layer_0_loopback_miso_write_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_0_LOOPBACK_MISO_WRITE_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_0_LOOPBACK_MISO_WRITE_SIZE'].read(count,targetQueue)
         
     
     async def read_layer_0_loopback_miso_write_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_0_LOOPBACK_MISO_WRITE_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_0_LOOPBACK_MISO_WRITE_SIZE'].readRaw(count)
         
     
     
     
     async def write_layer_1_loopback_miso(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_1_LOOPBACK_MISO'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_1_LOOPBACK_MISO'].write(value,flush)
         
     
-    async def write_layer_1_loopback_miso_bytes(self,values : bytearray,flush = False):
-        for b in values:
-            self.addWrite(register = self.Registers['LAYER_1_LOOPBACK_MISO'],value = b,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+    async def write_layer_1_loopback_miso_bytes(self,values : bytes | bytearray | memoryview,flush = False):
+        await self.registerAccessors['LAYER_1_LOOPBACK_MISO'].writeBytes(values,flush)
         
     
     
     
     async def read_layer_1_loopback_miso_write_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_1_LOOPBACK_MISO_WRITE_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_1_LOOPBACK_MISO_WRITE_SIZE'].read(count,targetQueue)
         
     
     async def read_layer_1_loopback_miso_write_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_1_LOOPBACK_MISO_WRITE_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_1_LOOPBACK_MISO_WRITE_SIZE'].readRaw(count)
         
     
     
     
     async def write_layer_2_loopback_miso(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYER_2_LOOPBACK_MISO'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYER_2_LOOPBACK_MISO'].write(value,flush)
         
     
-    async def write_layer_2_loopback_miso_bytes(self,values : bytearray,flush = False):
-        for b in values:
-            self.addWrite(register = self.Registers['LAYER_2_LOOPBACK_MISO'],value = b,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+    async def write_layer_2_loopback_miso_bytes(self,values : bytes | bytearray | memoryview,flush = False):
+        await self.registerAccessors['LAYER_2_LOOPBACK_MISO'].writeBytes(values,flush)
         
     
     
     
     async def read_layer_2_loopback_miso_write_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_2_LOOPBACK_MISO_WRITE_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_2_LOOPBACK_MISO_WRITE_SIZE'].read(count,targetQueue)
         
     
     async def read_layer_2_loopback_miso_write_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_2_LOOPBACK_MISO_WRITE_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_2_LOOPBACK_MISO_WRITE_SIZE'].readRaw(count)
         
     
     
     
     async def read_layer_0_loopback_mosi(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_0_LOOPBACK_MOSI'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_0_LOOPBACK_MOSI'].read(count,targetQueue)
         
     
     async def read_layer_0_loopback_mosi_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_0_LOOPBACK_MOSI'],count = count, increment = False)
+        return  await self.registerAccessors['LAYER_0_LOOPBACK_MOSI'].readRaw(count)
         
     
     
     
     async def read_layer_0_loopback_mosi_read_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_0_LOOPBACK_MOSI_READ_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_0_LOOPBACK_MOSI_READ_SIZE'].read(count,targetQueue)
         
     
     async def read_layer_0_loopback_mosi_read_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_0_LOOPBACK_MOSI_READ_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_0_LOOPBACK_MOSI_READ_SIZE'].readRaw(count)
         
     
     
     
     async def read_layer_1_loopback_mosi(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_1_LOOPBACK_MOSI'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_1_LOOPBACK_MOSI'].read(count,targetQueue)
         
     
     async def read_layer_1_loopback_mosi_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_1_LOOPBACK_MOSI'],count = count, increment = False)
+        return  await self.registerAccessors['LAYER_1_LOOPBACK_MOSI'].readRaw(count)
         
     
     
     
     async def read_layer_1_loopback_mosi_read_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_1_LOOPBACK_MOSI_READ_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_1_LOOPBACK_MOSI_READ_SIZE'].read(count,targetQueue)
         
     
     async def read_layer_1_loopback_mosi_read_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_1_LOOPBACK_MOSI_READ_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_1_LOOPBACK_MOSI_READ_SIZE'].readRaw(count)
         
     
     
     
     async def read_layer_2_loopback_mosi(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_2_LOOPBACK_MOSI'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_2_LOOPBACK_MOSI'].read(count,targetQueue)
         
     
     async def read_layer_2_loopback_mosi_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_2_LOOPBACK_MOSI'],count = count, increment = False)
+        return  await self.registerAccessors['LAYER_2_LOOPBACK_MOSI'].readRaw(count)
         
     
     
     
     async def read_layer_2_loopback_mosi_read_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYER_2_LOOPBACK_MOSI_READ_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYER_2_LOOPBACK_MOSI_READ_SIZE'].read(count,targetQueue)
         
     
     async def read_layer_2_loopback_mosi_read_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYER_2_LOOPBACK_MOSI_READ_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYER_2_LOOPBACK_MOSI_READ_SIZE'].readRaw(count)
         
     
     
     
     async def write_layers_fpga_timestamp_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_FPGA_TIMESTAMP_CTRL'],value = value,increment = True,valueLength=2)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_CTRL'].write(value,flush)
         
     
     async def read_layers_fpga_timestamp_ctrl(self, count : int = 2 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_CTRL'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_CTRL'].read(count,targetQueue)
         
     
     async def read_layers_fpga_timestamp_ctrl_raw(self, count : int = 2 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_CTRL'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_CTRL'].readRaw(count)
         
     
     
     
     async def write_layers_fpga_timestamp_divider(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_FPGA_TIMESTAMP_DIVIDER'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_DIVIDER'].write(value,flush)
         
     
     async def read_layers_fpga_timestamp_divider(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_DIVIDER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_DIVIDER'].read(count,targetQueue)
         
     
     async def read_layers_fpga_timestamp_divider_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_DIVIDER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_DIVIDER'].readRaw(count)
         
     
     
     
     async def read_layers_fpga_timestamp_counter(self, count : int = 8 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_COUNTER'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_COUNTER'].read(count,targetQueue)
         
     
     async def read_layers_fpga_timestamp_counter_raw(self, count : int = 8 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_COUNTER'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_COUNTER'].readRaw(count)
         
     
     
     
     async def write_layers_fpga_timestamp_forced(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_FPGA_TIMESTAMP_FORCED'],value = value,increment = True,valueLength=8)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_FORCED'].write(value,flush)
         
     
     async def read_layers_fpga_timestamp_forced(self, count : int = 8 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_FORCED'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_FORCED'].read(count,targetQueue)
         
     
     async def read_layers_fpga_timestamp_forced_raw(self, count : int = 8 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_FORCED'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_FORCED'].readRaw(count)
         
     
     
     
     async def write_layers_tlu_trigger_delay(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_TLU_TRIGGER_DELAY'],value = value,increment = True,valueLength=2)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_TLU_TRIGGER_DELAY'].write(value,flush)
         
     
     async def read_layers_tlu_trigger_delay(self, count : int = 2 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_TLU_TRIGGER_DELAY'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_TLU_TRIGGER_DELAY'].read(count,targetQueue)
         
     
     async def read_layers_tlu_trigger_delay_raw(self, count : int = 2 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_TLU_TRIGGER_DELAY'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_TLU_TRIGGER_DELAY'].readRaw(count)
         
     
     
     
     async def write_layers_tlu_busy_duration(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_TLU_BUSY_DURATION'],value = value,increment = True,valueLength=2)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_TLU_BUSY_DURATION'].write(value,flush)
         
     
     async def read_layers_tlu_busy_duration(self, count : int = 2 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_TLU_BUSY_DURATION'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_TLU_BUSY_DURATION'].read(count,targetQueue)
         
     
     async def read_layers_tlu_busy_duration_raw(self, count : int = 2 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_TLU_BUSY_DURATION'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_TLU_BUSY_DURATION'].readRaw(count)
         
     
     
     
     async def write_layers_cfg_nodata_continue(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_CFG_NODATA_CONTINUE'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_CFG_NODATA_CONTINUE'].write(value,flush)
         
     
     async def read_layers_cfg_nodata_continue(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_CFG_NODATA_CONTINUE'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_CFG_NODATA_CONTINUE'].read(count,targetQueue)
         
     
     async def read_layers_cfg_nodata_continue_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_CFG_NODATA_CONTINUE'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_CFG_NODATA_CONTINUE'].readRaw(count)
         
     
     
     
     async def write_layers_sr_out(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_SR_OUT'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_SR_OUT'].write(value,flush)
         
     
     async def read_layers_sr_out(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_SR_OUT'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_SR_OUT'].read(count,targetQueue)
         
     
     async def read_layers_sr_out_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_SR_OUT'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_SR_OUT'].readRaw(count)
         
     
     
     
     async def write_layers_sr_in(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_SR_IN'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_SR_IN'].write(value,flush)
         
     
     async def read_layers_sr_in(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_SR_IN'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_SR_IN'].read(count,targetQueue)
         
     
     async def read_layers_sr_in_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_SR_IN'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_SR_IN'].readRaw(count)
         
     
     
     
     async def write_layers_sr_rb_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_SR_RB_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_SR_RB_CTRL'].write(value,flush)
         
     
     async def read_layers_sr_rb_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_SR_RB_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_SR_RB_CTRL'].read(count,targetQueue)
         
     
     async def read_layers_sr_rb_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_SR_RB_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_SR_RB_CTRL'].readRaw(count)
         
     
     
     
     async def read_layers_sr_crc(self, count : int = 6 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_SR_CRC'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_SR_CRC'].read(count,targetQueue)
         
     
     async def read_layers_sr_crc_raw(self, count : int = 6 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_SR_CRC'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_SR_CRC'].readRaw(count)
         
     
     
     
     async def read_layers_sr_bytes(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_SR_BYTES'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_SR_BYTES'].read(count,targetQueue)
         
     
     async def read_layers_sr_bytes_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_SR_BYTES'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_SR_BYTES'].readRaw(count)
         
     
     
     
     async def read_layers_sr_bytes_read_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_SR_BYTES_READ_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_SR_BYTES_READ_SIZE'].read(count,targetQueue)
         
     
     async def read_layers_sr_bytes_read_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_SR_BYTES_READ_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_SR_BYTES_READ_SIZE'].readRaw(count)
         
     
     
     
     async def write_layers_inj_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_INJ_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_INJ_CTRL'].write(value,flush)
         
     
     async def read_layers_inj_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_INJ_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_INJ_CTRL'].read(count,targetQueue)
         
     
     async def read_layers_inj_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_INJ_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_INJ_CTRL'].readRaw(count)
         
     
     
     
     async def write_layers_inj_waddr(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_INJ_WADDR'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_INJ_WADDR'].write(value,flush)
         
     
     async def read_layers_inj_waddr(self, count : int = 0 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_INJ_WADDR'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_INJ_WADDR'].read(count,targetQueue)
         
     
     async def read_layers_inj_waddr_raw(self, count : int = 0 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_INJ_WADDR'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_INJ_WADDR'].readRaw(count)
         
     
     
     
     async def write_layers_inj_wdata(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_INJ_WDATA'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_INJ_WDATA'].write(value,flush)
         
     
     async def read_layers_inj_wdata(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_INJ_WDATA'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_INJ_WDATA'].read(count,targetQueue)
         
     
     async def read_layers_inj_wdata_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_INJ_WDATA'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_INJ_WDATA'].readRaw(count)
         
     
     
     
     async def write_layers_readout_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_READOUT_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_READOUT_CTRL'].write(value,flush)
         
     
     async def read_layers_readout_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_READOUT_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_READOUT_CTRL'].read(count,targetQueue)
         
     
     async def read_layers_readout_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_READOUT_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_READOUT_CTRL'].readRaw(count)
         
     
     
     
     async def read_layers_readout(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_READOUT'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_READOUT'].read(count,targetQueue)
         
     
     async def read_layers_readout_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_READOUT'],count = count, increment = False)
+        return  await self.registerAccessors['LAYERS_READOUT'].readRaw(count)
         
     
     
     
     async def read_layers_readout_read_size(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_READOUT_READ_SIZE'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_READOUT_READ_SIZE'].read(count,targetQueue)
         
     
     async def read_layers_readout_read_size_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_READOUT_READ_SIZE'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_READOUT_READ_SIZE'].readRaw(count)
         
     
     
     
     async def write_io_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['IO_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['IO_CTRL'].write(value,flush)
         
     
     async def read_io_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['IO_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['IO_CTRL'].read(count,targetQueue)
         
     
     async def read_io_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['IO_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['IO_CTRL'].readRaw(count)
         
     
     
     
     async def write_io_led(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['IO_LED'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['IO_LED'].write(value,flush)
         
     
     async def read_io_led(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['IO_LED'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['IO_LED'].read(count,targetQueue)
         
     
     async def read_io_led_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['IO_LED'],count = count, increment = False)
+        return  await self.registerAccessors['IO_LED'].readRaw(count)
         
     
     
     
     async def write_gecco_sr_ctrl(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['GECCO_SR_CTRL'],value = value,increment = False,valueLength=1)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['GECCO_SR_CTRL'].write(value,flush)
         
     
     async def read_gecco_sr_ctrl(self, count : int = 1 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['GECCO_SR_CTRL'],count = count, increment = False , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['GECCO_SR_CTRL'].read(count,targetQueue)
         
     
     async def read_gecco_sr_ctrl_raw(self, count : int = 1 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['GECCO_SR_CTRL'],count = count, increment = False)
+        return  await self.registerAccessors['GECCO_SR_CTRL'].readRaw(count)
         
     
     
     
     async def write_hk_conversion_trigger_match(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['HK_CONVERSION_TRIGGER_MATCH'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['HK_CONVERSION_TRIGGER_MATCH'].write(value,flush)
         
     
     async def read_hk_conversion_trigger_match(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['HK_CONVERSION_TRIGGER_MATCH'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['HK_CONVERSION_TRIGGER_MATCH'].read(count,targetQueue)
         
     
     async def read_hk_conversion_trigger_match_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['HK_CONVERSION_TRIGGER_MATCH'],count = count, increment = True)
+        return  await self.registerAccessors['HK_CONVERSION_TRIGGER_MATCH'].readRaw(count)
         
     
     
     
     async def write_layers_fpga_timestamp_divider_match(self,value : int,flush = False):
-        self.addWrite(register = self.Registers['LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH'],value = value,increment = True,valueLength=4)
-        if flush == True:
-            await self.flush()
+        await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH'].write(value,flush)
         
     
     async def read_layers_fpga_timestamp_divider_match(self, count : int = 4 , targetQueue: str | None = None) -> int: 
-        return  int.from_bytes(await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH'],count = count, increment = True , targetQueue = targetQueue), 'little') 
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH'].read(count,targetQueue)
         
     
     async def read_layers_fpga_timestamp_divider_match_raw(self, count : int = 4 ) -> bytes: 
-        return  await self.syncRead(register = self.Registers['LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH'],count = count, increment = True)
+        return  await self.registerAccessors['LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH'].readRaw(count)
         
     
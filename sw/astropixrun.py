@@ -17,9 +17,6 @@ import sys
 import time
 import xml.etree.ElementTree as ET
 
-import pandas as pd
-from tqdm import tqdm
-
 import drivers.astep.serial
 import drivers.astropix.decode
 import drivers.boards
@@ -45,7 +42,32 @@ class AstropixRun:
     ##################### FPGA INTERACTIONS #########################
     async def open_fpga(self, cmod: bool|None=None, uart: bool|None=None):
         """Create the Board Driver, open a connection to the hardware and performs a read test"""
-        if cmod or self.config.find("fpga").attrib["value"] == "cmod":
+        if self.config.find("protocol").attrib["value"] == "replay":
+            ## Replay of a recorded IO trace, no hardware needed
+            if cmod or self.config.find("fpga").attrib["value"] == "cmod":
+                self.boardDriver = drivers.boards.getCMODDriver()
+            else:
+                self.boardDriver = drivers.boards.getGeccoDriver()
+            self.boardDriver.selectTraceReplayIO(self.config.find("trace").attrib["value"])
+        elif self.config.find("protocol").attrib["value"] == "emulator":
+            ## In-process firmware emulator, optional <emulator hitrate="..."/> sets the hits per second per layer
+            emulatorArgs = {}
+            if self.config.find("emulator") is not None and "hitrate" in self.config.find("emulator").attrib:
+                emulatorArgs["hitRate"] = float(self.config.find("emulator").attrib["hitrate"])
+            if cmod or self.config.find("fpga").attrib["value"] == "cmod":
+                self.boardDriver = drivers.boards.getCMODEmulatorDriver(**emulatorArgs)
+            else:
+                self.boardDriver = drivers.boards.getGeccoEmulatorDriver(**emulatorArgs)
+        elif self.config.find("protocol").attrib["value"] == "socket":
+            ## Board IO shared by an RFG daemon, optional <socket address="..."/> selects the daemon socket
+            address = None
+            if self.config.find("socket") is not None:
+                address = self.config.find("socket").attrib.get("address")
+            if cmod or self.config.find("fpga").attrib["value"] == "cmod":
+                self.boardDriver = drivers.boards.getCMODSocketDriver(address)
+            else:
+                self.boardDriver = drivers.boards.getGeccoSocketDriver(address)
+        elif cmod or self.config.find("fpga").attrib["value"] == "cmod":
             if uart or self.config.find("protocol").attrib["value"] == "uart":
                 self.boardDriver = drivers.boards.getCMODUartDriver(self.config.find("port").attrib["value"])
             elif self.config.find("protocol").attrib["value"] == "spi":
@@ -68,6 +90,10 @@ class AstropixRun:
                                   or FPGA board \
                                   {self.config.find("fpga").attrib["value"]}.""")
 
+        ## Optional recording of all IO to a trace file
+        if self.config.find("trace_record") is not None:
+            self.boardDriver.selectTraceRecording(self.config.find("trace_record").attrib["value"])
+
         await self.boardDriver.open()
         logger.info("Opened FPGA, testing...")
         await self._test_io()
@@ -662,10 +688,17 @@ class AstropixRun:
         )
 
     # Read FPGA buffer and return buffer length and data stored within it
-    async def get_readout(self, counts: int|None = None):
+    async def get_readout(self, counts: int|None = None, speculative: bool = False):
+        """Returns the buffer size and the read data
+
+        Args:
+            speculative: Read the buffer size and the data in one round trip, counts bytes or an adaptive size if counts is None, filler bytes are trimmed
+        """
         if self.config.find("autoread").attrib["value"] != "True":
             for layer in self.layerlst:
                 await self.boardDriver.writeSPIBytesToLane(lane=layer, bytes=[0x00] * 50)
+        if speculative:
+            return await self.boardDriver.readoutReadSpeculative(counts)
         bufferSize = await self.boardDriver.readoutGetBufferSize()
         if counts is None:
             readout = await self.boardDriver.readoutReadBytes(bufferSize)
@@ -673,6 +706,23 @@ class AstropixRun:
             readout = await self.boardDriver.readoutReadBytes(counts)
         return bufferSize, readout
     
+    def get_readout_engine(self, counts: int|None = None, **kwargs):
+        """Returns a drivers.readout.ReadoutEngine reading the board like get_readout, add consumers then run it
+
+        Args:
+            counts: Maximal number of bytes per read, the whole buffer content if None
+            kwargs: Other ReadoutEngine arguments, like pollInterval or queueSize
+        """
+        from drivers.readout import ReadoutEngine
+
+        async def clockLayers():
+            for layer in self.layerlst:
+                await self.boardDriver.writeSPIBytesToLane(lane=layer, bytes=[0x00] * 50)
+
+        if self.config.find("autoread").attrib["value"] != "True":
+            kwargs.setdefault("beforePoll", clockLayers)
+        return ReadoutEngine(self.boardDriver, readSize=counts, **kwargs)
+
     async def get_buffer(self):
         bufferSize = await self.boardDriver.readoutGetBufferSize()
         readout = await self.boardDriver.readoutReadBytes(bufferSize)
@@ -689,24 +739,33 @@ class AstropixRun:
 
     # Parse raw data readouts to remove railing. Moved to postprocessing method to avoid SW slowdown when using autoread
     async def dataParse_autoread(self, data, buffer_lst, bitfile: str = None):
-        allData = b""
+        ## Joined once at the end, appending to a bytes object copies all the data for each readout
+        allData = []
         for i, buff in enumerate(buffer_lst):
             if buff > 0:
                 readout_data = data[i][:buff]
                 logger.info(binascii.hexlify(readout_data))
-                allData += readout_data
+                allData.append(readout_data)
                 if bitfile:
                     bitfile.write(f"{str(binascii.hexlify(readout_data))}\n")
 
         ## DAN - could also return buffer index to keep track of whether multiple hits occur in the same readout. Would need to propagate forward
 
-        return allData
+        return b"".join(allData)
 
     ############################ Decoder ##############################
     # Send data for decoding from raw
-    def decode_readout(self, readout: bytearray, i: int, printer: bool = True):
+    def decode_readout(self, readout: bytearray, i: int, printer: bool = True, vectorized: bool = False):
+        """Decodes the hits of a readout
+
+        Args:
+            printer: Print each decoded hit
+            vectorized: Decode v2/v3 hits with NumPy (Decode.decode_readout_numpy), same hits but they are not printed
+        """
         if self.chipversion==4:
             return drivers.astropix.decode.Decode().decode_readout_v4(logger, readout, i, printer)
+        elif vectorized:
+            return drivers.astropix.decode.Decode().decode_readout_numpy(readout, i)
         else:
             return drivers.astropix.decode.Decode().decode_readout(logger, readout, i, printer)
 
@@ -773,6 +832,8 @@ class AstropixRun:
 
     # progress bar
     def _wait_progress(self, seconds: int):
+        from tqdm import tqdm
+
         for _ in tqdm(range(seconds), desc=f"Wait {seconds} s"):
             time.sleep(1)
 
@@ -0,0 +1,317 @@
+"""
+Firmware Emulator IO
+
+This module provides an RFGIO implementation emulating the astep24-3l firmware register file in software.
+It decodes the byte level protocol, backs all registers of the Register File, models the MOSI/MISO FIFOs
+and the readout buffer which is filled with synthesized layer frames at a configurable hit rate.
+
+It is useful to run and load test scripts and the readout data path without hardware or simulation, for example:
+
+    boardDriver = drivers.boards.getCMODEmulatorDriver(hitRate = 10000)
+
+The register sizes and FIFOs are taken from the RegistersInfo table of the generated Register File.
+
+"""
+import logging
+import random
+import time
+
+import rfg.core
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
+
+## Register reset values from the firmware register file definition
+RESET_VALUES = {
+    "CHIP_VERSION": 0x3,
+    "CLOCK_CTRL": 0x2,
+    "HK_CONVERSION_TRIGGER_MATCH": 10,
+    "HK_CTRL": 0x10,
+    "SPI_LAYERS_CKDIVIDER": 0x4,
+    "SPI_HK_CKDIVIDER": 0x4,
+    "LAYER_0_CFG_CTRL": 0b111,
+    "LAYER_1_CFG_CTRL": 0b111,
+    "LAYER_2_CFG_CTRL": 0b111,
+    "LAYER_0_STATUS": 0x1,
+    "LAYER_1_STATUS": 0x1,
+    "LAYER_2_STATUS": 0x1,
+    "LAYERS_FPGA_TIMESTAMP_CTRL": 0x0010,
+    "LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH": 4,
+    "LAYERS_TLU_TRIGGER_DELAY": 2,
+    "LAYERS_TLU_BUSY_DURATION": 16,
+    "LAYERS_CFG_NODATA_CONTINUE": 5,
+    "LAYERS_INJ_CTRL": 0b110,
+    "LAYERS_READOUT_CTRL": 0x1,
+    "IO_CTRL": 0b00011000,
+}
+
+## Registers bit-banged by the host, like a FIFO the bytes written to them are counted in mosiBytesCount
+COUNTED_REGISTERS = ["LAYERS_SR_OUT"]
+
+## XADC raw value matching about 30°C
+XADC_TEMPERATURE_RAW = 0x99F0
+XADC_VCCINT_RAW = 0x5550
+
+LAYERS_COUNT = 3
+
+
+class ASTEPEmulatorIO(rfg.core.RFGIO):
+    """Emulates the firmware register file and readout behind the RFGIO interface
+
+    Args:
+        registerFile: The Register File to emulate, its Registers enumeration and RegistersInfo table are used
+        firmwareID: Value of HK_FIRMWARE_ID
+        hitRate: Hits per second generated by each layer with readout enabled, a list can set a rate per layer
+        chipsPerLayer: Number of chips in each daisy chain, used for generated chip IDs
+        bufferSize: Size of the readout buffer in bytes, frames are dropped when it is full
+        coreFrequency: Core clock frequency used to compute the FPGA timestamp
+        clock: Function returning the current time in seconds, time.monotonic by default.
+               Provide a manually advanced clock to generate hits independently of wall time
+        seed: Seed of the random generator for the hits content
+    """
+
+    def __init__(
+        self,
+        registerFile: rfg.core.AbstractRFG,
+        firmwareID: int = 0xAC03,
+        hitRate: float | list[float] = 1000.0,
+        chipsPerLayer: int = 1,
+        bufferSize: int = 64 * 1024,
+        coreFrequency: int = 80000000,
+        clock=time.monotonic,
+        seed: int | None = None,
+    ):
+        super().__init__()
+        self.registers = registers = registerFile.Registers
+        registersInfo = registerFile.RegistersInfo
+        self.firmwareID = firmwareID
+        self.hitRates = list(hitRate) if isinstance(hitRate, (list, tuple)) else [hitRate] * LAYERS_COUNT
+        self.chipsPerLayer = chipsPerLayer
+        self.bufferSize = bufferSize
+        self.coreFrequency = coreFrequency
+        self.clock = clock
+        self.random = random.Random(seed)
+
+        ## FIFO Masters accept written bytes, FIFO Slaves return bytes and have a read size register
+        self.sizes = {}
+        self.fifoMasters = {}
+        self.fifoSlaves = {}
+        for name, info in registersInfo.items():
+            address = registers[name].value
+            self.sizes[address] = info.size
+            if info.fifo and info.write:
+                self.fifoMasters[address] = name
+            elif info.fifo:
+                self.fifoSlaves[address] = bytearray()
+        self.countedRegisters = {registers[name].value: name for name in COUNTED_REGISTERS if name in registersInfo}
+        self.memorySize = max(address + size for address, size in self.sizes.items())
+        self.fifoSizeRegisters = {
+            registers[name].value: registers[name[: -len("_WRITE_SIZE")]].value if name.endswith("_WRITE_SIZE") else registers[name[: -len("_READ_SIZE")]].value
+            for name in registers.__members__
+            if name.endswith("_WRITE_SIZE") or name.endswith("_READ_SIZE")
+        }
+
+        self.reset()
+
+    def reg(self, name: str) -> int:
+        return self.registers[name].value
+
+    def reset(self):
+        """Reset the emulated firmware to register reset values and empty FIFOs"""
+        self.memory = bytearray(self.memorySize)
+        for name, value in RESET_VALUES.items():
+            if name in self.registers.__members__:
+                self.writeRegisterValue(self.reg(name), value)
+        self.writeRegisterValue(self.reg("HK_FIRMWARE_ID"), self.firmwareID)
+        self.writeRegisterValue(self.reg("HK_XADC_TEMPERATURE"), XADC_TEMPERATURE_RAW)
+        self.writeRegisterValue(self.reg("HK_XADC_VCCINT"), XADC_VCCINT_RAW)
+
+        for fifo in self.fifoSlaves.values():
+            fifo.clear()
+        self.readoutBuffer = self.fifoSlaves[self.reg("LAYERS_READOUT")]
+        self.mosiBytesCount = {name: 0 for name in [*self.fifoMasters.values(), *self.countedRegisters.values()]}
+
+        ## Pending protocol bytes and responses waiting to be read
+        self.pendingCommandBytes = bytearray()
+        self.responses = bytearray()
+
+        ## Hit generation state
+        self.startTime = self.clock()
+        self.lastUpdate = self.startTime
+        self.pendingHits = [0.0] * LAYERS_COUNT
+        self.generatedFrames = [0] * LAYERS_COUNT
+        self.overflowFrames = 0
+        self.readoutBytesRead = 0
+
+    def writeRegisterValue(self, address: int, value: int):
+        size = self.sizes[address]
+        self.memory[address : address + size] = value.to_bytes(size, "little")
+
+    def readRegisterValue(self, address: int) -> int:
+        return int.from_bytes(self.memory[address : address + self.sizes[address]], "little")
+
+    ## RFGIO Interface
+    ##################
+    async def open(self):
+        logger.info("Opened firmware emulator IO")
+
+    async def close(self):
+        pass
+
+    async def writeBytes(self, bytes: bytearray):
+        self.updateHits()
+        self.pendingCommandBytes += bytes
+        self.processCommands()
+
+    async def readBytes(self, count: int) -> bytes:
+        if len(self.responses) < count:
+            logger.warning("Emulator: %d bytes requested, only %d available", count, len(self.responses))
+        result = bytes(self.responses[:count])
+        del self.responses[:count]
+        return result
+
+    ## Protocol
+    ##################
+    def processCommands(self):
+        buffer = self.pendingCommandBytes
+        offset = 0
+        while len(buffer) - offset >= rfg.core.HEADER_FORMAT.size:
+            header, address, length = rfg.core.HEADER_FORMAT.unpack_from(buffer, offset)
+            increment = header & 0x04 != 0
+            if header & 0x01:
+                end = offset + rfg.core.HEADER_FORMAT.size + length
+                if end > len(buffer):
+                    break
+                self.write(address, buffer[offset + rfg.core.HEADER_FORMAT.size : end], increment)
+                offset = end
+            elif header & 0x02:
+                self.responses += self.read(address, length, increment)
+                offset += rfg.core.HEADER_FORMAT.size
+            else:
+                ## Not a command (padding), skip byte
+                offset += 1
+        del buffer[:offset]
+
+    def write(self, address: int, values: bytearray, increment: bool):
+        if address in self.fifoMasters:
+            self.writeFIFO(address, values)
+        elif increment:
+            self.memory[address : address + len(values)] = values
+        elif len(values) > 0:
+            self.memory[address] = values[-1]
+            if address in self.countedRegisters:
+                self.mosiBytesCount[self.countedRegisters[address]] += len(values)
+
+    def writeFIFO(self, address: int, values: bytearray):
+        """MOSI bytes are considered sent right away, written bytes are only counted"""
+        name = self.fifoMasters[address]
+        self.mosiBytesCount[name] += len(values)
+
+        ## The ADC returns one byte per byte sent if selected
+        if name == "HK_ADCDAC_MOSI_FIFO" and self.memory[self.reg("HK_CTRL")] & 0x1:
+            self.fifoSlaves[self.reg("HK_ADC_MISO_FIFO")] += bytes(len(values))
+
+    def read(self, address: int, length: int, increment: bool) -> bytes:
+        if address in self.fifoSlaves:
+            fifo = self.fifoSlaves[address]
+            data = bytes(fifo[:length])
+            del fifo[:length]
+            if fifo is self.readoutBuffer:
+                self.readoutBytesRead += len(data)
+            ## Reading an empty FIFO returns 0xFF
+            return data + b"\xff" * (length - len(data))
+
+        if address in self.fifoSizeRegisters:
+            fifoAddress = self.fifoSizeRegisters[address]
+            count = len(self.fifoSlaves[fifoAddress]) if fifoAddress in self.fifoSlaves else 0
+            self.writeRegisterValue(address, count)
+        elif address == self.reg("LAYERS_FPGA_TIMESTAMP_COUNTER"):
+            self.writeRegisterValue(address, self.fpgaTimestamp(self.clock()))
+        elif address == self.reg("CLOCK_CTRL"):
+            ## current_clk follows ext_clk_enable, as if the external clock was running
+            self.memory[address] = (self.memory[address] & ~0x4) | ((self.memory[address] & 0x1) << 2)
+        elif address in [self.reg(f"LAYER_{layer}_STAT_FRAME_COUNTER") for layer in range(LAYERS_COUNT)]:
+            layer = [self.reg(f"LAYER_{l}_STAT_FRAME_COUNTER") for l in range(LAYERS_COUNT)].index(address)
+            self.writeRegisterValue(address, self.generatedFrames[layer] & 0xFFFFFFFF)
+
+        if increment:
+            return bytes(self.memory[address : address + length])
+        return bytes([self.memory[address]]) * length
+
+    ## Readout emulation
+    ##################
+    def isLayerReadoutEnabled(self, layer: int) -> bool:
+        ctrl = self.memory[self.reg(f"LAYER_{layer}_CFG_CTRL")]
+        hold = self.memory[self.reg("LAYER_0_CFG_CTRL")] & 0x1
+        reset = self.memory[self.reg("LAYER_0_CFG_CTRL")] & 0x2
+        autoread = ctrl & 0x4 == 0
+        chipSelect = ctrl & 0x8 != 0
+        misoEnabled = ctrl & 0x10 == 0
+        return not hold and not reset and misoEnabled and (autoread or chipSelect)
+
+    def fpgaTimestamp(self, now: float) -> int:
+        ctrl = self.readRegisterValue(self.reg("LAYERS_FPGA_TIMESTAMP_CTRL"))
+        if ctrl & 0x40:
+            ts = self.readRegisterValue(self.reg("LAYERS_FPGA_TIMESTAMP_FORCED"))
+        elif ctrl & 0x1:
+            divider = max(self.readRegisterValue(self.reg("LAYERS_FPGA_TIMESTAMP_DIVIDER_MATCH")), 1) if ctrl & 0x2 else 1
+            ts = int((now - self.startTime) * self.coreFrequency / divider)
+        else:
+            ts = 0
+        if ctrl & 0x80:
+            ts &= ~0x1
+        return ts
+
+    def timestampBytesCount(self) -> int:
+        return ((self.readRegisterValue(self.reg("LAYERS_FPGA_TIMESTAMP_CTRL")) >> 4) & 0x3) * 2 + 2
+
+    def updateHits(self):
+        """Generates the frames for the time elapsed since the last update"""
+        now = self.clock()
+        elapsed = now - self.lastUpdate
+        self.lastUpdate = now
+        if elapsed <= 0:
+            return
+
+        tsBytes = self.timestampBytesCount()
+        frameSize = 7 + tsBytes
+        for layer in range(LAYERS_COUNT):
+            if not self.isLayerReadoutEnabled(layer):
+                self.pendingHits[layer] = 0.0
+                continue
+            self.pendingHits[layer] += self.hitRates[layer] * elapsed
+            count = int(self.pendingHits[layer])
+            if count == 0:
+                continue
+            self.pendingHits[layer] -= count
+
+            room = (self.bufferSize - len(self.readoutBuffer)) // frameSize
+            if count > room:
+                self.overflowFrames += count - room
+                count = room
+            if count > 0:
+                self.readoutBuffer += self.generateFrames(layer, count, now - elapsed, now, tsBytes)
+                self.generatedFrames[layer] += count
+
+    def generateFrames(self, layer: int, count: int, start: float, end: float, tsBytes: int) -> bytes:
+        """Returns count frames with random content and timestamps spread between start and end"""
+        rnd = self.random.getrandbits
+        frames = bytearray()
+        step = (end - start) / count
+        header = bytes([6 + tsBytes, layer])
+        for i in range(count):
+            chipID = rnd(16) % self.chipsPerLayer
+            location = rnd(6) % 35
+            tot = rnd(12)
+            frames += header
+            frames += bytes(
+                [
+                    (chipID << 3) | 0b100,
+                    (rnd(1) << 7) | location,
+                    rnd(8),
+                    tot >> 8,
+                    tot & 0xFF,
+                ]
+            )
+            frames += self.fpgaTimestamp(start + i * step).to_bytes(8, "big")[-tsBytes:]
+        return bytes(frames)
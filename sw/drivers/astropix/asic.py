@@ -15,9 +15,10 @@ import logging
 import math
 import sys
 import time
+from typing import TYPE_CHECKING
 
-import yaml
-from bitstring import BitArray
+if TYPE_CHECKING:
+    from bitstring import BitArray
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -299,12 +300,13 @@ class Asic:
             )
 
     @staticmethod
-    def __int2nbit(value: int, nbits: int) -> BitArray:
+    def __int2nbit(value: int, nbits: int) -> "BitArray":
         """Convert int to 6bit bitarray
         :param value: Integer value
         :param nbits: Number of bits
         :returns: Bitarray of specified length
         """
+        from bitstring import BitArray
 
         try:
             return BitArray(uint=value, length=nbits)
@@ -322,6 +324,8 @@ class Asic:
         chipname = kwargs.get("chipname", "astropix")
         self.chipname = chipname
 
+        import yaml
+
         with open(f"{filename}", "r", encoding="utf-8") as stream:
             try:
                 dict_from_yml = yaml.safe_load(stream)
@@ -391,7 +395,7 @@ class Asic:
                     logger.error("Telescope chip_%d tdac config not found!", chip_number)
                     raise RuntimeError(f"Chain chip_{chip_number} TDAC config not found, check the config file syntax!")
 
-    def getChipsConfigs(self, msbfirst: bool = False, targetChip: int = -1) -> BitArray:
+    def getChipsConfigs(self, msbfirst: bool = False, targetChip: int = -1) -> "BitArray":
         """
         Generate asic bitvector from digital, bias and dacconfig.
         Use this method to get the List of Shift Register Config bits for one or multiple astropix in a daisychain
@@ -406,6 +410,7 @@ class Asic:
             msbfirst(bool,optional): Send vector MSB first
             targetChip(int,optional): Returns only the bits for the selected Astropix - if set to -1, returns for all the Astropix - no effect if the configuration is not multichip
         """
+        from bitstring import BitArray
 
         chipConfigs = []
 
@@ -434,7 +439,7 @@ class Asic:
 
         return chipConfigs
     
-    def getChipsTDACConfigs(self, row: int = 0, msbfirst: bool = False, targetChip: int = -1) -> BitArray:
+    def getChipsTDACConfigs(self, row: int = 0, msbfirst: bool = False, targetChip: int = -1) -> "BitArray":
         """
         Generate asic bitvector from digital, bias and dacconfig.
         Use this method to get the List of Shift Register Config bits for one or multiple astropix in a daisychain
@@ -449,6 +454,7 @@ class Asic:
             msbfirst(bool,optional): Send vector MSB first
             targetChip(int,optional): Returns only the bits for the selected Astropix - if set to -1, returns for all the Astropix - no effect if the configuration is not multichip
         """
+        from bitstring import BitArray
 
         chipTDACConfigs = []
 
@@ -468,7 +474,7 @@ class Asic:
 
         return chipTDACConfigs
         
-    def getConfigBits(self, msbfirst: bool = False, targetChip: int = -1, limit:int|None = None, tdac: bool = False ) -> BitArray:
+    def getConfigBits(self, msbfirst: bool = False, targetChip: int = -1, limit:int|None = None, tdac: bool = False ) -> "BitArray":
         """
         Generate asic bitvector from digital, bias and dacconfig.
         Use this method to get the List of Shift Register Config bits for one or multiple astropix in a daisychain
@@ -480,6 +486,7 @@ class Asic:
             msbfirst(bool,optional): Send vector MSB first
             targetChip(int,optional): Returns only the bits for the selected Astropix - if set to -1, returns for all the Astropix - no effect if the configuration is not multichip
         """
+        from bitstring import BitArray
         if tdac:
             configs = self.getChipsTDACConfigs(msbfirst=msbfirst,targetChip=targetChip)
         else:
@@ -517,7 +524,7 @@ class Asic:
         n_load: int = 10,
         broadcast: bool = False,
         targetChip: int = 0,
-        config: BitArray | None = None,
+        config: "BitArray | None" = None,
         tdac: bool = False
     ) -> bytearray:
         """
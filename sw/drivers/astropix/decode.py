@@ -1,9 +1,144 @@
-import pandas as pd
 import logging
 import binascii
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+## Largest frame length byte, larger bytes are idle bytes between frames
+MAX_FRAME_LENGTH = 16
+
+## Columns of the v2/v3 decoded hits
+HIT_COLUMNS = ['readout', 'layer', 'chipID', 'payload', 'location', 'isCol', 'timestamp', 'tot_msb', 'tot_lsb', 'tot_total', 'tot_us', 'fpga_ts']
+
+
+def find_frame_offsets(readout, state: int = 0, window_size: int = 1024 * 1024) -> "tuple[np.ndarray, int]":
+    """
+    Finds the frame start offsets like prepare_readout, with NumPy
+
+    Frames are found by a walk over the bytes: a length byte up to MAX_FRAME_LENGTH starts a frame, larger bytes between frames are skipped.
+    The walk only depends on the number of frame bytes left to skip (the state), so the buffer is cut in blocks walked in lockstep.
+    Each block walk starts with the state 0 FRAME_SYNC_BYTES before the block, which almost always reaches the actual state at the block start.
+    Blocks where it doesn't, according to the exit state of the previous block, are walked again one by one.
+    Streams without idle bytes where every byte is a length byte (no payload byte above MAX_FRAME_LENGTH) never synchronise, and are walked at Python speed.
+
+    :param readout: Readout bytes (bytes, bytearray, memoryview or NumPy uint8 array)
+    :param state: Bytes of a frame started before readout which are left to skip, to decode a stream in parts
+    :param window_size: Bytes processed at once, to bound the memory used
+
+    :returns: The frame offsets, and the state at the end of readout (the missing bytes of the last frame)
+    """
+    import numpy as np
+
+    data = np.frombuffer(readout, dtype=np.uint8) if not isinstance(readout, np.ndarray) else readout
+    offsets = []
+    for start in range(0, len(data), window_size):
+        window_offsets, state = _find_window_frame_offsets(data[start:start + window_size], state)
+        offsets.append(window_offsets + start)
+    if len(offsets) == 0:
+        return np.empty(0, dtype=np.int64), state
+    return np.concatenate(offsets), state
+
+
+def find_frame_boundary(readout, start: int, end: int) -> "tuple[int, bool]":
+    """
+    Finds the first frame boundary at or after end, walking the frames from start
+
+    :param readout: Readout bytes (bytes, bytearray, memoryview or NumPy uint8 array)
+    :param start: Offset of a frame boundary to walk from
+    :param end: Offset from which the boundary is searched
+
+    :returns: The offset of the boundary, which can be up to MAX_FRAME_LENGTH bytes after end, and False.
+              If the frame crossing end is not complete in readout, the offset of its start and True
+    """
+    offsets, state = find_frame_offsets(readout[start:end])
+    if end + state <= len(readout):
+        return end + state, False
+    return start + int(offsets[-1]), True
+
+
+## Lockstep walk block size, and bytes walked before each block to synchronise with the frames
+FRAME_BLOCK_BYTES = 128
+FRAME_SYNC_BYTES = 64
+
+## Windows up to this size are walked in Python, the lockstep walk has a fixed cost of about a millisecond
+FRAME_WALK_BYTES = 64 * 1024
+
+
+def _walk_frames(data: bytes, state: int) -> "tuple[list, int]":
+    """Walks the frames of data one frame or idle byte at a time, returns the frame offsets and the state at the end of data"""
+    offsets = []
+    position = state
+    while position < len(data):
+        length = data[position]
+        if length <= MAX_FRAME_LENGTH:
+            offsets.append(position)
+            position += length + 1
+        else:
+            position += 1
+    return offsets, position - len(data)
+
+
+def _find_window_frame_offsets(data: "np.ndarray", entry: int) -> "tuple[np.ndarray, int]":
+    import numpy as np
+
+    if len(data) <= FRAME_WALK_BYTES:
+        offsets, state = _walk_frames(data.tobytes(), entry)
+        return np.array(offsets, dtype=np.int64), state
+
+    ## Blocks as columns, so that each step of the walk reads a contiguous row, below the end of the previous block.
+    ## The first block is preceded by idle bytes, the last one is padded with idle bytes
+    full_blocks, remainder = divmod(len(data), FRAME_BLOCK_BYTES)
+    blocks = full_blocks + (remainder > 0)
+    columns = np.empty((FRAME_SYNC_BYTES + FRAME_BLOCK_BYTES, blocks), dtype=np.uint8)
+    columns[FRAME_SYNC_BYTES:, :full_blocks] = data[:full_blocks * FRAME_BLOCK_BYTES].reshape(full_blocks, FRAME_BLOCK_BYTES).T
+    if remainder > 0:
+        columns[FRAME_SYNC_BYTES:, -1] = 0xFF
+        columns[FRAME_SYNC_BYTES:FRAME_SYNC_BYTES + remainder, -1] = data[full_blocks * FRAME_BLOCK_BYTES:]
+    columns[:FRAME_SYNC_BYTES, 0] = 0xFF
+    columns[:FRAME_SYNC_BYTES, 1:] = columns[FRAME_BLOCK_BYTES:, :-1]
+    is_length = columns <= MAX_FRAME_LENGTH
+    ## Frame lengths including the length byte, idle bytes are frames of one byte
+    frame_lengths = columns * is_length
+    frame_lengths += 1
+
+    ## The state is set to the frame length - 1 on the bytes reached with the state 0, and decremented on the others
+    idle = np.empty((FRAME_SYNC_BYTES + FRAME_BLOCK_BYTES, blocks), dtype=bool)
+    state = np.zeros(blocks, dtype=np.uint8)
+    reset = np.empty(blocks, dtype=np.uint8)
+    for j in range(FRAME_SYNC_BYTES + FRAME_BLOCK_BYTES):
+        if j == FRAME_SYNC_BYTES:
+            entries = state.copy()
+        np.equal(state, 0, out=idle[j])
+        np.multiply(idle[j].view(np.uint8), frame_lengths[j], out=reset)
+        np.maximum(state, reset, out=state)
+        state -= 1
+    exits = state
+    heads = idle[FRAME_SYNC_BYTES:]
+    heads &= is_length[FRAME_SYNC_BYTES:]
+
+    ## Walk again the blocks whose entry state is not the exit state of the previous block, in order since their exit state can change.
+    ## Blocks left to walk are stacked with the next one at the end
+    expected = np.concatenate(([entry], exits[:-1]))
+    walk = list(np.flatnonzero(entries != expected)[::-1])
+    while len(walk) > 0:
+        block = walk.pop()
+        block_offsets, state = _walk_frames(columns[FRAME_SYNC_BYTES:, block].tobytes(), entry if block == 0 else int(exits[block - 1]))
+        heads[:, block] = False
+        heads[block_offsets, block] = True
+        exits[block] = state
+        if block + 1 < blocks and entries[block + 1] != state and (len(walk) == 0 or walk[-1] != block + 1):
+            walk.append(block + 1)
+
+    offsets = np.flatnonzero(heads.T.reshape(-1)[:len(data)])
+    if len(offsets) == 0:
+        return offsets, max(0, entry - len(data))
+    last = offsets[-1]
+    return offsets, max(0, last + int(data[last]) + 1 - len(data))
+
 
 class Decode:
 
@@ -27,7 +162,7 @@ class Decode:
         packet_len = 0
         while b < len(readout):
             packet_len = int(readout[b])
-            if packet_len > 16:
+            if packet_len > MAX_FRAME_LENGTH:
                 logger.debug("Probably didn't find a hit here - go to next byte")
                 b += 1
             else:  # got a hit
@@ -36,7 +171,7 @@ class Decode:
                 b += packet_len+1
         return list_hits, packet_len
 
-    def decode_readout(self, logger, readout: bytearray, i: int, sample_clock_period_ns: int = 10, printer: bool = True) -> pd.DataFrame:
+    def decode_readout(self, logger, readout: bytearray, i: int, sample_clock_period_ns: int = 10, printer: bool = True) -> "pd.DataFrame":
 
         list_hits = []
         hit_list = []
@@ -105,9 +240,72 @@ class Decode:
             hit_list.append(hits)
 
         # Much simpler to convert to df in the return statement vs df.concat
+        import pandas as pd
         return pd.DataFrame(hit_list)
 
-    def decode_readout_v4(self, logger, readout: bytearray, i: int, sample_clock_period_ns: int = 25, printer: bool = True, use_negedge_ts: bool = True) -> pd.DataFrame:
+    def decode_readout_numpy(self, readout, i: int, sample_clock_period_ns: int = 10, dataframe: bool = True):
+        """
+        Vectorized decode_readout: frame offsets are found once, then all the hits fields are extracted from the whole buffer with NumPy.
+        Hits are the same as decode_readout, including the -1 filled hits which were cut off at the end of the readout.
+
+        :param readout: Readout bytes (bytes, bytearray, memoryview or NumPy uint8 array)
+        :param i: Readout number stored in the readout column
+        :param dataframe: Return a DataFrame like decode_readout, else a dictionary of NumPy arrays per column
+
+        :returns: Dataframe or columns dictionary with decoded hits
+        """
+        import numpy as np
+
+        data = np.frombuffer(readout, dtype=np.uint8) if not isinstance(readout, np.ndarray) else readout
+        offsets, _ = find_frame_offsets(data)
+
+        ## The first 11 bytes of each hit, the bytes after the end of the readout are zeros
+        padded = np.zeros(len(data) + 11, dtype=np.uint8)
+        padded[:len(data)] = data
+        hits = np.lib.stride_tricks.sliding_window_view(padded, 11)[offsets]
+
+        ## Bytes of each hit, a hit cut off at the end of the readout is shorter than its length byte
+        hit_length = hits[:, 0] + 1
+        if len(offsets) > 0:
+            hit_length[-1] = min(hit_length[-1], len(data) - offsets[-1])
+        valid = hit_length >= 7
+
+        ## Fields are computed on the bytes, then widened to the int64 columns of decode_readout
+        b2, b3 = hits[:, 2], hits[:, 3]
+        columns = {
+            'readout': np.full(len(offsets), i, dtype=np.int64),
+            'layer': hits[:, 1].astype(np.int64),
+            'chipID': (b2 >> 3).astype(np.int64),
+            'payload': (b2 & 0b111).astype(np.int64),
+            'location': (b3 & 0b111111).astype(np.int64),
+            'isCol': (b3 >> 7).astype(np.int64),
+            'timestamp': hits[:, 4].astype(np.int64),
+            'tot_msb': (hits[:, 5] & 0b1111).astype(np.int64),
+            'tot_lsb': hits[:, 6].astype(np.int64),
+        }
+        columns['tot_total'] = (columns['tot_msb'] << 8) | columns['tot_lsb']
+        columns['tot_us'] = (columns['tot_total'] * sample_clock_period_ns) / 1000.0
+
+        ## Big endian FPGA timestamp from the bytes 7 to 10, the bytes after the end of a shorter hit are shifted out
+        fpga_ts = np.ascontiguousarray(hits[:, 7:11]).view('>u4')[:, 0].astype(np.int64)
+        short = np.flatnonzero(hit_length < 11)
+        fpga_ts[short] >>= 8 * np.minimum(11 - hit_length[short].astype(np.int64), 4)
+        columns['fpga_ts'] = fpga_ts
+
+        if not valid.all():
+            for name, values in columns.items():
+                if name != 'readout':
+                    values[~valid] = -1
+        ## Like decode_readout, where the -1 column of a cut off hit is true
+        columns['isCol'] = columns['isCol'] != 0
+
+        if not dataframe:
+            return columns
+        import pandas as pd
+        ## The columns are not copied into a single block
+        return pd.DataFrame(columns, copy=False)
+
+    def decode_readout_v4(self, logger, readout: bytearray, i: int, sample_clock_period_ns: int = 25, printer: bool = True, use_negedge_ts: bool = True) -> "pd.DataFrame":
         """
         Decode 8byte Frames from AstroPix 4
 
@@ -207,4 +405,5 @@ class Decode:
             hit_list.append(hits)
 
         # Much simpler to convert to df in the return statement vs df.concat
+        import pandas as pd
         return pd.DataFrame(hit_list)
@@ -11,22 +11,22 @@ class Astropix3LBModel():
 
     async def enableLoopback(self,flush=True):
         """Enable Loopback by setting bit in layer config register"""
-        regval =  await getattr(self.driver.rfg, f"read_layer_{self.layer}_cfg_ctrl")()
+        regval =  await self.driver.rfg.layer[self.layer].cfg_ctrl.read()
 
 
         regval |= (1<<5)
 
-        await getattr(self.driver.rfg, f"write_layer_{self.layer}_cfg_ctrl")(regval,flush)
+        await self.driver.rfg.layer[self.layer].cfg_ctrl.write(regval,flush)
 
     async def disableLoopback(self,flush=True):
         """Disable Loopback by clearing bit in layer config register"""
-        regval =  await getattr(self.driver.rfg, f"read_layer_{self.layer}_cfg_ctrl")()
+        regval =  await self.driver.rfg.layer[self.layer].cfg_ctrl.read()
         regval &= ~(1<<5)
-        await getattr(self.driver.rfg, f"write_layer_{self.layer}_cfg_ctrl")(regval,flush)
+        await self.driver.rfg.layer[self.layer].cfg_ctrl.write(regval,flush)
 
 
     async def writeMISOBytes(self,b:bytes,flush : bool =True):
-        await getattr(self.driver.rfg, f"write_layer_{self.layer}_loopback_miso_bytes")(b,flush)
+        await self.driver.rfg.layer[self.layer].loopback_miso.writeBytes(b,flush)
 
     async def readMISOBytesSize(self):
-        return await getattr(self.driver.rfg, f"read_layer_{self.layer}_loopback_miso_write_size")()
+        return await self.driver.rfg.layer[self.layer].loopback_miso_write_size.read()
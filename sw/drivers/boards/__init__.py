@@ -9,6 +9,10 @@ For Example:
 
 - getGeccoUARTDriver() returns a Driver configured for the Gecco Target connected via UART
 - getGeccoNODriver() returns a Board Driver without I/O, or a dummy IO layer - useful to test scripts without a Hardware connected
+- getCMODEmulatorDriver() returns a Driver connected to an in-process firmware emulator generating hits - useful to benchmark scripts without a Hardware connected
+- getCMODSocketDriver() returns a Driver using the board IO shared by an RFG daemon (scripts/rfg_daemon.py) - useful to run the UI, DAQ and HK scripts together
+
+To drive multiple boards from one process, create one driver per board with these factories and group them in a drivers.boards.multiboard.MultiBoardDriver
 
 """
 import sys
@@ -54,16 +58,30 @@ def getCMODDriver():
 def getGeccoNODriver():
     return getGeccoDriver()
 
-def getGeccoUARTDriver(portPath : str | None = None, baud : int | None = None):
-    return getGeccoDriver().selectUARTIO(portPath,baud)
+def getGeccoUARTDriver(portPath : str | None = None, baud : int | None = None, nonBlocking : bool = False):
+    return getGeccoDriver().selectUARTIO(portPath,baud,nonBlocking)
+
+def getGeccoFTDIDriver(streaming : bool = False):
+    return getGeccoDriver().selectFTDIFifoIO(streaming)
+
+
+def getCMODUartDriver(portPath : str | None = None, baud : int | None = None, nonBlocking : bool = False):
+    return getCMODDriver().selectUARTIO(portPath,baud,nonBlocking)
+
+def getCMODSPIDriver(spiPath:str,gpioPath:str,csLine:int,fullDuplex:bool = False):
+    return getCMODDriver().selectSPIIO(spiPath,gpioPath,csLine,fullDuplex)
 
-def getGeccoFTDIDriver():
-    return getGeccoDriver().selectFTDIFifoIO()
 
+def getGeccoEmulatorDriver(**kwargs):
+    kwargs.setdefault("firmwareID", 0xAB03)
+    return getGeccoDriver().selectEmulatorIO(**kwargs)
 
-def getCMODUartDriver(portPath : str | None = None, baud : int | None = None):
-    return getCMODDriver().selectUARTIO(portPath,baud)
+def getCMODEmulatorDriver(**kwargs):
+    kwargs.setdefault("firmwareID", 0xAC03)
+    return getCMODDriver().selectEmulatorIO(**kwargs)
 
-def getCMODSPIDriver(spiPath:str,gpioPath:str,csLine:int):
-    return getCMODDriver().selectSPIIO(spiPath,gpioPath,csLine)
+def getGeccoSocketDriver(address : str | None = None):
+    return getGeccoDriver().selectSocketIO(address)
 
+def getCMODSocketDriver(address : str | None = None):
+    return getCMODDriver().selectSocketIO(address)
@@ -2,13 +2,15 @@ import asyncio
 import logging
 import math
 import time
+from typing import TYPE_CHECKING
 
 import rfg.core
 import rfg.io
-from bitstring import BitArray
-from bitstring import Array
 from deprecated import deprecated
 
+if TYPE_CHECKING:
+    from bitstring import BitArray
+
  
 
 
@@ -35,6 +37,13 @@ class BoardDriver:
         ## By default the FW is reset with 32 bits
         self.fpgaTimeStampBytesCount = 4
 
+        ## Speculative readout: number of bytes read with the buffer size, adapted to the recent buffer occupancy
+        self.readoutChunkSize = self.READOUT_MIN_CHUNK_SIZE
+        self.readoutOccupancy = 0.0
+        self.readoutOccupancyVariance = 0.0
+        ## Bytes of the last frame missing at the end of the last speculative read
+        self.readoutFrameRemaining = 0
+
         # Synchronisation Utils
         ########
 
@@ -42,8 +51,12 @@ class BoardDriver:
         ## Useful to start or stop tasks dependent on open/close state of the driver
         self.openedEvent = asyncio.Event()
     
-    def selectUARTIO(self, portPath: str | None = None, baud : int | None = None):
-        """This method is common to all targets now, because all targets have a USB-UART Converter available"""
+    def selectUARTIO(self, portPath: str | None = None, baud : int | None = None, nonBlocking : bool = False):
+        """This method is common to all targets now, because all targets have a USB-UART Converter available
+
+        Args:
+            nonBlocking: Use the asyncio native UART transport (Linux/POSIX), faster for many small transactions
+        """
         if portPath is None:
             from drivers.astep.serial import getSerialPort
 
@@ -52,9 +65,45 @@ class BoardDriver:
                 raise RuntimeError("No Serial Port could be listed")
             else:
                 portPath = port.device
-        self.rfg.withUARTIO(portPath,baud)
+        self.rfg.withUARTIO(portPath,baud,nonBlocking)
         return self    
         
+    def selectTraceRecording(self, path: str):
+        """Record all bytes exchanged with the currently selected IO to a trace file, which can be replayed with selectTraceReplayIO"""
+        self.rfg.withTraceRecording(path)
+        return self
+
+    def selectTraceReplayIO(self, path: str, strict: bool = False, realtime: bool = False):
+        """Replay a recorded trace file instead of using hardware IO
+
+        Args:
+            strict: Check that written bytes match the trace
+            realtime: Delay the responses as during the recording
+        """
+        self.rfg.withTraceReplayIO(path, strict=strict, realtime=realtime)
+        return self
+
+    def selectSocketIO(self, address: str | None = None):
+        """Use the hardware IO owned by an RFG daemon (scripts/rfg_daemon.py), so that multiple processes can use the board at the same time
+
+        Args:
+            address: Daemon unix socket path or host:port, the default daemon socket if None
+        """
+        self.rfg.withSocketIO(address)
+        return self
+
+    def selectEmulatorIO(self, **kwargs):
+        """Use the in-process firmware emulator instead of hardware IO, to run scripts and benchmarks without a board
+
+        Args:
+            kwargs: Arguments passed to drivers.astep.emulator.ASTEPEmulatorIO, for example hitRate or firmwareID
+        """
+        from drivers.astep.emulator import ASTEPEmulatorIO
+
+        kwargs.setdefault("coreFrequency", self.getFPGACoreFrequency())
+        self.rfg.withIODriver(ASTEPEmulatorIO(self.rfg, **kwargs))
+        return self
+
     async def utilWaitSeconds(self,wait:int):
         """This method can be override for example in simulation to wait using proper mechanism"""
         await asyncio.sleep(wait)
@@ -62,6 +111,7 @@ class BoardDriver:
     async def open(self):
         """Open the Register File I/O Connection to the underlying driver"""
         await self.rfg.io.open()
+        self.rfg.invalidate()
         self.openedEvent.set()
 
     async def close(self):
@@ -75,6 +125,64 @@ class BoardDriver:
     def isOpened(self) -> bool:
         return self.openedEvent.is_set()
 
+    ## Control registers written only by the host, they can be cached by the shadow cache
+    ## CLOCK_CTRL is not one of them, its current_clk bit is a firmware input
+    SHADOW_CACHE_REGISTERS = [
+        "HK_CTRL",
+        "SPI_LAYERS_CKDIVIDER",
+        "SPI_HK_CKDIVIDER",
+        "LAYER_0_CFG_CTRL",
+        "LAYER_1_CFG_CTRL",
+        "LAYER_2_CFG_CTRL",
+        "LAYERS_FPGA_TIMESTAMP_CTRL",
+        "LAYERS_CFG_NODATA_CONTINUE",
+        "LAYERS_SR_RB_CTRL",
+        "LAYERS_READOUT_CTRL",
+        "IO_CTRL",
+    ]
+
+    def enableShadowCache(self, enable: bool = True):
+        """Enable the RFG shadow cache for control registers, removing the read in read-modify-write register updates
+
+        The cache is invalidated when the driver is opened or the firmware switches clock.
+        If the firmware is reset by other means, call invalidateShadowCache or resyncShadowCache
+        """
+        if enable:
+            self.rfg.enableShadowCache(
+                [self.rfg.Registers[name] for name in self.SHADOW_CACHE_REGISTERS if name in self.rfg.Registers.__members__]
+            )
+        else:
+            self.rfg.disableShadowCache()
+
+    def enableCommandOptimizer(self, shiftRegisterRepeats: int | None = None):
+        """Enable the RFG command optimizer, removing redundant writes to the control registers before they are sent
+
+        Args:
+            shiftRegisterRepeats: If set, the repeats stretching the bit-banged shift register signals (ckdiv) are limited to this count.
+                                  Only use with slow IO like UART, where each written byte already lasts longer than the stretched signal needs
+
+        Returns the optimizer, its report() method returns the bytes saved
+        """
+        ## Shift register control signals are never considered as state, their repeats are kept unless limited explicitly
+        shiftRegisters = [name for name in ["LAYERS_SR_OUT", "LAYERS_SR_RB_CTRL", "GECCO_SR_CTRL"] if name in self.rfg.Registers.__members__]
+        repeatLimits = {}
+        if shiftRegisterRepeats is not None:
+            repeatLimits = {self.rfg.Registers[name]: shiftRegisterRepeats for name in shiftRegisters}
+        stateRegisters = [
+            self.rfg.Registers[name]
+            for name in self.SHADOW_CACHE_REGISTERS
+            if name in self.rfg.Registers.__members__ and name not in shiftRegisters
+        ]
+        return self.rfg.enableCommandOptimizer(stateRegisters, repeatLimits)
+
+    def invalidateShadowCache(self):
+        """Forget all cached register values, next reads will access the firmware"""
+        self.rfg.invalidate()
+
+    async def resyncShadowCache(self):
+        """Read back all cached register values from the firmware"""
+        await self.rfg.resync()
+
     def debug_full(self):
         rfg.core.debug()
 
@@ -148,6 +256,7 @@ class BoardDriver:
                 return False
             else: 
                 logger.warning("FW Switched to external clock - a reset was issued, you can now configure the system and run measurements")
+                self.rfg.invalidate()
                 return True 
         elif enable is True and currentClockIsExternal:
             logger.warning("Not Enabling External Clock, FW is already running on the external clock")
@@ -349,7 +458,7 @@ class BoardDriver:
         n_load: int = 10,
         broadcast: bool = False,
         targetChip: int = 0,
-        config: BitArray | None = None,
+        config: "BitArray | None" = None,
     ):
         # Get SPI Frame Configs
         spiBytes = self.getAsic(lane).getSPIConfigFrame(
@@ -461,6 +570,8 @@ class BoardDriver:
         
         
         ## Pack the read bits in bitstring array, reverse then return sliced removing the first x bits which are padding for byte
+        from bitstring import Array
+
         a = Array('uint8', bitsAsBytes)
         a.data.reverse() 
         
@@ -592,12 +703,12 @@ class BoardDriver:
             wait(bool,optional): Wait before driving reset 1 and 0 - Useful in simulation, asyncio.sleep doesn't work there
         """
         layersCfg = [
-            await getattr(self.rfg, f"read_layer_{layer}_cfg_ctrl")()
+            await self.rfg.layer[layer].cfg_ctrl.read()
             for layer in range(3)
         ]
         for layer in range(3):
             layersCfg[layer] |= 1 << 1
-            await getattr(self.rfg, f"write_layer_{layer}_cfg_ctrl")(
+            await self.rfg.layer[layer].cfg_ctrl.write(
                 layersCfg[layer], flush
             )
 
@@ -606,7 +717,7 @@ class BoardDriver:
 
         for layer in range(3):
             layersCfg[layer] &= ~(1 << 1)
-            await getattr(self.rfg, f"write_layer_{layer}_cfg_ctrl")(
+            await self.rfg.layer[layer].cfg_ctrl.write(
                 layersCfg[layer], flush
             )
 
@@ -660,7 +771,7 @@ class BoardDriver:
             flush (bool): Write the register right away
 
         """
-        regval = await getattr(self.rfg, f"read_layer_{layer}_cfg_ctrl")()
+        regval = await self.rfg.layer[layer].cfg_ctrl.read()
 
         if reset is True:
             regval |= 1 << 1
@@ -688,7 +799,7 @@ class BoardDriver:
         else:
             regval &= ~(1 << 4)
 
-        await getattr(self.rfg, f"write_layer_{layer}_cfg_ctrl")(regval, flush)
+        await self.rfg.layer[layer].cfg_ctrl.write(regval, flush)
 
     # async def holdLayer(self,layer:int,hold:bool = True,flush:bool = False):
     #     """Asserts/Deasserts the hold signal for the given layer - This method reads the ctrl register and modifies it
@@ -703,12 +814,12 @@ class BoardDriver:
 
     async def holdLayers(self, hold: bool, flush: bool = False):
         """ """
-        ctrl = await getattr(self.rfg, f"read_layer_0_cfg_ctrl")()
+        ctrl = await self.rfg.layer[0].cfg_ctrl.read()
         if hold:
             ctrl |= 1
         else:
             ctrl &= 0xFE
-        await getattr(self.rfg, f"write_layer_0_cfg_ctrl")(ctrl, flush=flush)
+        await self.rfg.layer[0].cfg_ctrl.write(ctrl, flush=flush)
 
     async def enableLayersReadout(
         self, layerlst: list, autoread: bool, flush: bool = False
@@ -818,7 +929,7 @@ class BoardDriver:
         """
 
         logger.info(
-            f"Writing {len(bytes)} bytes to SPI lane {lane}, current buffer size={await getattr(self.rfg, f'read_layer_{lane}_mosi_write_size')()}"
+            f"Writing {len(bytes)} bytes to SPI lane {lane}, current buffer size={await self.rfg.layer[lane].mosi_write_size.read()}"
         )
         # Buffer size is the number of bytes we can write at once in the SPI output buffer
         outputBufferSize = 256
@@ -836,7 +947,7 @@ class BoardDriver:
                 steps,
                 len(chunkBytes),
             )
-            await getattr(self.rfg, f"write_layer_{lane}_mosi_bytes")(chunkBytes, True)
+            await self.rfg.layer[lane].mosi.writeBytes(chunkBytes, True)
 
             # Wait for the current chunk to be written before sending the next one
             # If wait for Last Chunk is false and it is the last chunk, don't wait
@@ -847,13 +958,14 @@ class BoardDriver:
                 currentTime = time.time()
                 
                 # Wait until bufer written out to astropix
-                writeSize = await getattr(self.rfg, f"read_layer_{lane}_mosi_write_size")()
+                writeSizeRegister = self.rfg.layer[lane].mosi_write_size
+                writeSize = await writeSizeRegister.read()
                 while (
                     writeSize > 0
                     and (currentTime - startTime) <= timeout
                 ):
                     currentTime = time.time()
-                    writeSize = await getattr(self.rfg, f"read_layer_{lane}_mosi_write_size")()
+                    writeSize = await writeSizeRegister.read()
                     pass
 
                 # Test if timeout condition
@@ -864,25 +976,25 @@ class BoardDriver:
                     
 
     async def getLayerMOSIBytesCount(self, layer: int):
-        return await getattr(self.rfg, f"read_layer_{layer}_mosi_write_size")()
+        return await self.rfg.layer[layer].mosi_write_size.read()
 
     async def getLayerStatIDLECounter(self, layer: int):
-        return await getattr(self.rfg, f"read_layer_{layer}_stat_idle_counter")()
+        return await self.rfg.layer[layer].stat_idle_counter.read()
 
     async def getLayerStatFRAMECounter(self, layer: int):
-        return await getattr(self.rfg, f"read_layer_{layer}_stat_frame_counter")()
+        return await self.rfg.layer[layer].stat_frame_counter.read()
 
     async def getLayerStatus(self, layer: int):
-        return await getattr(self.rfg, f"read_layer_{layer}_status")()
+        return await self.rfg.layer[layer].status.read()
 
     async def getLayerControl(self, layer: int):
-        return await getattr(self.rfg, f"read_layer_{layer}_cfg_ctrl")()
+        return await self.rfg.layer[layer].cfg_ctrl.read()
 
     async def getLayerWrongLength(self, layer: int):
-        return await getattr(self.rfg, f"read_layer_{layer}_stat_wronglength_counter")()
+        return await self.rfg.layer[layer].stat_wronglength_counter.read()
 
     async def zeroLayerWrongLength(self, layer: int, flush: bool = True):
-        await getattr(self.rfg, f"write_layer_{layer}_stat_wronglength_counter")(
+        await self.rfg.layer[layer].stat_wronglength_counter.write(
             0, flush=flush
         )
 
@@ -892,15 +1004,15 @@ class BoardDriver:
             raise Exception(f"Layer {layer} is in reset, user requests it is not")
 
     async def resetLayerStatCounters(self, layer: int, flush: bool = True):
-        await getattr(self.rfg, f"write_layer_{layer}_stat_frame_counter")(0, False)
-        await getattr(self.rfg, f"write_layer_{layer}_stat_idle_counter")(0, False)
-        await getattr(self.rfg, f"write_layer_{layer}_stat_wronglength_counter")(
+        await self.rfg.layer[layer].stat_frame_counter.write(0, False)
+        await self.rfg.layer[layer].stat_idle_counter.write(0, False)
+        await self.rfg.layer[layer].stat_wronglength_counter.write(
             0, flush=flush
         )
 
     async def getLayerMISOBytesCount(self, layer: int):
         """Returns the number of bytes in the Slave Out Bytes Buffer"""
-        return await getattr(self.rfg, f"read_layer_{layer}_mosi_write_size")()
+        return await self.rfg.layer[layer].mosi_write_size.read()
 
     ## Readout
     ################
@@ -916,6 +1028,93 @@ class BoardDriver:
         ## Using the _raw version returns an array of bytes, while the normal method converts to int based on the number of bytes
         return await self.rfg.read_layers_readout_raw(count=count) if count > 0 else []
 
+    ## Bounds of the adaptive speculative readout chunk size
+    READOUT_MIN_CHUNK_SIZE = 16
+    READOUT_MAX_CHUNK_SIZE = 4096
+
+    async def readoutReadSpeculative(self, count: int | None = None) -> tuple[int, bytes]:
+        """Reads the buffer size and count bytes of the readout buffer in the same flush, which needs one round trip instead of two
+
+        The buffer returns 0xFF filler bytes when it is empty, but frames can arrive between the size and data reads, and frame bytes can be 0xFF.
+        The filler is cut by walking the frames from the frame state left by the previous speculative read:
+        the bytes within the returned size and the bytes of frames are kept, only 0xFF bytes found where a frame length byte is expected
+        past the size are dropped, like idle bytes. The readout stream should then only be read with this method.
+
+        Args:
+            count: Number of bytes read speculatively. If None, the chunk size follows the recent buffer occupancy,
+                   and data exceeding the chunk is read right away with a second read.
+
+        Returns:
+            The buffer size before the read, and the valid bytes
+        """
+        chunkSize = self.readoutChunkSize if count is None else count
+        commands = [rfg.core.RFGIOCommand.read(self.rfg.Registers["LAYERS_READOUT_READ_SIZE"], 4, increment=True)]
+        commands += rfg.core.RFGIOCommand.splitRead(self.rfg.Registers["LAYERS_READOUT"], chunkSize)
+        response = await self.rfg.readCommands(commands)
+
+        size = int.from_bytes(response[:4], "little")
+        data = bytes(response[4:])
+        if count is None and size > chunkSize:
+            data += bytes(await self.readoutReadBytes(size - chunkSize))
+        data = self.readoutCutFiller(data, size)
+
+        if count is None:
+            self.readoutUpdateChunkSize(size)
+        return size, data
+
+    def readoutCutFiller(self, data: bytes, size: int) -> bytes:
+        """Returns data without the filler bytes read past size, and keeps the frame state at the end of data for the next read"""
+        from drivers.astropix.decode import MAX_FRAME_LENGTH, find_frame_offsets
+
+        entry = self.readoutFrameRemaining
+        offsets, self.readoutFrameRemaining = find_frame_offsets(data, entry)
+        if size >= len(data):
+            return data
+
+        ## Past size, frames are kept and the bytes between them are idle or filler bytes, the 0xFF ones are dropped
+        kept = [data[:size]]
+        position = max(size, entry)
+        kept.append(data[size:position])
+        for offset in offsets[offsets.searchsorted(position - MAX_FRAME_LENGTH - 1) :]:
+            offset = int(offset)
+            end = offset + data[offset] + 1
+            if end <= position:
+                continue
+            start = max(offset, position)
+            kept.append(data[position:start].replace(b"\xFF", b""))
+            kept.append(data[start:end])
+            position = end
+        kept.append(data[position:].replace(b"\xFF", b""))
+        return b"".join(kept)
+
+    def readoutUpdateChunkSize(self, size: int):
+        """Adapts the speculative chunk size to the buffer occupancy: its moving average plus one moving standard deviation.
+        Reading a few filler bytes costs less than the extra round trip needed when the chunk is too small, but each filler byte costs link time.
+        The chunk never drops below the minimal chunk while the buffer is idle, so that the first frames of a burst are read with the size"""
+        deviation = size - self.readoutOccupancy
+        self.readoutOccupancy += deviation * 0.25
+        self.readoutOccupancyVariance += (deviation * deviation - self.readoutOccupancyVariance) * 0.25
+        target = math.ceil(self.readoutOccupancy + math.sqrt(self.readoutOccupancyVariance))
+        self.readoutChunkSize = min(max(target, self.READOUT_MIN_CHUNK_SIZE), self.READOUT_MAX_CHUNK_SIZE)
+
+    async def readoutReadChunks(self, count: int | None = None, chunkSize: int = rfg.core.MAX_TRANSFER_LENGTH):
+        """Reads count bytes from the readout buffer as pipelined reads, yields the data in memoryview chunks of at most chunkSize bytes
+
+        Args:
+            count: Number of bytes to read, the current buffer size is read first if None
+
+        Example:
+
+            async for chunk in boardDriver.readoutReadChunks():
+                dataFile.write(chunk)
+        """
+        if count is None:
+            count = await self.readoutGetBufferSize()
+        if count <= 0:
+            return
+        async for chunk in self.rfg.syncReadChunks(self.rfg.Registers["LAYERS_READOUT"], count, chunkSize=chunkSize):
+            yield chunk
+
     ## FPGA Timestamp config
     ############
     #
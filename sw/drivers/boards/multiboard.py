@@ -0,0 +1,100 @@
+"""
+Multi Board Module
+
+Drives several boards (CMOD, Gecco...) from one process and one asyncio event loop.
+Each board has its own BoardDriver and Register File instance, operations on all boards are run concurrently.
+
+For Example:
+
+    boards = MultiBoardDriver({
+        "board0": drivers.boards.getCMODUartDriver("/dev/ttyUSB0"),
+        "board1": drivers.boards.getCMODUartDriver("/dev/ttyUSB1"),
+    })
+    await boards.open()
+    await boards.forEach(lambda board: board.setupASIC(version=3, configFile=...))
+    data = await boards.readoutReadAll()
+
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from drivers.boards.board_driver import BoardDriver
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
+
+
+class MultiBoardDriver:
+
+    def __init__(self, boards: dict[str, BoardDriver] | list[BoardDriver]):
+        """
+        Args:
+            boards: Board drivers indexed by name, or a list of board drivers named by their index
+        """
+        if isinstance(boards, dict):
+            self.boards = dict(boards)
+        else:
+            self.boards = {str(i): board for i, board in enumerate(boards)}
+
+        for name, board in self.boards.items():
+            assert sum(1 for other in self.boards.values() if other.rfg is board.rfg) == 1, f"Board {name} shares its Register File instance with another board"
+
+    def __len__(self):
+        return len(self.boards)
+
+    def __getitem__(self, name: str) -> BoardDriver:
+        return self.boards[name]
+
+    async def forEach(self, fn: Callable[[BoardDriver], Awaitable]) -> dict:
+        """Runs fn(board) concurrently for all boards, returns the results indexed by board name
+
+        If one board fails, the other boards operations complete before the first error is raised
+        """
+        names = list(self.boards.keys())
+        results = await asyncio.gather(*[fn(self.boards[name]) for name in names], return_exceptions=True)
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error("Board %s failed: %s", name, result)
+                raise result
+        return dict(zip(names, results))
+
+    async def open(self):
+        """Open the I/O connection to all boards"""
+        await self.forEach(lambda board: board.open())
+
+    async def close(self):
+        """Close the I/O connection to all boards"""
+        await self.forEach(lambda board: board.close())
+
+    async def readoutReadAll(self) -> dict[str, bytes]:
+        """Reads the content of the readout buffer of all boards"""
+
+        async def readBoard(board: BoardDriver):
+            count = await board.readoutGetBufferSize()
+            return await board.readoutReadBytes(count)
+
+        return await self.forEach(readBoard)
+
+    async def runReadout(
+        self,
+        onData: Callable[[str, bytes], None],
+        stop: asyncio.Event,
+        interval: float = 0.0,
+    ):
+        """Reads all boards concurrently until stop is set, each board is polled by its own task
+
+        Args:
+            onData: called with the board name and the read bytes after each non empty read
+            stop: Event to stop the readout
+            interval: Wait time in seconds between two polls of a board
+        """
+
+        async def readoutBoard(name: str, board: BoardDriver):
+            while not stop.is_set():
+                count = await board.readoutGetBufferSize()
+                if count > 0:
+                    onData(name, await board.readoutReadBytes(count))
+                await asyncio.sleep(interval)
+
+        await asyncio.gather(*[readoutBoard(name, board) for name, board in self.boards.items()])
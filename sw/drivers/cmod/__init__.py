@@ -19,9 +19,13 @@ class CMODBoard(BoardDriver):
 
     
 
-    def selectSPIIO(self,path:str,gpioPath:str,csLine:int):
+    def selectSPIIO(self,path:str,gpioPath:str,csLine:int,fullDuplex:bool = False):
+        """
+        Args:
+            fullDuplex: Send commands and clock their responses in one SPI transfer
+        """
         assert os.path.exists(path) , f"SPIDev {path} doesn't exist"
-        self.rfg.withSPIDEVIO(path,gpioPath,csLine)
+        self.rfg.withSPIDEVIO(path,gpioPath,csLine,fullDuplex)
         return self
 
 
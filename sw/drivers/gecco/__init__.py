@@ -31,10 +31,15 @@ class GeccoCarrierBoard(BoardDriver):
             self.cards[slot] = vb
             return vb
 
-    def selectFTDIFifoIO(self):
+    def selectFTDIFifoIO(self, streaming: bool = False):
+        """Use the FTDI FIFO link
+
+        Args:
+            streaming: Use a reader thread draining the USB pipe continuously to a ring buffer, for high readout rates
+        """
         import rfg.io.ftdi
 
-        self.rfg.withFTDIIO("Device A", rfg.io.ftdi.FLAG_LIST_DESCRIPTOR)
+        self.rfg.withFTDIIO("Device A", rfg.io.ftdi.FLAG_LIST_DESCRIPTOR, streaming=streaming)
         return self
 
     def geccoGetVoltageBoard(self, volt_slot: int = 4):
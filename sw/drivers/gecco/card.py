@@ -1,5 +1,8 @@
 
-from bitstring import BitArray
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bitstring import BitArray
 
 SIN_GECCO       = 0x02
 LD_GECCO        = 0x04
@@ -13,8 +16,9 @@ class GeccoCard():
         self.slot = slot
 
 
-    async def sendBitsToCard(self,bits : BitArray,ckdiv :int = 16):
+    async def sendBitsToCard(self,bits : "BitArray",ckdiv :int = 16):
         """Sends the provided bits to the CARD SR. This method sends the sequence with proper load"""
+        from bitstring import BitArray
 
         ## Append the Load bit to the array
         ## Gecco has 8 card slots and the last 8 bits for all Cards are the loads for the cards
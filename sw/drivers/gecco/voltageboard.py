@@ -11,8 +11,11 @@ Slightly cleaned Model of a Card
 
 """
 from .card import GeccoCard
-from bitstring import BitArray
 import copy 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bitstring import BitArray
 
 
 
@@ -37,7 +40,7 @@ class VoltageBoard(GeccoCard):
         setattr(self,name,f)
 
     
-    def __vb_vector(self, pos: int, dacs: list[float]) -> BitArray:
+    def __vb_vector(self, pos: int, dacs: list[float]) -> "BitArray":
         """Generate VB bitvector from position and dacvalues
 
         :param pos: Card slot
@@ -45,6 +48,7 @@ class VoltageBoard(GeccoCard):
 
         :returns: Voltageboard config vector
         """
+        from bitstring import BitArray
 
         vdacbits = BitArray()
 
@@ -63,7 +67,7 @@ class VoltageBoard(GeccoCard):
 
         return vdacbits
 
-    def generateDacBits(self) -> BitArray:
+    def generateDacBits(self) -> "BitArray":
         """Generate VB bitvector from position and dacvalues
 
         :param pos: Card slot
@@ -71,6 +75,7 @@ class VoltageBoard(GeccoCard):
 
         :returns: Voltageboard config vector
         """
+        from bitstring import BitArray
 
         vdacbits = BitArray()
 
@@ -0,0 +1,17 @@
+"""
+Readout Module
+
+Reusable readout pipelines shared by the run scripts:
+
+- engine.ReadoutEngine drains the firmware readout buffer in an acquisition task and feeds concurrent consumers (file writer, decoder, monitor) through bounded queues
+- runfile.RunFileWriter / RunFileReader store the read chunks with their host time and layers in an indexed binary run file
+- decoder.StreamingDecoder decodes the read chunks incrementally in frame aligned windows and appends the hits to a CSV file
+- mapped.MappedRunFile memory maps run files and raw .bin files, and iterates over frame aligned zero-copy windows for offline decoding
+- scheduler.AdaptivePollScheduler adapts the engine polling interval and read size to the buffer occupancy and fill rate
+
+"""
+from drivers.readout.decoder import StreamingDecoder
+from drivers.readout.engine import ReadoutEngine, ReadoutStats
+from drivers.readout.mapped import MappedRunFile
+from drivers.readout.runfile import RunChunk, RunFileReader, RunFileWriter
+from drivers.readout.scheduler import AdaptivePollScheduler
@@ -0,0 +1,100 @@
+"""
+Incremental decoding of the readout stream
+
+StreamingDecoder is a ReadoutEngine consumer: it accumulates the read chunks, and decodes them each time windowSize bytes are available.
+Windows end on a frame boundary, found in the executor with the decoding, the incomplete last frame is kept for the next window. Decoded hits are appended to a CSV file,
+so that the memory used doesn't depend on the run length.
+
+For Example:
+
+    decoder = StreamingDecoder(lambda window, i: arun.decode_readout(window, i, printer=False, vectorized=True), "run.csv")
+    engine.addConsumer("decoder", decoder)
+    await engine.run(duration)
+    await decoder.flush()
+"""
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Callable
+
+from drivers.astropix.decode import find_frame_boundary
+from drivers.readout.mapped import DEFAULT_WINDOW_SIZE
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
+
+
+class StreamingDecoder:
+    """Decodes the readout stream in frame aligned windows, in the executor to keep the event loop free
+
+    Args:
+        decode: Function decoding a window of frames, called with the window bytes and the window number, returns a DataFrame of hits
+        csvPath: CSV file the hits are appended to, None to only count them
+        windowSize: Number of bytes to accumulate before decoding
+        columns: Names given to the DataFrame columns before writing them
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[bytes, int], "pd.DataFrame"],
+        csvPath: str | None = None,
+        windowSize: int = DEFAULT_WINDOW_SIZE,
+        columns: list[str] | None = None,
+    ):
+        self.decode = decode
+        self.csvPath = csvPath
+        self.windowSize = windowSize
+        self.columns = columns
+
+        self.pending = bytearray()
+        self.windows = 0
+        self.hits = 0
+        self.csvFile = None
+
+    async def __call__(self, chunk: bytes):
+        self.pending += chunk
+        if len(self.pending) >= self.windowSize:
+            await self.decodePending()
+
+    async def decodePending(self, final: bool = False):
+        if len(self.pending) == 0:
+            return
+        pending, self.pending = self.pending, bytearray()
+        end = await asyncio.get_running_loop().run_in_executor(None, self.decodeWindow, pending, self.windows, final)
+        ## The incomplete last frame is kept for the next window
+        self.pending = pending[end:]
+        if end > 0:
+            self.windows += 1
+
+    def decodeWindow(self, pending: bytearray, i: int, final: bool) -> int:
+        """Decodes the pending bytes up to the last frame boundary, returns the window end"""
+        end, _ = find_frame_boundary(pending, 0, len(pending))
+        ## The last window takes the incomplete frame too, the decoder reports it as cut off
+        if final:
+            end = len(pending)
+        if end == 0:
+            return 0
+        df = self.decode(bytes(pending[:end]), i)
+        ## Hits are numbered over the whole run
+        df.index = range(self.hits, self.hits + len(df))
+        self.hits += len(df)
+        if self.csvPath is None or len(df) == 0:
+            return end
+        if self.columns is not None:
+            df.columns = self.columns
+        if self.csvFile is None:
+            self.csvFile = open(self.csvPath, "w", newline="")
+            df.to_csv(self.csvFile)
+        else:
+            df.to_csv(self.csvFile, header=False)
+        return end
+
+    async def flush(self):
+        """Decodes the remaining bytes and closes the CSV file, call it when the readout is stopped"""
+        await self.decodePending(final=True)
+        if self.csvFile is not None:
+            self.csvFile.close()
+            self.csvFile = None
+        logger.info("Decoded %d hits in %d windows", self.hits, self.windows)
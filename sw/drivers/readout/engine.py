@@ -0,0 +1,334 @@
+"""
+Continuous readout engine
+
+An acquisition task polls the firmware readout buffer size (LAYERS_READOUT_READ_SIZE) and drains LAYERS_READOUT.
+Each read chunk is passed to the consumers (file writer, decoder, monitor...) through one bounded queue per consumer,
+consumers run concurrently with the acquisition. The host monotonic time of the read is queued with the chunk.
+
+When the queue of a consumer is full, the acquisition waits for it (backpressure, the data stays in the firmware buffer),
+or the chunk is dropped for this consumer if it was added with dropWhenFull (for monitors which don't need all the data).
+
+For Example:
+
+    engine = ReadoutEngine(boardDriver)
+    engine.addFileWriter(open("run.bin", "wb"))
+    engine.addConsumer("monitor", lambda chunk: print(len(chunk)), dropWhenFull=True)
+    async with engine:
+        await asyncio.sleep(60)
+    print(engine.stats.report())
+"""
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from typing import Awaitable, BinaryIO, Callable
+
+from drivers.readout.scheduler import AdaptivePollScheduler
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
+
+
+def debug():
+    logger.setLevel(logging.DEBUG)
+
+
+class ReadoutStats:
+    """Statistics of a readout run"""
+
+    def __init__(self):
+        self.startTime: float | None = None
+        self.stopTime: float | None = None
+
+        ## Polls of the buffer size, and those which found it empty
+        self.polls = 0
+        self.emptyPolls = 0
+
+        ## Reads of the buffer and read bytes
+        self.reads = 0
+        self.bytes = 0
+
+        ## Firmware buffer occupancy reported by the polls
+        self.bufferSizeSum = 0
+        self.maxBufferSize = 0
+
+        ## Polls started more than lateThreshold after the previous one and its planned wait, because of slow reads or backpressure
+        self.lateReads = 0
+        self.maxPollInterval = 0.0
+
+        ## Per consumer: maximal queue occupancy in chunks, dropped chunks and bytes
+        self.maxQueueOccupancy: dict[str, int] = {}
+        self.droppedChunks: dict[str, int] = {}
+        self.droppedBytes: dict[str, int] = {}
+
+    def duration(self) -> float:
+        if self.startTime is None:
+            return 0.0
+        return (self.stopTime if self.stopTime is not None else time.monotonic()) - self.startTime
+
+    def meanBufferSize(self) -> float:
+        return self.bufferSizeSum / self.polls if self.polls > 0 else 0.0
+
+    def rate(self) -> float:
+        """Returns the read data rate in bytes per second"""
+        duration = self.duration()
+        return self.bytes / duration if duration > 0 else 0.0
+
+    def report(self) -> str:
+        lines = [
+            f"Readout: {self.bytes} bytes in {self.reads} reads over {self.duration():.2f} s ({self.rate() / 1000:.1f} kB/s)",
+            f"Polls: {self.polls}, empty {self.emptyPolls}, late {self.lateReads}, max interval {self.maxPollInterval * 1000:.2f} ms",
+            f"Firmware buffer: mean {self.meanBufferSize():.1f} bytes, max {self.maxBufferSize} bytes",
+        ]
+        for name, occupancy in self.maxQueueOccupancy.items():
+            lines.append(
+                f"Consumer {name}: max queue {occupancy} chunks, dropped {self.droppedChunks.get(name, 0)} chunks ({self.droppedBytes.get(name, 0)} bytes)"
+            )
+        return "\n".join(lines)
+
+
+class ReadoutConsumer:
+
+    def __init__(self, name: str, fn: Callable[..., Awaitable | None], queueSize: int, dropWhenFull: bool, withTime: bool):
+        self.name = name
+        self.fn = fn
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queueSize)
+        self.dropWhenFull = dropWhenFull
+        self.withTime = withTime
+        self.task: asyncio.Task | None = None
+
+
+class ReadoutEngine:
+    """Drains the readout buffer of a board into concurrent consumers
+
+    Args:
+        boardDriver: Board to read, already opened and configured for readout
+        readSize: Maximal number of bytes per read, the whole buffer content if None
+        pollInterval: Wait time in seconds after a poll found the buffer empty
+        queueSize: Default size in chunks of the consumer queues
+        lateThreshold: Time between two polls in seconds above which a read is counted as late
+        drainOnStop: Read the buffer until it is empty when stopping
+        beforePoll: Optional coroutine function called before each poll, for example to clock the chips when autoread is off
+        speculative: Read the buffer size and data in one round trip (BoardDriver.readoutReadSpeculative), readSize is then the speculative read size
+                     instead of the adaptive one
+        scheduler: Optional AdaptivePollScheduler choosing the wait between polls and the read size from the buffer occupancy,
+                   replaces pollInterval and readSize. Not supported with speculative, whose read size follows its own estimate
+    """
+
+    def __init__(
+        self,
+        boardDriver,
+        readSize: int | None = None,
+        pollInterval: float = 0.0,
+        queueSize: int = 256,
+        lateThreshold: float = 0.01,
+        drainOnStop: bool = True,
+        beforePoll: Callable[[], Awaitable] | None = None,
+        speculative: bool = False,
+        scheduler: AdaptivePollScheduler | None = None,
+    ):
+        if speculative and scheduler is not None:
+            raise ValueError("The speculative readout chooses its own read size, it can't be used with a poll scheduler")
+        self.boardDriver = boardDriver
+        self.readSize = readSize
+        self.pollInterval = pollInterval
+        self.queueSize = queueSize
+        self.lateThreshold = lateThreshold
+        self.drainOnStop = drainOnStop
+        self.beforePoll = beforePoll
+        self.speculative = speculative
+        self.scheduler = scheduler
+
+        self.consumers: list[ReadoutConsumer] = []
+        self.stats = ReadoutStats()
+        self.stopEvent = asyncio.Event()
+        self.acquisitionTask: asyncio.Task | None = None
+        self.errors: list[BaseException] = []
+
+    def addConsumer(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable | None],
+        queueSize: int | None = None,
+        dropWhenFull: bool = False,
+        withTime: bool = False,
+    ):
+        """Adds a consumer called with each read chunk, fn can be a function or a coroutine function
+
+        Args:
+            queueSize: Size of the consumer queue in chunks, the engine queueSize if None
+            dropWhenFull: Drop the chunks for this consumer when its queue is full, instead of delaying the acquisition
+            withTime: Call fn with the chunk and the host monotonic time at which it was read
+        """
+        assert self.acquisitionTask is None, "Add consumers before starting the readout"
+        self.consumers.append(ReadoutConsumer(name, fn, queueSize or self.queueSize, dropWhenFull, withTime))
+        self.stats.maxQueueOccupancy[name] = 0
+        self.stats.droppedChunks[name] = 0
+        self.stats.droppedBytes[name] = 0
+
+    def addFileWriter(self, file: BinaryIO, name: str = "writer"):
+        """Adds a consumer writing the chunks to a binary file, or to a RunFileWriter with their read time.
+        Writes run in the executor to keep the event loop free"""
+        from drivers.readout.runfile import RunFileWriter
+
+        loop = asyncio.get_running_loop()
+        if isinstance(file, RunFileWriter):
+
+            async def writeChunk(chunk: bytes, hostTime: float):
+                await loop.run_in_executor(None, functools.partial(file.write, chunk, hostTime=hostTime))
+
+            self.addConsumer(name, writeChunk, withTime=True)
+            return
+
+        async def write(chunk: bytes):
+            await loop.run_in_executor(None, file.write, chunk)
+
+        self.addConsumer(name, write)
+
+    async def start(self):
+        self.stopEvent.clear()
+        self.errors = []
+        self.stats.startTime = time.monotonic()
+        self.stats.stopTime = None
+        if self.scheduler is not None:
+            self.scheduler.reset()
+        for consumer in self.consumers:
+            consumer.task = asyncio.create_task(self.runConsumer(consumer))
+        self.acquisitionTask = asyncio.create_task(self.runAcquisition())
+
+    async def stop(self):
+        """Stops the acquisition, lets the consumers process the queued chunks, and raises the first error of the run if any"""
+        self.stopEvent.set()
+        if self.acquisitionTask is not None:
+            await self.acquisitionTask
+            self.acquisitionTask = None
+        for consumer in self.consumers:
+            if consumer.task is not None:
+                if not consumer.task.done():
+                    await consumer.queue.put(None)
+                await consumer.task
+                consumer.task = None
+        self.stats.stopTime = time.monotonic()
+        logger.info(self.stats.report())
+        if self.scheduler is not None:
+            logger.info(self.scheduler.report())
+        if len(self.errors) > 0:
+            raise self.errors[0]
+
+    async def run(self, duration: float | None = None):
+        """Runs the readout for duration seconds, or until stopEvent is set
+
+        The readout is also stopped when the task is cancelled, the cancellation is then propagated to the caller
+        """
+        await self.start()
+        try:
+            if duration is None:
+                await self.stopEvent.wait()
+            else:
+                await asyncio.wait_for(self.stopEvent.wait(), duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            await self.stop()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+        return False
+
+    async def readOnce(self) -> tuple[int, int]:
+        """Polls the buffer size and reads it if not empty, returns the polled buffer size and the number of bytes read"""
+        if self.beforePoll is not None:
+            await self.beforePoll()
+        if self.speculative:
+            count, data = await self.boardDriver.readoutReadSpeculative(self.readSize)
+        else:
+            count = await self.boardDriver.readoutGetBufferSize()
+        stats = self.stats
+        stats.polls += 1
+        stats.bufferSizeSum += count
+        stats.maxBufferSize = max(stats.maxBufferSize, count)
+        ## A speculative read can return frames which arrived after the size read, they are only empty when no data came back
+        if (len(data) if self.speculative else count) == 0:
+            stats.emptyPolls += 1
+            return count, 0
+
+        if not self.speculative:
+            if self.scheduler is not None:
+                readSize = self.scheduler.readSize(count)
+            else:
+                readSize = count if self.readSize is None else min(count, self.readSize)
+            data = bytes(await self.boardDriver.readoutReadBytes(readSize))
+        hostTime = time.monotonic()
+        stats.reads += 1
+        stats.bytes += len(data)
+        await self.dispatch(data, hostTime)
+        return count, len(data)
+
+    async def dispatch(self, chunk: bytes, hostTime: float):
+        for consumer in self.consumers:
+            if consumer.task is None or consumer.task.done():
+                continue
+            if consumer.dropWhenFull and consumer.queue.full():
+                self.stats.droppedChunks[consumer.name] += 1
+                self.stats.droppedBytes[consumer.name] += len(chunk)
+                continue
+            await consumer.queue.put((chunk, hostTime))
+            self.stats.maxQueueOccupancy[consumer.name] = max(self.stats.maxQueueOccupancy[consumer.name], consumer.queue.qsize())
+
+    async def runAcquisition(self):
+        lastPoll = None
+        ## Planned wait after the previous poll, which doesn't make the next poll late
+        wait = 0.0
+        try:
+            while not self.stopEvent.is_set():
+                now = time.monotonic()
+                if lastPoll is not None:
+                    interval = now - lastPoll
+                    self.stats.maxPollInterval = max(self.stats.maxPollInterval, interval)
+                    if interval - wait > self.lateThreshold:
+                        self.stats.lateReads += 1
+                lastPoll = now
+
+                count, read = await self.readOnce()
+                if self.scheduler is not None:
+                    wait = self.scheduler.update(count, read)
+                else:
+                    wait = self.pollInterval if read == 0 else 0.0
+                ## Always yield, so that the consumers run even when the IO calls complete without suspending
+                await asyncio.sleep(wait)
+
+            ## Only drain the data present at stop time, the buffer keeps filling while the chips are read
+            if self.drainOnStop:
+                available, drained = await self.readOnce()
+                while 0 < drained < available:
+                    _, read = await self.readOnce()
+                    if read == 0:
+                        break
+                    drained += read
+        except Exception as e:
+            logger.error("Readout acquisition failed: %s", e)
+            self.errors.append(e)
+            self.stopEvent.set()
+
+    async def runConsumer(self, consumer: ReadoutConsumer):
+        try:
+            while True:
+                item = await consumer.queue.get()
+                if item is None:
+                    break
+                chunk, hostTime = item
+                result = consumer.fn(chunk, hostTime) if consumer.withTime else consumer.fn(chunk)
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as e:
+            logger.error("Readout consumer %s failed: %s", consumer.name, e)
+            self.errors.append(e)
+            self.stopEvent.set()
+            ## Unblock the acquisition if it waits for space in this queue
+            while not consumer.queue.empty():
+                consumer.queue.get_nowait()
@@ -0,0 +1,157 @@
+"""
+Memory mapped access to recorded runs, for offline decoding
+
+A MappedRunFile maps a run file (.run, see drivers.readout.runfile) or a raw readout file (.bin) without reading it:
+the readout bytes are exposed as memoryview slices of the mapping, which the decoders use directly or as NumPy uint8 views.
+
+frames() cuts the readout bytes in windows which end on a frame boundary, so that a decoder called once per window doesn't lose the frames
+straddling the window edges. In a run file, the readout bytes are split in chunks by the chunk headers: a frame straddling two chunks
+is copied and yielded alone, and consecutive chunks smaller than the window size (low rate runs) are merged with a copy,
+so that the decoder is not called for each small chunk. The other windows are zero-copy views.
+
+Frame boundaries are found with drivers.astropix.decode.find_frame_boundary, the frame walk of the decoders.
+
+For Example:
+
+    decoder = drivers.astropix.decode.Decode()
+    with MappedRunFile("run.run") as runFile:
+        for i, window in enumerate(runFile.frames()):
+            df = decoder.decode_readout(logger, window, i=i, printer=False)
+"""
+import logging
+import mmap
+import os
+from typing import TYPE_CHECKING, Iterator
+
+from drivers.astropix.decode import find_frame_boundary
+from drivers.readout.runfile import CHUNK_HEADER, CHUNK_MAGIC, FILE_MAGIC, RunFileReader
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
+
+DEFAULT_WINDOW_SIZE = 1024 * 1024
+
+
+class MappedRunFile:
+    """Memory maps a run file or a raw readout file
+
+    Args:
+        path: .run file written by RunFileWriter, or raw readout .bin file
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "rb")
+        size = os.fstat(self.file.fileno()).st_size
+        ## Empty files can't be mapped
+        self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else None
+        self.view = memoryview(self.mmap if self.mmap is not None else b"")
+
+        ## Run files get their metadata and chunks end from the reader, which rebuilds the index of runs which were not closed
+        self.isRunFile = self.view[: len(FILE_MAGIC)] == FILE_MAGIC
+        if self.isRunFile:
+            with RunFileReader(path) as reader:
+                self.metadata = reader.metadata
+                self.dataOffset = reader.dataOffset
+                self.dataEnd = reader.dataEnd
+        else:
+            self.metadata = {}
+            self.dataOffset = 0
+            self.dataEnd = size
+
+    def segments(self) -> Iterator[memoryview]:
+        """Yields the contiguous parts of the readout bytes: the chunks of a run file, or the whole raw file"""
+        if not self.isRunFile:
+            if self.dataEnd > 0:
+                yield self.view[: self.dataEnd]
+            return
+        offset = self.dataOffset
+        while offset < self.dataEnd:
+            magic, _, _, _, length = CHUNK_HEADER.unpack_from(self.view, offset)
+            if magic != CHUNK_MAGIC:
+                raise ValueError(f"Corrupted run file {self.path}: no chunk header at offset {offset}")
+            offset += CHUNK_HEADER.size
+            if length > 0:
+                yield self.view[offset : offset + length]
+            offset += length
+
+    def mergedSegments(self, size: int) -> Iterator[memoryview]:
+        """Yields the segments, consecutive segments smaller than size are copied and merged up to size bytes"""
+        merged = bytearray()
+        for segment in self.segments():
+            if len(segment) >= size:
+                if len(merged) > 0:
+                    yield memoryview(merged)
+                    merged = bytearray()
+                yield segment
+            else:
+                merged += segment
+                if len(merged) >= size:
+                    yield memoryview(merged)
+                    merged = bytearray()
+        if len(merged) > 0:
+            yield memoryview(merged)
+
+    def frames(self, windowSize: int = DEFAULT_WINDOW_SIZE) -> Iterator[memoryview]:
+        """Yields windows of about windowSize readout bytes which start and end on frame boundaries
+
+        The windows are views of the mapping, they must be released before closing the file
+        """
+        ## Start of a frame which continues in the next segment
+        straddling = b""
+        for segment in self.mergedSegments(windowSize):
+            start = 0
+            if len(straddling) > 0:
+                missing = straddling[0] + 1 - len(straddling)
+                if missing > len(segment):
+                    straddling += bytes(segment)
+                    continue
+                yield memoryview(straddling + bytes(segment[:missing]))
+                straddling = b""
+                start = missing
+
+            while start < len(segment):
+                end, incomplete = find_frame_boundary(segment, start, min(start + windowSize, len(segment)))
+                if end > start:
+                    yield segment[start:end]
+                if incomplete:
+                    straddling = bytes(segment[end:])
+                    break
+                start = end
+
+        if len(straddling) > 0:
+            logger.warning("Run file %s ends with an incomplete frame of %d bytes", self.path, len(straddling))
+
+    def frameArrays(self, windowSize: int = DEFAULT_WINDOW_SIZE) -> Iterator["np.ndarray"]:
+        """Yields the frames windows as NumPy uint8 arrays sharing the mapping memory"""
+        import numpy as np
+
+        for window in self.frames(windowSize):
+            yield np.frombuffer(window, dtype=np.uint8)
+
+    def array(self) -> "np.ndarray":
+        """Returns the whole mapping as a NumPy uint8 array, which is the readout data for a raw file"""
+        import numpy as np
+
+        return np.frombuffer(self.view, dtype=np.uint8)
+
+    def close(self):
+        self.view.release()
+        if self.mmap is not None:
+            try:
+                self.mmap.close()
+            except BufferError:
+                ## Windows still referenced by the caller, the mapping is closed when they are garbage collected
+                logger.debug("Run file %s mapping still in use", self.path)
+            self.mmap = None
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
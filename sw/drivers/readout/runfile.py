@@ -0,0 +1,245 @@
+"""
+Indexed binary run files
+
+A run file stores the readout chunks as they were read from the firmware buffer, with the host time of each read.
+All integers are little endian.
+
+- File header: FILE_HEADER (magic, version, metadata length) followed by the metadata, a JSON object (configuration, run arguments, start time...)
+- Chunks: CHUNK_HEADER (magic, layer mask, sequence number, host monotonic time, byte count) followed by the raw readout bytes
+- Index: INDEX_ENTRY (file offset, sequence number, host monotonic time) of one chunk every indexSpacing bytes,
+         followed by INDEX_FOOTER (index offset, index entries count, chunks count, magic) at the end of the file
+
+The index is written when the writer is closed. When it is missing (crashed run), the reader rebuilds it by scanning the chunk headers,
+and ignores a truncated last chunk.
+
+For Example:
+
+    with RunFileWriter("run.run", metadata={"arguments": vars(args)}, layerMask=0b111) as runFile:
+        engine.addFileWriter(runFile)
+        ...
+
+    with RunFileReader("run.run") as runFile:
+        for chunk in runFile.chunks(start=runFile.seekTime(runFile.startTime() + 3600)):
+            decode(chunk.data)
+"""
+import bisect
+import json
+import logging
+import os
+import struct
+import time
+from typing import Iterator, NamedTuple
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
+
+FILE_MAGIC = b"ASTEPRUN"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<8sHxxI")
+
+CHUNK_MAGIC = b"CK"
+CHUNK_HEADER = struct.Struct("<2sBxIdI")
+
+INDEX_MAGIC = b"RUNINDEX"
+INDEX_ENTRY = struct.Struct("<QId")
+INDEX_FOOTER = struct.Struct("<QII8s")
+
+## Bytes of chunks between two index entries: seeking reads at most the chunk headers in this range
+DEFAULT_INDEX_SPACING = 1024 * 1024
+
+
+class RunChunk(NamedTuple):
+    sequence: int
+    hostTime: float
+    layerMask: int
+    data: bytes
+
+
+class RunFileWriter:
+    """Writes readout chunks to a run file, write has the signature of a binary file write so that it can be used with ReadoutEngine.addFileWriter
+
+    Args:
+        path: Output file path, usually with the .run extension
+        metadata: JSON serializable dictionary stored in the file header, values which are not serializable are stored as strings
+        layerMask: Layers the chunks contain data from, one bit per layer, when not given to write
+        indexSpacing: Bytes of chunks between two index entries
+    """
+
+    def __init__(self, path: str, metadata: dict | None = None, layerMask: int = 0, indexSpacing: int = DEFAULT_INDEX_SPACING):
+        self.path = path
+        self.layerMask = layerMask
+        self.indexSpacing = indexSpacing
+
+        ## Host times of the start of the run, to convert the chunk monotonic times to dates
+        self.metadata = {"startTime": time.time(), "startMonotonic": time.monotonic()}
+        self.metadata.update(metadata or {})
+        metadataBytes = json.dumps(self.metadata, default=str).encode()
+
+        self.file = open(path, "wb")
+        self.file.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, len(metadataBytes)))
+        self.file.write(metadataBytes)
+        self.offset = FILE_HEADER.size + len(metadataBytes)
+
+        self.sequence = 0
+        self.index = bytearray()
+        self.indexEntries = 0
+        self.nextIndexOffset = self.offset
+
+    def write(self, data: bytes | bytearray | memoryview, layerMask: int | None = None, hostTime: float | None = None) -> int:
+        """Writes a chunk, hostTime is the monotonic time of the read, now if None. Returns the number of data bytes written"""
+        hostTime = time.monotonic() if hostTime is None else hostTime
+        if self.offset >= self.nextIndexOffset:
+            self.index += INDEX_ENTRY.pack(self.offset, self.sequence, hostTime)
+            self.indexEntries += 1
+            self.nextIndexOffset = self.offset + self.indexSpacing
+
+        self.file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, self.layerMask if layerMask is None else layerMask, self.sequence, hostTime, len(data)))
+        self.file.write(data)
+        self.offset += CHUNK_HEADER.size + len(data)
+        self.sequence += 1
+        return len(data)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.write(self.index)
+        self.file.write(INDEX_FOOTER.pack(self.offset, self.indexEntries, self.sequence, INDEX_MAGIC))
+        self.file.close()
+        logger.info("Closed run file %s: %d chunks, %d bytes", self.path, self.sequence, self.offset)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class RunFileReader:
+    """Reads a run file written by RunFileWriter
+
+    Args:
+        path: Run file path
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "rb")
+        self.fileSize = os.fstat(self.file.fileno()).st_size
+
+        header = self.readAt(0, FILE_HEADER.size)
+        if len(header) < FILE_HEADER.size:
+            raise ValueError(f"{path} is not a run file")
+        magic, version, metadataLength = FILE_HEADER.unpack(header)
+        if magic != FILE_MAGIC:
+            raise ValueError(f"{path} is not a run file")
+        if version > FILE_VERSION:
+            raise ValueError(f"{path} has run file version {version}, only versions up to {FILE_VERSION} are supported")
+        self.metadata: dict = json.loads(self.readAt(FILE_HEADER.size, metadataLength))
+        self.dataOffset = FILE_HEADER.size + metadataLength
+
+        ## (offsets, sequences, times) of the indexed chunks, the end offset of the chunks and the number of chunks
+        self.indexOffsets: list[int] = []
+        self.indexSequences: list[int] = []
+        self.indexTimes: list[float] = []
+        self.dataEnd = self.dataOffset
+        self.chunksCount = 0
+
+        ## False if the index was rebuilt because the writer was not closed
+        self.complete = self.readIndex()
+        if not self.complete:
+            logger.warning("Run file %s has no index, rebuilding it", path)
+            self.rebuildIndex()
+
+    def readAt(self, offset: int, size: int) -> bytes:
+        self.file.seek(offset)
+        return self.file.read(size)
+
+    def readIndex(self) -> bool:
+        if self.fileSize < self.dataOffset + INDEX_FOOTER.size:
+            return False
+        indexOffset, entries, chunks, magic = INDEX_FOOTER.unpack(self.readAt(self.fileSize - INDEX_FOOTER.size, INDEX_FOOTER.size))
+        if magic != INDEX_MAGIC or indexOffset + entries * INDEX_ENTRY.size + INDEX_FOOTER.size != self.fileSize:
+            return False
+        for offset, sequence, hostTime in INDEX_ENTRY.iter_unpack(self.readAt(indexOffset, entries * INDEX_ENTRY.size)):
+            self.addIndexEntry(offset, sequence, hostTime)
+        self.dataEnd = indexOffset
+        self.chunksCount = chunks
+        return True
+
+    def rebuildIndex(self, indexSpacing: int = DEFAULT_INDEX_SPACING):
+        offset = self.dataOffset
+        nextIndexOffset = offset
+        while offset + CHUNK_HEADER.size <= self.fileSize:
+            magic, _, sequence, hostTime, length = CHUNK_HEADER.unpack(self.readAt(offset, CHUNK_HEADER.size))
+            if magic != CHUNK_MAGIC or offset + CHUNK_HEADER.size + length > self.fileSize:
+                break
+            if offset >= nextIndexOffset:
+                self.addIndexEntry(offset, sequence, hostTime)
+                nextIndexOffset = offset + indexSpacing
+            offset += CHUNK_HEADER.size + length
+            self.chunksCount = sequence + 1
+        self.dataEnd = offset
+
+    def addIndexEntry(self, offset: int, sequence: int, hostTime: float):
+        self.indexOffsets.append(offset)
+        self.indexSequences.append(sequence)
+        self.indexTimes.append(hostTime)
+
+    def startTime(self) -> float | None:
+        """Returns the host monotonic time of the first chunk"""
+        return self.indexTimes[0] if len(self.indexTimes) > 0 else None
+
+    def seekTime(self, hostTime: float) -> int:
+        """Returns the sequence number of the first chunk read at or after the host monotonic time hostTime"""
+        position = bisect.bisect_right(self.indexTimes, hostTime) - 1
+        if position < 0:
+            return 0
+        for chunk in self.chunksFrom(self.indexOffsets[position], readData=False):
+            if chunk.hostTime >= hostTime:
+                return chunk.sequence
+        return self.chunksCount
+
+    def chunks(self, start: int = 0, stop: int | None = None, readData: bool = True) -> Iterator[RunChunk]:
+        """Iterates over the chunks with sequence numbers from start to stop (excluded), seeking to start through the index"""
+        position = bisect.bisect_right(self.indexSequences, start) - 1
+        if position < 0:
+            return
+        for chunk in self.chunksFrom(self.indexOffsets[position], readData):
+            if stop is not None and chunk.sequence >= stop:
+                break
+            if chunk.sequence >= start:
+                yield chunk
+
+    def chunksFrom(self, offset: int, readData: bool = True) -> Iterator[RunChunk]:
+        while offset < self.dataEnd:
+            magic, layerMask, sequence, hostTime, length = CHUNK_HEADER.unpack(self.readAt(offset, CHUNK_HEADER.size))
+            if magic != CHUNK_MAGIC:
+                raise ValueError(f"Corrupted run file {self.path}: no chunk header at offset {offset}")
+            data = self.file.read(length) if readData else b""
+            yield RunChunk(sequence, hostTime, layerMask, data)
+            offset += CHUNK_HEADER.size + length
+
+    def chunk(self, sequence: int) -> RunChunk:
+        for chunk in self.chunks(sequence, sequence + 1):
+            return chunk
+        raise IndexError(f"No chunk {sequence} in run file {self.path} ({self.chunksCount} chunks)")
+
+    def __len__(self) -> int:
+        return self.chunksCount
+
+    def __iter__(self) -> Iterator[RunChunk]:
+        return self.chunks()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
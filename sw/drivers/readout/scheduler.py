@@ -0,0 +1,124 @@
+"""
+Adaptive polling of the firmware readout buffer
+
+The scheduler chooses, after each poll of LAYERS_READOUT_READ_SIZE, how long to wait before the next poll and how many bytes to read.
+It only sees the polled buffer sizes and the read byte counts, so it works the same on every board IO (UART, FTDI, SPI...).
+
+- Idle: the buffer is empty, the interval doubles up to maxInterval
+- Steady: the interval is the time needed by the estimated fill rate to bring targetFill bytes, so that reads amortize the round trips
+- Burst: the buffer is above targetFill and filling, or a read left data behind: the next poll is immediate and the read size doubles up to maxReadSize
+
+Polls finding the buffer above nearOverflowFraction of its capacity are counted, they indicate that the readout is too slow for the hit rate.
+"""
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
+
+
+## Readout buffer size of the multiboard firmware (FIFO_DEPTH of fifo_axis_1clk_1kB), other targets may have a smaller buffer
+DEFAULT_BUFFER_CAPACITY = 16384
+
+
+class AdaptivePollScheduler:
+    """Adapts the readout polling interval and read size to the buffer occupancy and fill rate
+
+    Args:
+        capacity: Size of the firmware readout buffer in bytes
+        targetFill: Buffer occupancy in bytes to wait for between polls in steady mode
+        minInterval: Shortest wait between polls in idle and steady modes, in seconds
+        maxInterval: Longest wait between polls, in seconds
+        readSize: Read size in idle and steady modes
+        maxReadSize: Largest read size in burst mode
+        nearOverflowFraction: Fraction of the capacity above which a poll is counted as near overflow
+        smoothing: Weight of the last poll in the moving averages of the occupancy and fill rate
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_BUFFER_CAPACITY,
+        targetFill: int = 512,
+        minInterval: float = 0.001,
+        maxInterval: float = 0.02,
+        readSize: int = 4096,
+        maxReadSize: int | None = None,
+        nearOverflowFraction: float = 0.75,
+        smoothing: float = 0.25,
+    ):
+        self.capacity = capacity
+        self.targetFill = targetFill
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.baseReadSize = readSize
+        self.maxReadSize = maxReadSize or capacity
+        self.nearOverflowFraction = nearOverflowFraction
+        self.smoothing = smoothing
+        self.reset()
+
+    def reset(self):
+        ## Current decisions
+        self.interval = self.minInterval
+        self.currentReadSize = self.baseReadSize
+
+        ## Estimations: moving averages of the polled size in bytes and of the fill rate in bytes per second
+        self.occupancy = 0.0
+        self.fillRate = 0.0
+        self.lastPollTime: float | None = None
+        self.lastSize = 0
+        self.residual = 0
+
+        ## Counters
+        self.polls = 0
+        self.idlePolls = 0
+        self.burstPolls = 0
+        self.nearOverflows = 0
+        self.maxOccupancy = 0
+
+    def readSize(self, size: int) -> int:
+        """Returns the number of bytes to read for a polled buffer size"""
+        return min(size, self.currentReadSize)
+
+    def update(self, size: int, read: int, now: float | None = None) -> float:
+        """Records a poll which found size bytes and read read bytes, returns the wait time in seconds before the next poll"""
+        now = time.monotonic() if now is None else now
+        self.polls += 1
+        self.maxOccupancy = max(self.maxOccupancy, size)
+        if size >= self.capacity * self.nearOverflowFraction:
+            ## Only warn when entering the near overflow state
+            if self.lastSize < self.capacity * self.nearOverflowFraction:
+                logger.warning("Readout buffer near overflow: %d/%d bytes", size, self.capacity)
+            self.nearOverflows += 1
+
+        ## Bytes that arrived since the previous poll: the polled size minus what the previous read left in the buffer
+        if self.lastPollTime is not None and now > self.lastPollTime:
+            inflow = max(size - self.residual, 0) / (now - self.lastPollTime)
+            self.fillRate += (inflow - self.fillRate) * self.smoothing
+        self.occupancy += (size - self.occupancy) * self.smoothing
+        filling = size > self.lastSize
+        self.lastPollTime = now
+        self.lastSize = size
+        self.residual = max(size - read, 0)
+
+        if self.residual > 0 or (filling and size > self.targetFill):
+            ## Burst: poll again right away with larger reads
+            self.burstPolls += 1
+            self.currentReadSize = min(self.currentReadSize * 2, self.maxReadSize)
+            self.interval = 0.0
+        elif size == 0:
+            ## Idle: back off
+            self.idlePolls += 1
+            self.currentReadSize = max(self.currentReadSize // 2, self.baseReadSize)
+            self.interval = min(max(self.interval * 2, self.minInterval), self.maxInterval)
+        else:
+            ## Steady: wait for targetFill bytes at the estimated fill rate
+            self.currentReadSize = max(self.currentReadSize // 2, self.baseReadSize)
+            wait = self.targetFill / self.fillRate if self.fillRate > 0 else self.maxInterval
+            self.interval = min(max(wait, self.minInterval), self.maxInterval)
+        return self.interval
+
+    def report(self) -> str:
+        return (
+            f"Poll scheduler: {self.polls} polls, idle {self.idlePolls}, burst {self.burstPolls}, near overflow {self.nearOverflows}, "
+            f"buffer recent {self.occupancy:.0f} max {self.maxOccupancy}/{self.capacity} bytes, fill rate {self.fillRate / 1000:.1f} kB/s"
+        )
@@ -23,6 +23,7 @@ from tqdm import tqdm
 import drivers.astep.serial
 import drivers.astropix.decode
 import drivers.boards
+import drivers.readout
 
 
 async def buffer_flush(boardDriver, layerlst=range(3)):
@@ -101,22 +102,27 @@ async def getBuffer(boardDriver):
 
 # Parse raw data readouts to remove railing. Moved to postprocessing method to avoid SW slowdown when using autoread
 def dataParse_autoread(data_lst, buffer_lst, bitfile: str = None):
-    allData = b""
+    allData = []
     for i, buff in enumerate(buffer_lst):
         if buff > 0:
             readout_data = data_lst[i][:buff]
             # logger.info(binascii.hexlify(readout_data))
-            allData += readout_data
+            allData.append(readout_data)
             if bitfile:
                 bitfile.write(f"{str(binascii.hexlify(readout_data))}\n")
     ## DAN - could also return buffer index to keep track of whether multiple hits occur in the same readout. Would need to propagate forward
-    return allData
+    return b"".join(allData)
 
 
 async def printStatus(boardDriver, time=0.0, buff=0):
-    status = [await boardDriver.getLayerStatus(layer) for layer in range(3)]
-    ctrl = [await boardDriver.getLayerControl(layer) for layer in range(3)]
-    wrongl = [await boardDriver.getLayerWrongLength(layer) for layer in range(3)]
+    ## All status registers are read in one round trip
+    async with boardDriver.rfg.batch() as b:
+        status = [b.submit(boardDriver.getLayerStatus(layer)) for layer in range(3)]
+        ctrl = [b.submit(boardDriver.getLayerControl(layer)) for layer in range(3)]
+        wrongl = [b.submit(boardDriver.getLayerWrongLength(layer)) for layer in range(3)]
+    status = [task.result() for task in status]
+    ctrl = [task.result() for task in ctrl]
+    wrongl = [task.result() for task in wrongl]
     logger.info(
         "[{time:04.2} s] buff={0:04d} status: 0={1[0]:02b}-{2[0]:06b}-{3[0]:04d} 1={1[1]:02b}-{2[1]:06b}-{3[1]:04d} 2={1[2]:02b}-{2[2]:06b}-{3[2]:04d}".format(
             buff, status, ctrl, wrongl, time=time
@@ -124,24 +130,18 @@ async def printStatus(boardDriver, time=0.0, buff=0):
     )
 
 
-# Needed to decode data
-class myhack:
-    def __init__(self):
-        self.sampleclock_period_ns = 10
-
-
 def bin2csv(fprefix):
-    with open("{}.bin".format(fprefix), "rb") as ofile:
-        datalst = []
-        i = 0
-        while data := ofile.read(4096):
-            datalst.append(
-                drivers.astropix.decode.decode_readout(
-                    myhack(), logger, data, i=i, printer=False
-                )
-            )
-            # logger.info(binascii.hexlify(data))
-            i += 1
+    ## Raw .bin files of older runs are also supported
+    path = "{}.run".format(fprefix)
+    if not os.path.exists(path):
+        path = "{}.bin".format(fprefix)
+    decoder = drivers.astropix.decode.Decode()
+    datalst = []
+    with drivers.readout.MappedRunFile(path) as runFile:
+        ## Windows end on frame boundaries, frames straddling the read chunks are not lost
+        for i, window in enumerate(runFile.frames()):
+            datalst.append(decoder.decode_readout_numpy(window, i))
+            window.release()
     if len(datalst) > 0:
         csvframe = [
             "readout",
@@ -448,7 +448,11 @@ async def main(args):
         dataStream_lst = []
         bufferLength_lst = []
     else:
-        ofile = open("{}.bin".format(args.outputPrefix), "wb")
+        ofile = drivers.readout.RunFileWriter(
+            "{}.run".format(args.outputPrefix),
+            metadata={"script": "fwTest.py", "arguments": vars(args)},
+            layerMask=sum(1 << layer for layer in layerlst),
+        )
     if args.runTime is not None:
         end_time = time.time() + (args.runTime * 60.0)
     else:
@@ -459,39 +463,39 @@ async def main(args):
         layerlst, autoread=not (args.noAutoread), flush=True
     )
 
-    # Main loop
-    run = time.time() < end_time
-    while run:
-        try:
-            if args.noAutoread:
-                for layer in layerlst:
-                    await boardDriver.writeLayerBytes(
-                        layer=layer, bytes=[0x00] * 255, flush=True
-                    )
-            # Read data
-            if args.readout is None:
-                task = asyncio.create_task(getBuffer(boardDriver))
-            else:
-                task = asyncio.create_task(get_readout(boardDriver, args.readout))
-            await task
-            buff, readout = task.result()
-            if args.inject:
-                # Store data
-                dataStream_lst.append(readout)
-                bufferLength_lst.append(buff)
-                await printStatus(boardDriver, time.time() - end_time, buff=buff)
-            else:
-                if buff > 0:
-                    ofile.write(readout)
-                # logger.info(binascii.hexlify(readout))
-                # await printStatus(boardDriver, time.time()-end_time, buff=buff)
-            print(f"  {buff:04d}  ", end="\r")
-            # logger.info(binascii.hexlify(readout[:buff]))
-            # Check time
-            run = time.time() < end_time
-        except (KeyboardInterrupt, asyncio.CancelledError):
-            logger.info("[Ctrl+C] while in main loop - exiting.")
-            run = False
+    # Main loop: the readout engine polls the buffer, consumers store the data
+    async def clockLayers():
+        for layer in layerlst:
+            await boardDriver.writeLayerBytes(
+                layer=layer, bytes=[0x00] * 255, flush=True
+            )
+
+    engine = drivers.readout.ReadoutEngine(
+        boardDriver,
+        readSize=args.readout or None,
+        beforePoll=clockLayers if args.noAutoread else None,
+    )
+    if args.inject:
+        # Store data
+        def storeReadout(readout):
+            dataStream_lst.append(readout)
+            bufferLength_lst.append(len(readout))
+
+        engine.addConsumer("store", storeReadout)
+        engine.addConsumer(
+            "status",
+            lambda readout: printStatus(boardDriver, time.time() - end_time, buff=len(readout)),
+            dropWhenFull=True,
+        )
+    else:
+        engine.addFileWriter(ofile)
+    engine.addConsumer("monitor", lambda readout: print(f"  {len(readout):04d}  ", end="\r"), dropWhenFull=True)
+    try:
+        await engine.run(None if args.runTime is None else max(end_time - time.time(), 0))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        ## asyncio.run cancels this task on Ctrl+C, the engine is stopped and the board is still closed below
+        logger.info("[Ctrl+C] while in main loop - exiting.")
+    logger.info(engine.stats.report())
     await printStatus(boardDriver, time.time() - end_time)
     # Pause readout
     await boardDriver.disableLayersReadout(flush=True)
@@ -509,8 +513,8 @@ async def main(args):
     if args.inject:
         print(len(bufferLength_lst), max(bufferLength_lst))
         dataStream = dataParse_autoread(dataStream_lst, bufferLength_lst, None)
-        df = drivers.astropix.decode.decode_readout(
-            myhack(), logger, dataStream, i=0, printer=False
+        df = drivers.astropix.decode.Decode().decode_readout(
+            logger, dataStream, i=0, printer=False
         )
         if len(df) > 0:
             csvframe = [
@@ -16,6 +16,7 @@ import logging
 
 # AstroPix drivers
 from astropixrun import AstropixRun
+import drivers.readout
 
 #import drivers.astep.serial
 #import drivers.astropix.decode
@@ -94,25 +95,30 @@ async def main(args):
     await arun.buffer_flush()
     await arun.chips_enable_readout()
 
-    # Main loop here
-    end_time = float("inf") if args.runTime is None else time.time() + (args.runTime * 60.0)
-    run = time.time() < end_time
-    ofile = open("{}.bin".format(args.outputPrefix), "wb")
+    # Main loop here: the readout engine writes the data to file while the buffer is polled
+    duration = None if args.runTime is None else args.runTime * 60.0
+    ## Readout chunks are stored in an indexed run file, with the arguments and FPGA configuration as metadata
+    with open(args.fpgaxml) as fpgaxml:
+        metadata = {"script": "main.py", "arguments": vars(args), "fpgaxml": fpgaxml.read()}
+    ofile = drivers.readout.RunFileWriter(
+        "{}.run".format(args.outputPrefix), metadata=metadata, layerMask=sum(1 << layer for layer in arun.layerlst)
+    )
     if args.inject: await arun.start_injection()
-    
-    while run:
-        try:
-            # Read data
-            buff, readout = await arun.get_readout(args.readout)
-            # Output data
-            if buff > 0:
-                ofile.write(readout)
-            print(f"  {buff:04d}  ", end="\r")
-            # Check time
-            run = time.time() < end_time
-        except (KeyboardInterrupt, asyncio.CancelledError):
-            logger.info("[Ctrl+C] while in main loop - exiting.")
-            run = False
+
+    scheduler = None
+    if args.adaptive:
+        scheduler = drivers.readout.AdaptivePollScheduler(readSize=args.readout or 4096)
+    engine = arun.get_readout_engine(args.readout, speculative=args.speculative, scheduler=scheduler)
+    engine.addFileWriter(ofile)
+    engine.addConsumer("monitor", lambda readout: print(f"  {len(readout):04d}  ", end="\r"), dropWhenFull=True)
+    try:
+        await engine.run(duration)
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        ## asyncio.run cancels this task on Ctrl+C, the engine is stopped and the board is still closed below
+        logger.info("[Ctrl+C] while in main loop - exiting.")
+    logger.info(engine.stats.report())
+    if scheduler is not None:
+        logger.info(scheduler.report())
 
     await arun.chips_disable_readout()
     if args.inject: await arun.stop_injection()
@@ -168,6 +174,18 @@ if __name__ == "__main__":
         type=int,
         help="Number of bytes of FPGA buffer to read for each readout (1 to 4098, 0->As much as buffer contains, other->4096). Default: 0",
     )
+    ## The speculative readout adapts its own read size, it doesn't run with the poll scheduler
+    readoutMode = parser.add_mutually_exclusive_group()
+    readoutMode.add_argument(
+        "--speculative",
+        action="store_true",
+        help="Read the buffer size and data in one round trip, with --readout bytes or an adaptive size if 0. Default: off",
+    )
+    readoutMode.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adapt the polling interval and read size to the buffer occupancy, backing off when idle. Default: off",
+    )
 
     # Options related to Setup / Configuration of system
     parser.add_argument(
@@ -0,0 +1,75 @@
+"""
+Benchmark of the v2/v3 readout decoders on a synthetic readout stream
+
+- decode_readout: frames are split by prepare_readout and decoded one by one in Python
+- decode_readout_numpy: frame offsets are found once, and the fields of all the hits are extracted with NumPy
+
+The stream contains hits of 12 bytes (length byte 11 followed by the hit bytes and the FPGA timestamp)
+separated by idle bytes. The reference decoder is timed on the first --reference-mb MB only and extrapolated,
+its hits are compared to the vectorized decoder ones on that part.
+
+Run from the sw folder: python scripts/benchmarks/bench_decode.py
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from drivers.astropix.decode import Decode, find_frame_offsets
+
+
+def syntheticReadout(size: int, idleFraction: float, seed: int) -> bytes:
+    """Returns about size bytes of random v3 hits of 12 bytes, idleFraction of them followed by an idle byte"""
+    rng = np.random.default_rng(seed)
+    count = int(size / (12 + idleFraction))
+    hits = rng.integers(0, 256, (count, 13), dtype=np.uint8)
+    hits[:, 0] = 11
+    hits[:, 1] = rng.integers(0, 4, count)
+    hits[:, 12] = 0xBC
+    ## The idle byte of a hit is dropped unless the hit is followed by idle bytes
+    keep = np.ones(hits.shape, dtype=bool)
+    keep[:, 12] = rng.random(count) < idleFraction
+    return hits[keep].tobytes()
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run(args):
+    decoder = Decode()
+    logger = logging.getLogger("bench_decode")
+    readout = syntheticReadout(int(args.size_mb * 1e6), args.idle, seed=1)
+    reference = readout[: int(args.reference_mb * 1e6)]
+    print(f"Readout {len(readout) / 1e6:.1f} MB, reference decoder on {len(reference) / 1e6:.1f} MB")
+
+    ## Reference decoder, extrapolated to the whole readout
+    expected, referenceTime = timed(decoder.decode_readout, logger, reference, 0, printer=False)
+    referenceTotal = referenceTime * len(readout) / len(reference)
+
+    ## Same hits on the reference part
+    decoded = decoder.decode_readout_numpy(reference, 0)
+    assert list(decoded.columns) == list(expected.columns) and len(decoded) == len(expected), "Decoded hits differ"
+    for column in expected.columns:
+        assert (decoded[column].values == expected[column].values).all(), f"Decoded {column} column differs"
+
+    (offsets, _), offsetsTime = timed(find_frame_offsets, readout)
+    columns, columnsTime = timed(decoder.decode_readout_numpy, readout, 0, dataframe=False)
+    df, dataframeTime = timed(decoder.decode_readout_numpy, readout, 0)
+
+    print(f"{'decode_readout':>30}: {referenceTotal:7.2f} s (extrapolated from {referenceTime:.2f} s), {len(expected)} hits")
+    print(f"{'find_frame_offsets':>30}: {offsetsTime:7.2f} s, {len(offsets)} frames")
+    for name, duration in (("decode_readout_numpy columns", columnsTime), ("decode_readout_numpy DataFrame", dataframeTime)):
+        print(f"{name:>30}: {duration:7.2f} s, {len(readout) / duration / 1e6:6.1f} MB/s, speedup {referenceTotal / duration:5.1f}x")
+    print(f"{len(df)} hits decoded")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Readout decoders benchmark")
+    parser.add_argument("--size-mb", type=float, default=100.0, help="Synthetic readout size in MB")
+    parser.add_argument("--reference-mb", type=float, default=4.0, help="Readout size decoded by the reference decoder in MB")
+    parser.add_argument("--idle", type=float, default=0.5, help="Fraction of the hits followed by an idle byte")
+    run(parser.parse_args())
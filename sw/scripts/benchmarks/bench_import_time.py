@@ -0,0 +1,76 @@
+"""
+Benchmark of the driver startup time: module import time and board driver creation
+
+The import time is measured with python -X importtime in a fresh interpreter, for the modules imported by a typical HK script.
+The heaviest modules are listed, to check that pandas, tqdm, bitstring and yaml are not loaded when they are not used.
+The drivers import these modules in the functions using them, and only under TYPE_CHECKING at module level.
+Board creation is timed in one process, repeated creations use the cached firmware package discovery.
+
+Run from the sw folder: python scripts/benchmarks/bench_import_time.py
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+LAZY_MODULES = ["pandas", "tqdm", "bitstring", "yaml"]
+
+
+def importTime(statement: str, runs: int) -> tuple[float, dict[str, int]]:
+    """Returns the best total import time in ms over runs, and the cumulative time per top level module in us of the best run"""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            env=os.environ,
+            check=True,
+        )
+        modules = {}
+        total = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            modules[name.strip()] = int(cumulative)
+            ## Top level imports are not indented
+            if not name[1:].startswith(" "):
+                total += int(cumulative) / 1000
+        if best is None or total < best[0]:
+            best = (total, modules)
+    return best
+
+
+def main(args):
+    statement = "import drivers.boards; drivers.boards.getCMODDriver()"
+    total, modules = importTime(statement, args.runs)
+    print(f"'{statement}': {total:.1f} ms (best of {args.runs})")
+
+    print("Heaviest modules (cumulative):")
+    for name, cumulative in sorted(modules.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    loaded = [name for name in LAZY_MODULES if name in modules]
+    print(f"Lazy modules loaded: {', '.join(loaded) if loaded else 'none'}")
+
+    ## Board creation in one process, the first one discovers and loads the firmware package
+    import drivers.boards
+
+    start = time.perf_counter()
+    drivers.boards.getCMODDriver()
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(args.boards):
+        drivers.boards.getCMODDriver()
+    next = (time.perf_counter() - start) / args.boards
+    print(f"Board driver creation: first {first * 1000:.2f} ms, next {next * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Driver import time benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Number of interpreter runs, the best one is reported")
+    parser.add_argument("--top", type=int, default=10, help="Number of heaviest modules listed")
+    parser.add_argument("--boards", type=int, default=20, help="Number of board drivers created after the first one")
+    main(parser.parse_args())
@@ -0,0 +1,106 @@
+"""
+Benchmark of the aggregate readout throughput when driving N boards from one event loop
+
+Each board uses an IO layer simulating a link with a fixed round trip latency and bandwidth,
+the readout buffer always holds --chunk bytes. Since each board has its own Register File instance and locks,
+the aggregate throughput should scale with the number of boards.
+
+Run from the sw folder: python scripts/benchmarks/bench_multiboard.py --boards 1 2 4 8
+"""
+import argparse
+import asyncio
+import time
+
+import rfg.core
+import drivers.boards
+from drivers.boards.multiboard import MultiBoardDriver
+
+
+class LatencyIO(rfg.core.RFGIO):
+    """IO answering readout size and readout data reads after a simulated link delay"""
+
+    def __init__(self, readSizeAddress: int, readoutAddress: int, chunk: int, latency: float, bandwidth: float):
+        super().__init__()
+        self.readSizeAddress = readSizeAddress
+        self.readoutAddress = readoutAddress
+        self.chunk = chunk
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.pending = bytearray()
+
+    async def writeBytes(self, bytes: bytearray):
+        offset = 0
+        while offset < len(bytes):
+            header, address, length = rfg.core.HEADER_FORMAT.unpack_from(bytes, offset)
+            offset += rfg.core.HEADER_FORMAT.size
+            if header & 0x01:
+                offset += length
+            elif address == self.readSizeAddress:
+                self.pending += self.chunk.to_bytes(length, "little")
+            elif address == self.readoutAddress:
+                self.pending += b"\x00" * length
+            else:
+                self.pending += b"\xff" * length
+
+    async def readBytes(self, count: int) -> bytes:
+        await asyncio.sleep(self.latency + count / self.bandwidth)
+        result = bytes(self.pending[:count])
+        del self.pending[:count]
+        return result
+
+
+def createBoard(args):
+    board = drivers.boards.getCMODDriver()
+    registers = board.rfg.Registers
+    board.rfg.withIODriver(
+        LatencyIO(
+            registers["LAYERS_READOUT_READ_SIZE"].value,
+            registers["LAYERS_READOUT"].value,
+            args.chunk,
+            args.latency,
+            args.bandwidth,
+        )
+    )
+    return board
+
+
+async def runBoards(count: int, args) -> float:
+    boards = MultiBoardDriver([createBoard(args) for _ in range(count)])
+    await boards.open()
+
+    totalBytes = 0
+
+    def onData(name, data):
+        nonlocal totalBytes
+        totalBytes += len(data)
+
+    stop = asyncio.Event()
+    start = time.perf_counter()
+    readout = asyncio.ensure_future(boards.runReadout(onData, stop))
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await readout
+    elapsed = time.perf_counter() - start
+
+    await boards.close()
+    return totalBytes / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi Board readout benchmark")
+    parser.add_argument("--boards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk", type=int, default=4096, help="Bytes available in the readout buffer at each poll")
+    parser.add_argument("--latency", type=float, default=0.002, help="Simulated round trip latency in seconds")
+    parser.add_argument("--bandwidth", type=float, default=1e6, help="Simulated link bandwidth in bytes/s")
+    parser.add_argument("--duration", type=float, default=2.0)
+    args = parser.parse_args()
+
+    reference = None
+    for count in args.boards:
+        throughput = asyncio.run(runBoards(count, args))
+        reference = reference or throughput / count
+        print(f"{count:3d} boards: {throughput / 1e6:8.3f} MB/s aggregate, scaling {throughput / reference:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark of the per call overhead of register reads in a tight polling loop
+
+Compares the ways to read LAYER_<lane>_MOSI_WRITE_SIZE as done in BoardDriver.writeSPIBytesToLane:
+
+- legacy: method name built with an f-string, resolved with getattr, register enum looked up by name in the call (previous generated code)
+- named: same getattr dispatch on the generated method, which is now a wrapper on the register accessor
+- indexed: rfg.layer[lane].mosi_write_size.read()
+- hoisted: accessor resolved once before the loop
+
+Accessors also send their read request encoded in advance when the RFG has nothing else pending.
+The IO answers immediately, so the results show the software overhead only.
+
+Run from the sw folder: python scripts/benchmarks/bench_register_access.py
+"""
+import argparse
+import asyncio
+import time
+
+import rfg.core
+import drivers.boards
+
+
+class ZeroIO(rfg.core.RFGIO):
+    """IO answering all reads with zeros right away"""
+
+    def __init__(self):
+        super().__init__()
+        self.pending = 0
+
+    async def writeBytes(self, bytes: bytearray):
+        offset = 0
+        while offset < len(bytes):
+            header, address, length = rfg.core.HEADER_FORMAT.unpack_from(bytes, offset)
+            offset += rfg.core.HEADER_FORMAT.size
+            if header & 0x01:
+                offset += length
+            else:
+                self.pending += length
+
+    async def readBytes(self, count: int) -> bytes:
+        self.pending -= count
+        return bytes(count)
+
+
+async def legacyRead(registerFile, lane: int) -> int:
+    return int.from_bytes(
+        await registerFile.syncRead(
+            register=registerFile.Registers[f"LAYER_{lane}_MOSI_WRITE_SIZE"], count=4, increment=True, targetQueue=None
+        ),
+        "little",
+    )
+
+
+async def run(args):
+    board = drivers.boards.getCMODDriver()
+    board.rfg.withIODriver(ZeroIO())
+    registerFile = board.rfg
+
+    async def legacy(lane):
+        return await legacyRead(registerFile, lane)
+
+    async def named(lane):
+        return await getattr(registerFile, f"read_layer_{lane}_mosi_write_size")()
+
+    async def indexed(lane):
+        return await registerFile.layer[lane].mosi_write_size.read()
+
+    variants = {"legacy": legacy, "named": named, "indexed": indexed}
+
+    results = {}
+    for name, fn in variants.items():
+        start = time.perf_counter()
+        for i in range(args.count):
+            await fn(i % 3)
+        results[name] = (time.perf_counter() - start) / args.count
+
+    ## Hoisted: accessors resolved once per lane, as in the polling loop of writeSPIBytesToLane
+    accessors = [registerFile.layer[lane].mosi_write_size for lane in range(3)]
+    start = time.perf_counter()
+    for i in range(args.count):
+        await accessors[i % 3].read()
+    results["hoisted"] = (time.perf_counter() - start) / args.count
+
+    ## Dispatch only: cost of resolving the register without the read itself
+    start = time.perf_counter()
+    for i in range(args.count):
+        lane = i % 3
+        getattr(registerFile, f"read_layer_{lane}_mosi_write_size")
+        registerFile.Registers[f"LAYER_{lane}_MOSI_WRITE_SIZE"]
+    legacyDispatch = (time.perf_counter() - start) / args.count
+    start = time.perf_counter()
+    for i in range(args.count):
+        registerFile.layer[i % 3].mosi_write_size
+    indexedDispatch = (time.perf_counter() - start) / args.count
+
+    print(f"{args.count} reads per variant")
+    for name, duration in results.items():
+        print(f"{name:>10}: {duration * 1e6:7.2f} us/read ({results['legacy'] / duration:4.2f}x legacy)")
+    print(f"dispatch only: legacy {legacyDispatch * 1e9:.0f} ns, indexed {indexedDispatch * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Register access overhead benchmark")
+    parser.add_argument("--count", type=int, default=50000, help="Number of reads per variant")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,101 @@
+"""
+Micro-benchmark of the RFG command encoder used by AbstractRFG.flush
+
+The commands generated by a full writeSRAsicConfig sequence (quad chip config) are captured
+and encoded with the legacy per-byte encoder and the current preallocated encoder.
+
+Run from the sw folder: python scripts/benchmarks/bench_rfg_encoder.py
+"""
+import argparse
+import asyncio
+import math
+import os
+import timeit
+
+import rfg.core
+import drivers.boards
+
+SW_FOLDER = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def legacyEncodeCommands(commands):
+    """Copy of the original flush encoding loop, kept as reference"""
+    bytes = bytearray()
+    for cmd in commands:
+        if cmd.write:
+            requiredWrites = int(math.ceil((len(cmd.values) / 65535.0)))
+            remainingBytes = len(cmd.values)
+            for i in range(requiredWrites):
+                offset = i * 65535
+                length = remainingBytes if remainingBytes <= 65535 else 65535
+                values = cmd.values[offset : offset + length]
+                remainingBytes -= length
+
+                if cmd.addressIncrement:
+                    bytes.append(0x05)
+                else:
+                    bytes.append(0x01)
+                bytes.append(cmd.register.value)
+                bytes.append(length.to_bytes(byteorder="little", length=2)[0])
+                bytes.append(length.to_bytes(byteorder="little", length=2)[1])
+
+                for v in values:
+                    bV = v.to_bytes(byteorder="little", length=1)[0]
+                    bytes.append(bV)
+        else:
+            if cmd.addressIncrement:
+                bytes.append(0x06)
+            else:
+                bytes.append(0x02)
+            bytes.append(cmd.register.value)
+            bytes.append(cmd.length.to_bytes(byteorder="little", length=2)[0])
+            bytes.append(cmd.length.to_bytes(byteorder="little", length=2)[1])
+    return bytes
+
+
+async def captureSRConfigCommands(configFile: str, chips: int, ckdiv: int):
+    """Runs writeSRAsicConfig on a driver without IO and returns the commands list passed to flush"""
+    driver = drivers.boards.getCMODDriver()
+    driver.setupASIC(version=3, lane=0, chipsPerLane=chips, configFile=configFile)
+
+    captured = []
+
+    async def captureFlush():
+        captured.extend(driver.rfg.commands)
+        driver.rfg.resetCommands()
+
+    driver.rfg.flush = captureFlush
+    await driver.writeSRAsicConfig(lane=0, ckdiv=ckdiv)
+    return captured
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RFG Encoder benchmark")
+    parser.add_argument("--config", default=os.path.join(SW_FOLDER, "scripts", "config", "quadchip_allOff.yml"))
+    parser.add_argument("--chips", type=int, default=4)
+    parser.add_argument("--ckdiv", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    commands = asyncio.run(captureSRConfigCommands(args.config, args.chips, args.ckdiv))
+    payload = sum(len(cmd.values) for cmd in commands)
+    print(f"Captured {len(commands)} commands, {payload} payload bytes")
+
+    legacy = legacyEncodeCommands(commands)
+    current = rfg.core.encodeCommands(commands)
+    assert legacy == current, "Encoders output differ"
+    print(f"Encoded stream: {len(current)} bytes, outputs are identical")
+
+    results = {}
+    for name, fn in (("legacy", legacyEncodeCommands), ("current", rfg.core.encodeCommands)):
+        timer = timeit.Timer(lambda: fn(commands))
+        loops, _ = timer.autorange()
+        best = min(timer.repeat(repeat=args.repeat, number=loops)) / loops
+        results[name] = best
+        print(f"{name:>8}: {best * 1e3:9.3f} ms/flush, {len(current) / best / 1e6:9.1f} MB/s")
+
+    print(f"Speedup: {results['legacy'] / results['current']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
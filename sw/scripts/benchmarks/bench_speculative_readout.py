@@ -0,0 +1,101 @@
+"""
+Benchmark of the readout polling rate with and without speculative readout, on the firmware emulator behind a simulated UART link
+
+- two round trips: LAYERS_READOUT_READ_SIZE is read, then LAYERS_READOUT if the buffer is not empty
+- speculative: the size and an adaptive chunk of LAYERS_READOUT are read in one flush, filler bytes are cut
+
+The link adds a fixed latency per round trip (USB-UART latency) and the transfer time of each byte at the baud rate.
+The delays advance a simulated clock, which also drives the hits generation of the emulator: the results are reproducible
+and don't include the host CPU time, so they show the link time saved by the speculative reads.
+
+Run from the sw folder: python scripts/benchmarks/bench_speculative_readout.py
+"""
+import argparse
+import asyncio
+
+import drivers.boards
+from drivers.astep.emulator import ASTEPEmulatorIO
+from drivers.readout import ReadoutEngine
+
+
+class SimulatedClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class UARTLinkEmulatorIO(ASTEPEmulatorIO):
+    """Emulator IO delaying the responses like a UART link, on a simulated clock"""
+
+    def __init__(self, registerFile, roundTrip: float, baud: int, clock: SimulatedClock, **kwargs):
+        super().__init__(registerFile, clock=clock, **kwargs)
+        self.roundTrip = roundTrip
+        self.byteTime = 10 / baud
+        self.responsePending = False
+        self.transferredBytes = 0
+        self.roundTrips = 0
+
+    async def writeBytes(self, bytes: bytearray):
+        self.clock.now += len(bytes) * self.byteTime
+        self.transferredBytes += len(bytes)
+        await super().writeBytes(bytes)
+        self.responsePending = True
+
+    async def readBytes(self, count: int) -> bytes:
+        self.clock.now += count * self.byteTime
+        if self.responsePending:
+            self.clock.now += self.roundTrip
+            self.roundTrips += 1
+            self.responsePending = False
+        self.transferredBytes += count
+        return await super().readBytes(count)
+
+
+async def run(args):
+    print(f"Hit rate {args.hitrate} /s per layer, round trip {args.roundtrip_ms} ms, {args.baud} baud, {args.duration} simulated s per mode")
+    for speculative in (False, True):
+        board = drivers.boards.getCMODDriver()
+        clock = SimulatedClock()
+        io = UARTLinkEmulatorIO(
+            board.rfg,
+            args.roundtrip_ms / 1000,
+            args.baud,
+            clock,
+            firmwareID=0xAC03,
+            hitRate=args.hitrate,
+            coreFrequency=board.getFPGACoreFrequency(),
+            seed=1,
+        )
+        board.rfg.withIODriver(io)
+        await board.open()
+        await board.enableLayersReadout([0, 1, 2], autoread=True, flush=True)
+
+        engine = ReadoutEngine(board, speculative=speculative, drainOnStop=False)
+        engine.addConsumer("count", lambda chunk: None)
+        start, transferred, roundTrips = clock.now, io.transferredBytes, io.roundTrips
+        await engine.start()
+        while clock.now - start < args.duration:
+            await asyncio.sleep(0.001)
+        await engine.stop()
+        duration = clock.now - start
+        stats = engine.stats
+
+        mode = "speculative" if speculative else "two round trips"
+        print(
+            f"{mode:>16}: {stats.polls / duration:7.1f} polls/s, {(io.roundTrips - roundTrips) / stats.polls:4.2f} round trips/poll, "
+            f"{stats.bytes / duration / 1000:6.1f} kB/s data, link {(io.transferredBytes - transferred) / duration / 1000:6.1f} kB/s, "
+            f"mean buffer {stats.meanBufferSize():6.1f} bytes, generated {io.generatedFrames} frames"
+        )
+        await board.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Speculative readout benchmark")
+    parser.add_argument("--hitrate", type=float, default=200.0, help="Emulated hits per second per layer")
+    parser.add_argument("--roundtrip-ms", type=float, default=1.0, help="Link latency per round trip in ms")
+    parser.add_argument("--baud", type=int, default=921600, help="UART baud rate")
+    parser.add_argument("--duration", type=float, default=3.0, help="Simulated readout duration per mode in seconds")
+    asyncio.run(run(parser.parse_args()))
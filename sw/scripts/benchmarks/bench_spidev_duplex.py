@@ -0,0 +1,174 @@
+"""
+Benchmark of the SPIDEV IO in half duplex and full duplex modes, against a mock spidev device emulating the firmware SPI framing
+
+- half duplex: commands are written with writebytes2, responses are clocked with a separate readbytes call
+- full duplex: one xfer3 carries the commands and the clocking for the responses
+
+The mock device answers read commands after a latency in bytes, with a frame start byte followed by the payload, and sends 0xBC idle bytes otherwise.
+Grouped reads (RFG batch) only work in full duplex mode: in half duplex mode, the bytes received while writing are dropped,
+which loses a response starting before the following read commands were sent.
+Each ioctl is charged a fixed overhead plus the transfer time of its bytes at the SPI clock, so that the timings reflect a real link.
+
+The spidev and gpiod modules are only used by SPIDEVIO.open(), which is not called here. If they are not installed, empty placeholder
+modules are registered so that rfg.io.spidev can be imported.
+
+Run from the sw folder: python scripts/benchmarks/bench_spidev_duplex.py
+"""
+import argparse
+import asyncio
+import importlib.machinery
+import importlib.util
+import sys
+import time
+import types
+
+
+def placeholderModule(name: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__spec__ = importlib.machinery.ModuleSpec(name, None)
+    sys.modules[name] = module
+    return module
+
+
+if importlib.util.find_spec("spidev") is None:
+    placeholderModule("spidev")
+if importlib.util.find_spec("gpiod") is None:
+    placeholderModule("gpiod").line = placeholderModule("gpiod.line")
+    sys.modules["gpiod.line"].Direction = sys.modules["gpiod.line"].Value = None
+
+import rfg.core
+import rfg.io.spidev
+import drivers.boards
+
+
+class MockSpiDev:
+    """Emulates the firmware side of the SPI link: one MISO byte is returned per MOSI byte
+
+    Args:
+        latency: Number of bytes clocked between the end of a read command and the start of its response frame
+        ioctlOverhead: Fixed cost of one ioctl in seconds
+        clockHz: SPI clock, used to charge the transfer time of each byte
+    """
+
+    def __init__(self, latency: int = 2, ioctlOverhead: float = 20e-6, clockHz: int = 5000000):
+        self.latency = latency
+        self.ioctlOverhead = ioctlOverhead
+        self.byteTime = 8 / clockHz
+        self.ioctls = 0
+        self.bytesClocked = 0
+
+        ## Received command bytes not parsed yet, and the global position of their first byte
+        self.mosi = bytearray()
+        self.mosiPosition = 0
+        ## Response frames scheduled as (start position, bytes), in order
+        self.frames = []
+        self.lastFrameEnd = 0
+        self.memory = {}
+
+    def wait(self, count: int):
+        self.ioctls += 1
+        end = time.perf_counter() + self.ioctlOverhead + count * self.byteTime
+        while time.perf_counter() < end:
+            pass
+
+    def parseCommands(self):
+        offset = 0
+        while offset < len(self.mosi):
+            if self.mosi[offset] == 0x00:
+                offset += 1
+                continue
+            if offset + rfg.core.HEADER_FORMAT.size > len(self.mosi):
+                break
+            header, address, length = rfg.core.HEADER_FORMAT.unpack_from(self.mosi, offset)
+            end = offset + rfg.core.HEADER_FORMAT.size
+            if header & 0x01:
+                if end + length > len(self.mosi):
+                    break
+                self.memory[address] = bytes(self.mosi[end : end + length])
+                end += length
+            elif header & 0x02:
+                value = self.memory.get(address, b"")
+                payload = (value * (length // max(len(value), 1) + 1))[:length] if value else bytes(length)
+                start = max(self.mosiPosition + end + self.latency, self.lastFrameEnd)
+                self.frames.append((start, bytes([header >> 4]) + payload))
+                self.lastFrameEnd = start + 1 + length
+            offset = end
+        del self.mosi[:offset]
+        self.mosiPosition += offset
+
+    def clock(self, data) -> bytearray:
+        """Shifts data out, returns the MISO bytes"""
+        start = self.bytesClocked
+        self.bytesClocked += len(data)
+        self.mosi += data
+        self.parseCommands()
+
+        miso = bytearray(b"\xBC" * len(data))
+        while self.frames and self.frames[0][0] < self.bytesClocked:
+            frameStart, frame = self.frames[0]
+            offset = max(frameStart, start)
+            part = frame[offset - frameStart : self.bytesClocked - frameStart]
+            miso[offset - start : offset - start + len(part)] = part
+            if frameStart + len(frame) <= self.bytesClocked:
+                self.frames.pop(0)
+            else:
+                break
+        self.wait(len(data))
+        return miso
+
+    def writebytes2(self, data):
+        self.clock(bytes(data))
+
+    def readbytes(self, count: int) -> list:
+        return list(self.clock(bytes(count)))
+
+    def xfer3(self, data) -> tuple:
+        return tuple(self.clock(bytes(data)))
+
+
+async def run(args):
+    print(f"{args.count} accesses per mode, ioctl overhead {args.ioctl_us} us, latency {args.latency} bytes")
+    for fullDuplex in (False, True):
+        board = drivers.boards.getCMODDriver()
+        io = rfg.io.spidev.SPIDEVIO("/dev/null", "/dev/null", 0, fullDuplex)
+        io.spiDev = MockSpiDev(args.latency, args.ioctl_us * 1e-6)
+        board.rfg.withIODriver(io)
+        registers = board.rfg.layer[0]
+
+        ## Check that values written are read back
+        await registers.cfg_ctrl.write(0x5A, True)
+        assert await registers.cfg_ctrl.read() == 0x5A, "Read back mismatch"
+
+        results = {}
+        for name, access in (
+            ("read", lambda i: registers.mosi_write_size.read()),
+            ("write", lambda i: registers.cfg_ctrl.write(i & 0xFF, True)),
+        ):
+            ioctls = io.spiDev.ioctls
+            start = time.perf_counter()
+            for i in range(args.count):
+                await access(i)
+            duration = (time.perf_counter() - start) / args.count
+            results[name] = (duration, (io.spiDev.ioctls - ioctls) / args.count)
+
+        ## Batch of reads in one round trip, as done when polling the status of all layers
+        if fullDuplex:
+            ioctls = io.spiDev.ioctls
+            start = time.perf_counter()
+            for i in range(args.count // 3):
+                async with board.rfg.batch() as batch:
+                    for lane in range(3):
+                        batch.submit(board.rfg.layer[lane].mosi_write_size.read())
+            duration = (time.perf_counter() - start) / (args.count // 3)
+            results["3 batched reads"] = (duration, (io.spiDev.ioctls - ioctls) / (args.count // 3))
+
+        mode = "full duplex" if fullDuplex else "half duplex"
+        print(mode + ": " + ", ".join(f"{name} {d * 1e6:6.1f} us {n:.2f} ioctl" for name, (d, n) in results.items()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SPIDEV half/full duplex benchmark with a mock device")
+    parser.add_argument("--count", type=int, default=3000, help="Number of register accesses per mode")
+    parser.add_argument("--ioctl-us", type=float, default=20.0, help="Fixed cost of one ioctl in us")
+    parser.add_argument("--latency", type=int, default=2, help="Firmware response latency in bytes")
+    asyncio.run(run(parser.parse_args()))
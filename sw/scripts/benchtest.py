@@ -9,20 +9,64 @@ import argparse
 from argparse import RawTextHelpFormatter
 import os, serial
 
+import drivers.readout
+
 
 #######################################################
 ############## USER DEFINED VARIABLES #################
 #layer, chip = 0, 0
 
+csvframe = [
+        'readout',
+        'layer',
+        'chipID',
+        'payload',
+        'location',
+        'isCol',
+        'timestamp',
+        'tot_msb',
+        'tot_lsb',
+        'tot_total',
+        'tot_us',
+        'fpga_ts'
+]
+
 
 #######################################################
 ###################### MAIN ###########################
+async def stream_data(astro, args, runpath, csvpath):
+    # Readouts are written to the run file by a background writer and decoded in fixed-size windows while collecting,
+    # so memory does not grow with the run length
+    engine = drivers.readout.ReadoutEngine(astro.boardDriver)
+    runFile = None
+    decoder = None
+    if not args.dumpOutput:
+        runFile = drivers.readout.RunFileWriter(runpath, metadata={"script": "benchtest.py", "arguments": vars(args)})
+        engine.addFileWriter(runFile)
+        decoder = drivers.readout.StreamingDecoder(
+            lambda window, i: astro.decode_readout(window, i, printer=args.printHits, vectorized=not args.printHits), csvpath, columns=csvframe
+        )
+        engine.addConsumer("decoder", decoder)
+    if args.printHits:
+        engine.addConsumer("printer", lambda readout: logger.info(binascii.hexlify(readout)), dropWhenFull=True)
+    try:
+        await engine.run(None if args.runTime is None else args.runTime*60.)
+    finally:
+        logger.info(engine.stats.report())
+        if runFile is not None:
+            runFile.close()
+        if decoder is not None:
+            await decoder.flush()
+            if decoder.hits == 0:
+                logger.error(f"No data recorded - no CSV generated")
+
 async def main(args, saveName):
 
     # Define outputs
     bitpath = args.outdir+saveName+".txt"
     csvpath = args.outdir+saveName+".csv"
-    if not args.dumpOutput:
+    runpath = args.outdir+saveName+".run"
+    if not args.dumpOutput and not args.stream:
         bitfile = open(bitpath,'w')    
 
     # Setup and configure chip
@@ -126,8 +170,11 @@ async def main(args, saveName):
     
     #Collect data
     logger.debug("Collecting data")
-    break_condition=False
+    stream = args.stream and not args.noAutoread
+    break_condition=stream #streamed runs skip the polling loop
     try: # By enclosing the main loop in try/except we are able to capture keyboard interupts cleanly
+        if stream:
+            await stream_data(astro, args, runpath, csvpath)
         while True:
             #timing break condition
             if (time.time() >= end_time) or break_condition:
@@ -182,6 +229,8 @@ async def main(args, saveName):
                 bufferLength_lst.append(buff)
     except KeyboardInterrupt: # Ends program cleanly when a keyboard interupt is sent (for no autoread case).
         logger.info("Keyboard interupt. Program halt!")
+    except asyncio.CancelledError: # Streamed runs without runTime end with a cancellation, the readout is already stopped
+        logger.info("asyncio received exit from cancellation, exiting")
     except Exception as e: # Catches other exceptions
         logger.exception(f"Encountered Unexpected Exception! \n{e}")
 
@@ -194,7 +243,7 @@ async def main(args, saveName):
         #await astro.checkInjBits()
 
     #wait to decode until the very end so that all readouts can be appended together and headers re-attached
-    if not args.noAutoread:
+    if not args.noAutoread and not stream:
         #AFTER data collection, parse autoread raw data and save to file
         txtOut = None if args.dumpOutput else bitfile
         dataStream = await astro.dataParse_autoread(dataStream_lst, bufferLength_lst, bitfile=txtOut)
@@ -223,22 +272,8 @@ async def main(args, saveName):
         if not args.dumpOutput:
             bitfile.write(f"{str(binascii.hexlify(readout_data))}\n")
          
-    if not args.dumpOutput:    
+    if not args.dumpOutput and not stream:    
         bitfile.close()  
-        csvframe = [
-                'readout',
-                'layer',
-                'chipID',
-                'payload',
-                'location',
-                'isCol',
-                'timestamp',
-                'tot_msb',
-                'tot_lsb',
-                'tot_total',
-                'tot_us',
-                'fpga_ts'
-        ]
         try:
             df.columns = csvframe
             df.to_csv(csvpath)
@@ -276,6 +311,9 @@ if __name__ == "__main__":
     ## DAN - I hate this saving strategy. Should think of a better way. Implementation is backwards and messy
     parser.add_argument('-d', '--dumpOutput', action='store_true', required=False, 
                         help='If passed, do not save raw data *.txt or decoded *.csv. If not passed, save the outputs. Log always saved. Default: save all')
+    parser.add_argument('-s', '--stream', action='store_true', required=False, 
+                        help='Can only be used in autoread mode. If passed, write raw readouts to a *.run file while collecting and decode them incrementally to *.csv, \
+                                memory use does not grow with the run length. If not passed, readouts are kept in memory and decoded after the run. Default: in memory')
     parser.add_argument('-p', '--printHits', action='store_true', required=False, 
                         help = 'Can only be used in autoread mode. If passed, print readout streams in real time to terminal, accepting potential data slowdown penalty. \
                                 If not passed, no printouts during data collection. Default: post-collection printout') 
@@ -366,6 +404,8 @@ if __name__ == "__main__":
     #Live readout printing option only possible in autoread mode
     if args.printHits and args.noAutoread:
         logger.warning("Live readout printing is only possible when chip read in autoread mode. Live readout printing is now disabled and code will run in non-autoread mode.")
+    if args.stream and args.noAutoread:
+        logger.warning("Streaming is only possible when chip read in autoread mode. Streaming is now disabled and code will run in non-autoread mode.")
 
 
     #print(args.yaml)
@@ -0,0 +1,69 @@
+"""
+RFG daemon: opens the board IO once and shares it with multiple processes (UI, DAQ, HK scripts)
+
+Clients select the daemon IO with drivers.boards.getCMODSocketDriver(address) / getGeccoSocketDriver(address),
+or with <protocol value="socket"/> in an AstropixRun configuration.
+Transactions reading the layers readout FIFO are served before the other ones.
+
+Run from the sw folder, for example: python scripts/rfg_daemon.py --fpga gecco --protocol ftdi
+"""
+import argparse
+import asyncio
+import logging
+
+import rfg.daemon
+import rfg.io.socketio
+import drivers.boards
+
+logger = logging.getLogger(__name__)
+
+## Reads of these registers get priority over slow control traffic
+PRIORITY_REGISTERS = ["LAYERS_READOUT", "LAYERS_READOUT_READ_SIZE"]
+
+
+def getBoardDriver(args):
+    if args.fpga == "cmod":
+        if args.protocol == "uart":
+            return drivers.boards.getCMODUartDriver(args.port, args.baud, nonBlocking=args.nonBlocking)
+        elif args.protocol == "emulator":
+            return drivers.boards.getCMODEmulatorDriver()
+    else:
+        if args.protocol == "uart":
+            return drivers.boards.getGeccoUARTDriver(args.port, args.baud, nonBlocking=args.nonBlocking)
+        elif args.protocol == "ftdi":
+            return drivers.boards.getGeccoFTDIDriver(streaming=args.streaming)
+        elif args.protocol == "emulator":
+            return drivers.boards.getGeccoEmulatorDriver()
+    raise RuntimeError(f"Unsupported protocol {args.protocol} for FPGA board {args.fpga}")
+
+
+async def main(args):
+    board = getBoardDriver(args)
+    priorityAddresses = [board.rfg.Registers[name].value for name in PRIORITY_REGISTERS if name in board.rfg.Registers.__members__]
+    daemon = rfg.daemon.RFGDaemon(board.rfg.io, priorityAddresses)
+    await daemon.start(args.listen)
+    try:
+        await daemon.serveForever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await daemon.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Share the board IO between multiple processes")
+    parser.add_argument("--fpga", choices=["cmod", "gecco"], default="cmod", help="FPGA board")
+    parser.add_argument("--protocol", choices=["uart", "ftdi", "emulator"], default="uart", help="Board IO")
+    parser.add_argument("--port", default=None, help="Serial port, the first one found if not set")
+    parser.add_argument("--baud", type=int, default=None, help="Serial baud rate")
+    parser.add_argument("--nonBlocking", action="store_true", help="Use the asyncio native UART transport (Linux)")
+    parser.add_argument("--streaming", action="store_true", help="Use the FTDI background reader thread")
+    parser.add_argument("--listen", default=rfg.io.socketio.DEFAULT_ADDRESS, help="Unix socket path or host:port to listen on")
+    parser.add_argument("-L", "--loglevel", choices=["D", "I", "W", "E"], default="I", help="Logging level")
+    args = parser.parse_args()
+
+    logging.basicConfig(level={"D": logging.DEBUG, "I": logging.INFO, "W": logging.WARNING, "E": logging.ERROR}[args.loglevel])
+    try:
+        asyncio.run(main(args))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,11 @@
+## Tests run from the sw folder like the scripts: python -m pytest tests
+## The environment set by load.sh is completed here when it wasn't sourced
+import os
+import sys
+
+BASE = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("BASE", BASE)
+
+for folder in (os.path.join(BASE, "sw"), os.path.join(BASE, "vendor", "icflow_hdl_240807", "hdl_rfg_v1", "python")):
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
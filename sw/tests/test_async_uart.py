@@ -0,0 +1,77 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("serial")
+if sys.platform == "win32":
+    pytest.skip("AsyncUARTIO requires a POSIX system", allow_module_level=True)
+
+import tty
+
+import rfg.io.uart
+
+
+async def openOnPty(io: rfg.io.uart.AsyncUARTIO) -> int:
+    """Attaches the IO to the slave side of a pseudo terminal like open does, returns the master side"""
+    master, slave = os.openpty()
+    ## Raw mode like the serial port configured by pyserial, bytes are not buffered per line
+    tty.setraw(slave)
+    os.set_blocking(slave, False)
+    io.fd = slave
+    io.loop = asyncio.get_running_loop()
+    io.loop.add_reader(slave, io.onReadable)
+    return master
+
+
+def test_read_bytes():
+    async def run():
+        io = rfg.io.uart.AsyncUARTIO()
+        master = await openOnPty(io)
+        os.write(master, b"\x01\x02")
+        first = await io.readBytes(1)
+        os.write(master, b"\x03")
+        second = await io.readBytes(2)
+        io.loop.remove_reader(io.fd)
+        os.close(master)
+        os.close(io.fd)
+        return first, second
+
+    assert asyncio.run(run()) == (b"\x01", b"\x02\x03")
+
+
+def test_hang_up_stops_reader():
+    async def run():
+        io = rfg.io.uart.AsyncUARTIO()
+        io.timeout = 1
+        master = await openOnPty(io)
+        read = asyncio.ensure_future(io.readBytes(4))
+        await asyncio.sleep(0)
+        os.close(master)
+        with pytest.raises(OSError):
+            await read
+        ## The reader callback was removed on hang up
+        assert not io.loop.remove_reader(io.fd)
+        os.close(io.fd)
+
+    asyncio.run(run())
+
+
+def test_timeout_keeps_received_bytes():
+    async def run():
+        io = rfg.io.uart.AsyncUARTIO()
+        io.timeout = 0.05
+        master = await openOnPty(io)
+        os.write(master, b"\x01\x02")
+        with pytest.raises(Exception, match="timeout"):
+            await io.readBytes(4)
+        ## The end of the response arrives late, the next read gets the whole response
+        os.write(master, b"\x03\x04")
+        result = await io.readBytes(4)
+        io.loop.remove_reader(io.fd)
+        os.close(master)
+        os.close(io.fd)
+        return result
+
+    assert asyncio.run(run()) == b"\x01\x02\x03\x04"
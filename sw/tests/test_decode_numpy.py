@@ -0,0 +1,76 @@
+import logging
+
+import numpy as np
+import pytest
+
+from drivers.astropix.decode import FRAME_WALK_BYTES, Decode, find_frame_offsets
+
+logger = logging.getLogger(__name__)
+
+
+def readoutStream(kind: str, size: int, rng: np.random.Generator) -> bytes:
+    if kind == "random":
+        return rng.integers(0, 256, size, dtype=np.uint8).tobytes()
+    if kind == "alphabet":
+        ## Mostly length bytes, the frames synchronise rarely
+        return rng.choice(np.array([0, 3, 5, 10, 16, 17, 0xBC, 0xFF], dtype=np.uint8), size).tobytes()
+    stream = bytearray()
+    while len(stream) < size:
+        length = int(rng.integers(0, 17))
+        stream += bytes([length]) + rng.integers(0, 256, length, dtype=np.uint8).tobytes()
+        if rng.random() < 0.3:
+            stream += b"\xFF" * int(rng.integers(1, 20))
+    ## Cut in a frame, the last hit is incomplete
+    return bytes(stream[:size])
+
+
+def assertSameHits(readout: bytes):
+    decoder = Decode()
+    expected = decoder.decode_readout(logger, readout, 7, printer=False)
+    decoded = decoder.decode_readout_numpy(readout, 7)
+    assert len(decoded) == len(expected)
+    if len(expected) == 0:
+        return
+    assert list(decoded.columns) == list(expected.columns)
+    for column in expected.columns:
+        assert decoded[column].dtype == expected[column].dtype, column
+        assert (decoded[column].values == expected[column].values).all(), column
+
+
+@pytest.mark.parametrize("kind", ["random", "alphabet", "framed"])
+def test_same_hits_as_reference(kind):
+    rng = np.random.default_rng(3)
+    for _ in range(30):
+        assertSameHits(readoutStream(kind, int(rng.integers(0, 3000)), rng))
+
+
+@pytest.mark.parametrize("kind", ["random", "alphabet", "framed"])
+def test_same_hits_vectorized_walk(kind):
+    ## Longer than FRAME_WALK_BYTES, the frame offsets are found by the lockstep walk
+    assertSameHits(readoutStream(kind, FRAME_WALK_BYTES * 2 + 999, np.random.default_rng(4)))
+
+
+@pytest.mark.parametrize("kind", ["random", "alphabet", "framed"])
+def test_offsets_independent_of_windows_and_parts(kind):
+    rng = np.random.default_rng(5)
+    readout = readoutStream(kind, 150000, rng)
+    expected, expectedState = find_frame_offsets(readout)
+    for windowSize in (997, 4096, 100003):
+        offsets, state = find_frame_offsets(readout, window_size=windowSize)
+        assert (offsets == expected).all() and state == expectedState
+
+    ## Decoding in parts with the state carried over finds the same frames
+    parts, state, start = [], 0, 0
+    for end in sorted(rng.integers(0, len(readout), 5)) + [len(readout)]:
+        offsets, state = find_frame_offsets(readout[start:end], state)
+        parts.append(offsets + start)
+        start = end
+    assert (np.concatenate(parts) == expected).all() and state == expectedState
+
+
+def test_columns_dictionary():
+    readout = readoutStream("framed", 5000, np.random.default_rng(6))
+    columns = Decode().decode_readout_numpy(readout, 0, dataframe=False)
+    expected = Decode().decode_readout(logger, readout, 0, printer=False)
+    assert list(columns) == list(expected.columns)
+    assert (columns["fpga_ts"] == expected["fpga_ts"].values).all()
@@ -0,0 +1,102 @@
+import asyncio
+
+import drivers.boards
+from drivers.astep.emulator import ASTEPEmulatorIO
+
+
+class ManualClock:
+    """Clock advanced by the test, so that the generated hits don't depend on wall time"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def openDriver(**kwargs):
+    board = drivers.boards.getCMODDriver()
+    io = ASTEPEmulatorIO(board.rfg, **kwargs)
+    board.rfg.withIODriver(io)
+    await board.open()
+    return board, io
+
+
+def splitFrames(data: bytes) -> list[bytes]:
+    frames = []
+    offset = 0
+    while offset < len(data):
+        frames.append(data[offset : offset + data[offset] + 1])
+        offset += data[offset] + 1
+    return frames
+
+
+def test_register_sizes_from_registers_info():
+    async def run():
+        board, io = await openDriver(hitRate=0, firmwareID=0xAC03)
+        for name, info in board.rfg.RegistersInfo.items():
+            assert io.sizes[io.reg(name)] == info.size, name
+
+        ## Multi-byte registers read back whole
+        await board.rfg.write_layers_fpga_timestamp_forced(0x0102030405060708, flush=True)
+        forced = await board.rfg.read_layers_fpga_timestamp_forced()
+        firmwareID = await board.readFirmwareID()
+        await board.close()
+        return forced, firmwareID
+
+    assert asyncio.run(run()) == (0x0102030405060708, 0xAC03)
+
+
+def test_written_bytes_counted():
+    async def run():
+        board, io = await openDriver(hitRate=0)
+        await board.writeSPIBytesToLane(lane=1, bytes=bytearray(300))
+        board.rfg.addWrite(board.rfg.Registers["LAYERS_SR_OUT"], 0x4, repeat=8)
+        await board.rfg.flush()
+        await board.close()
+        return io.mosiBytesCount
+
+    counts = asyncio.run(run())
+    assert counts["LAYER_1_MOSI"] == 300 and counts["LAYER_0_MOSI"] == 0
+    assert counts["LAYERS_SR_OUT"] == 8
+
+
+def test_autoread_frames_read_back():
+    async def run():
+        clock = ManualClock()
+        board, io = await openDriver(hitRate=[1000, 0, 0], clock=clock, seed=1)
+        await board.layersConfigFPGATimestamp(enable=True, use_divider=False, use_tlu=False, timestamp_size=1)
+
+        ## No hits while the layers are held
+        clock.now += 0.01
+        assert await board.readoutGetBufferSize() == 0
+
+        await board.enableLayersReadout([0], autoread=True, flush=True)
+        clock.now += 0.01
+        size = await board.readoutGetBufferSize()
+        data = bytes(await board.readoutReadBytes(size))
+        frameCounter = await board.getLayerStatFRAMECounter(0)
+        await board.close()
+        return data, frameCounter
+
+    data, frameCounter = asyncio.run(run())
+    frames = splitFrames(data)
+    ## 10 ms at 1000 hits/s, frames of length byte, layer, 5 data bytes and a 4 bytes timestamp
+    assert len(frames) == 10 and frameCounter == 10
+    assert all(len(frame) == 11 and frame[0] == 10 and frame[1] == 0 for frame in frames)
+    timestamps = [int.from_bytes(frame[-4:], "big") for frame in frames]
+    assert timestamps == sorted(timestamps) and timestamps[0] > 0
+
+
+def test_buffer_overflow_drops_frames():
+    async def run():
+        clock = ManualClock()
+        board, io = await openDriver(hitRate=[10000, 0, 0], clock=clock, bufferSize=110)
+        await board.enableLayersReadout([0], autoread=True, flush=True)
+        clock.now += 0.01
+        size = await board.readoutGetBufferSize()
+        await board.close()
+        return size, io.overflowFrames
+
+    ## 100 frames of 11 bytes with the reset 32 bits timestamp, 10 fit in the buffer
+    assert asyncio.run(run()) == (110, 90)
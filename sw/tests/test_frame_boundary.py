@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from drivers.astropix.decode import FRAME_WALK_BYTES, find_frame_boundary, find_frame_offsets
+from drivers.readout import MappedRunFile, RunFileWriter
+
+
+def referenceOffsets(readout: bytes, state: int = 0) -> tuple[list[int], int]:
+    """Frame walk of Decode.prepare_readout"""
+    offsets = []
+    position = state
+    while position < len(readout):
+        if readout[position] > 16:
+            position += 1
+        else:
+            offsets.append(position)
+            position += readout[position] + 1
+    return offsets, position - len(readout)
+
+
+def framedStream(size: int, seed: int) -> bytes:
+    """Frames of random lengths and content separated by random idle bytes"""
+    rng = np.random.default_rng(seed)
+    stream = bytearray()
+    while len(stream) < size:
+        length = int(rng.integers(0, 17))
+        stream += bytes([length]) + rng.integers(0, 256, length, dtype=np.uint8).tobytes()
+        stream += b"\xBC" * int(rng.integers(0, 3))
+    return bytes(stream)
+
+
+@pytest.mark.parametrize("size", [1000, FRAME_WALK_BYTES + 12345])
+@pytest.mark.parametrize("state", [0, 5])
+def test_frame_offsets_match_reference(size, state):
+    ## Random bytes too, where most bytes are idle bytes
+    for readout in (framedStream(size, seed=1), np.random.default_rng(2).integers(0, 256, size, dtype=np.uint8).tobytes()):
+        offsets, exit = find_frame_offsets(readout, state)
+        assert (list(offsets), exit) == referenceOffsets(readout, state)
+
+
+def test_frame_offsets_in_windows():
+    readout = framedStream(300000, seed=3)
+    offsets, exit = find_frame_offsets(readout, window_size=100003)
+    assert (list(offsets), exit) == referenceOffsets(readout)
+
+
+def test_frame_boundary():
+    readout = bytes([3, 1, 2, 3, 0xBC, 2, 1, 2])
+    assert find_frame_boundary(readout, 0, 2) == (4, False)
+    assert find_frame_boundary(readout, 0, 4) == (4, False)
+    assert find_frame_boundary(readout, 0, 5) == (5, False)
+    assert find_frame_boundary(readout, 0, 8) == (8, False)
+    assert find_frame_boundary(readout, 4, 6) == (8, False)
+    ## The last frame misses a byte
+    assert find_frame_boundary(readout[:7], 0, 6) == (5, True)
+
+
+def test_mapped_frames_are_aligned(tmp_path):
+    readout = framedStream(50000, seed=4)
+    with RunFileWriter(str(tmp_path / "run.run")) as writer:
+        ## Chunks cut the frames anywhere, some are smaller than the window
+        for start in range(0, len(readout), 7000):
+            writer.write(readout[start : start + 7000])
+            writer.write(b"")
+
+    with MappedRunFile(str(tmp_path / "run.run")) as runFile:
+        windows = [bytes(window) for window in runFile.frames(windowSize=4096)]
+    assert b"".join(windows) == readout
+    for window in windows:
+        assert referenceOffsets(window)[1] == 0
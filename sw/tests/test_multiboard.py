@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+import drivers.boards
+from drivers.boards.multiboard import MultiBoardDriver
+
+
+def emulatorBoards(count: int, **kwargs) -> MultiBoardDriver:
+    return MultiBoardDriver([drivers.boards.getCMODEmulatorDriver(seed=i, **kwargs) for i in range(count)])
+
+
+def test_boards_have_own_register_file():
+    boards = emulatorBoards(2)
+    assert boards["0"].rfg is not boards["1"].rfg
+    assert boards["0"].rfg.readLock is not boards["1"].rfg.readLock
+
+    ## Commands queued on one board are not sent by the other
+    boards["0"].rfg.addWrite(boards["0"].rfg.Registers["HK_CTRL"], 1)
+    assert len(boards["0"].rfg.commands) == 1
+    assert len(boards["1"].rfg.commands) == 0
+
+
+def test_shared_register_file_rejected():
+    board = drivers.boards.getCMODEmulatorDriver()
+    with pytest.raises(AssertionError):
+        MultiBoardDriver({"a": board, "b": board})
+
+
+def test_for_each_results_by_name():
+    async def run():
+        boards = emulatorBoards(3)
+        await boards.open()
+        values = {id(board): int(name) + 1 for name, board in boards.boards.items()}
+        await boards.forEach(lambda board: board.rfg.write_hk_ctrl(values[id(board)], flush=True))
+        results = await boards.forEach(lambda board: board.rfg.read_hk_ctrl())
+        await boards.close()
+        return results
+
+    assert asyncio.run(run()) == {"0": 1, "1": 2, "2": 3}
+
+
+def test_for_each_raises_board_error():
+    async def run():
+        boards = emulatorBoards(2)
+
+        async def failOnSecond(board):
+            if board is boards["1"]:
+                raise RuntimeError("board 1 failed")
+            return True
+
+        await boards.forEach(failOnSecond)
+
+    with pytest.raises(RuntimeError, match="board 1 failed"):
+        asyncio.run(run())
+
+
+def test_readout_read_all():
+    async def run():
+        boards = emulatorBoards(2, hitRate=0)
+        await boards.open()
+        ## Frames put in the emulated readout buffer of each board
+        for name, board in boards.boards.items():
+            board.rfg.io.readoutBuffer += bytes([2, int(name), 0xAA])
+        data = await boards.readoutReadAll()
+        await boards.close()
+        return data
+
+    assert asyncio.run(run()) == {"0": bytes([2, 0, 0xAA]), "1": bytes([2, 1, 0xAA])}
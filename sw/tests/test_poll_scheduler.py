@@ -0,0 +1,70 @@
+import logging
+
+import pytest
+
+from drivers.readout import AdaptivePollScheduler
+
+
+def test_idle_backs_off_to_max_interval():
+    scheduler = AdaptivePollScheduler(minInterval=0.001, maxInterval=0.02)
+    intervals = [scheduler.update(0, 0, now=i * 0.01) for i in range(7)]
+
+    assert intervals == pytest.approx([0.002, 0.004, 0.008, 0.016, 0.02, 0.02, 0.02])
+    assert scheduler.idlePolls == 7 and scheduler.burstPolls == 0
+
+
+def test_residual_polls_again_with_larger_reads():
+    scheduler = AdaptivePollScheduler(capacity=16384, readSize=4096)
+    assert scheduler.readSize(10000) == 4096
+
+    ## The read left data behind: the next poll is immediate and the read size doubles up to the capacity
+    assert scheduler.update(10000, 4096, now=0.0) == 0.0
+    assert scheduler.readSize(10000) == 8192
+    assert scheduler.update(10000, 8192, now=0.001) == 0.0
+    assert scheduler.readSize(20000) == 16384
+    assert scheduler.update(12000, 12000, now=0.002) == 0.0
+    assert scheduler.readSize(20000) == 16384
+    assert scheduler.burstPolls == 3
+
+    ## Back to idle, the read size halves down to its base
+    scheduler.update(0, 0, now=0.003)
+    assert scheduler.readSize(20000) == 8192
+    scheduler.update(0, 0, now=0.004)
+    scheduler.update(0, 0, now=0.005)
+    assert scheduler.readSize(20000) == 4096
+
+
+def test_steady_waits_for_target_fill():
+    scheduler = AdaptivePollScheduler(targetFill=512, minInterval=0.001, maxInterval=0.1, smoothing=1.0)
+    ## Without a fill rate estimation yet, the wait is the longest one
+    assert scheduler.update(100, 100, now=0.0) == pytest.approx(0.1)
+    ## 100 bytes in 10 ms: 10 kB/s, 512 bytes arrive in 51.2 ms
+    assert scheduler.update(100, 100, now=0.01) == pytest.approx(0.0512)
+    assert scheduler.fillRate == pytest.approx(10000)
+
+
+def test_inflow_excludes_residual():
+    scheduler = AdaptivePollScheduler(targetFill=512, minInterval=0.001, maxInterval=0.1, smoothing=1.0)
+    scheduler.update(1000, 600, now=0.0)
+    ## 400 of the 900 polled bytes were left by the previous read, 500 bytes arrived in 10 ms
+    wait = scheduler.update(900, 900, now=0.01)
+    assert scheduler.fillRate == pytest.approx(50000)
+    assert wait == pytest.approx(512 / 50000)
+
+
+def test_near_overflow_counted_and_warned_once_per_entry(caplog):
+    scheduler = AdaptivePollScheduler(capacity=1000, nearOverflowFraction=0.75)
+    with caplog.at_level(logging.WARNING, logger="drivers.readout.scheduler"):
+        for i, size in enumerate([800, 900, 100, 800, 0]):
+            scheduler.update(size, size, now=i * 0.01)
+
+    assert scheduler.nearOverflows == 3
+    assert scheduler.maxOccupancy == 900
+    assert len([record for record in caplog.records if "near overflow" in record.message]) == 2
+
+
+def test_reset_clears_state():
+    scheduler = AdaptivePollScheduler(readSize=1024)
+    scheduler.update(5000, 1024, now=0.0)
+    scheduler.reset()
+    assert scheduler.polls == 0 and scheduler.readSize(5000) == 1024 and scheduler.residual == 0
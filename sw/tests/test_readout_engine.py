@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from drivers.readout import ReadoutEngine
+
+
+class BufferBoard:
+    """Board driver stand in, its readout buffer holds the given chunks, one chunk is available per poll"""
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = list(chunks)
+        self.buffer = b""
+
+    async def readoutGetBufferSize(self) -> int:
+        if len(self.buffer) == 0 and len(self.chunks) > 0:
+            self.buffer = self.chunks.pop(0)
+        return len(self.buffer)
+
+    async def readoutReadBytes(self, count: int) -> bytes:
+        data, self.buffer = self.buffer[:count], self.buffer[count:]
+        return data
+
+
+CHUNKS = [bytes([i]) * (i + 1) for i in range(50)]
+
+
+async def runUntilRead(engine: ReadoutEngine, board: BufferBoard):
+    await engine.start()
+    while len(board.chunks) > 0 or len(board.buffer) > 0:
+        await asyncio.sleep(0)
+    await engine.stop()
+
+
+def test_all_chunks_delivered_in_order():
+    board = BufferBoard(CHUNKS)
+    engine = ReadoutEngine(board)
+    received = []
+    engine.addConsumer("store", received.append)
+    asyncio.run(runUntilRead(engine, board))
+
+    assert received == CHUNKS
+    assert engine.stats.reads == len(CHUNKS)
+    assert engine.stats.bytes == sum(len(chunk) for chunk in CHUNKS)
+
+
+def test_read_size_splits_chunks():
+    board = BufferBoard(CHUNKS)
+    engine = ReadoutEngine(board, readSize=8)
+    received = []
+    engine.addConsumer("store", received.append)
+    asyncio.run(runUntilRead(engine, board))
+
+    assert max(len(chunk) for chunk in received) == 8
+    assert b"".join(received) == b"".join(CHUNKS)
+
+
+def test_slow_consumer_backpressure_keeps_all_data():
+    board = BufferBoard(CHUNKS)
+    engine = ReadoutEngine(board, queueSize=2)
+    received = []
+
+    async def slowStore(chunk):
+        await asyncio.sleep(0.001)
+        received.append(chunk)
+
+    engine.addConsumer("store", slowStore)
+    asyncio.run(runUntilRead(engine, board))
+
+    assert received == CHUNKS
+    assert engine.stats.maxQueueOccupancy["store"] <= 2
+    assert engine.stats.droppedChunks["store"] == 0
+
+
+def test_full_monitor_queue_drops_chunks():
+    board = BufferBoard(CHUNKS)
+    engine = ReadoutEngine(board)
+    stored, monitored = [], []
+
+    async def run():
+        blocked = asyncio.Event()
+
+        async def monitor(chunk):
+            await blocked.wait()
+            monitored.append(chunk)
+
+        engine.addConsumer("store", stored.append)
+        engine.addConsumer("monitor", monitor, queueSize=4, dropWhenFull=True)
+        await engine.start()
+        while len(board.chunks) > 0 or len(board.buffer) > 0:
+            await asyncio.sleep(0)
+        blocked.set()
+        await engine.stop()
+
+    asyncio.run(run())
+
+    ## The monitor got its first chunk and the 4 queued ones, the others were dropped for it only
+    assert stored == CHUNKS
+    assert monitored == CHUNKS[:5]
+    assert engine.stats.droppedChunks["monitor"] == len(CHUNKS) - 5
+    assert engine.stats.droppedBytes["monitor"] == sum(len(chunk) for chunk in CHUNKS[5:])
+
+
+def test_consumer_error_raised_by_stop():
+    board = BufferBoard(CHUNKS)
+    engine = ReadoutEngine(board, queueSize=1)
+
+    def failing(chunk):
+        raise ValueError("consumer failed")
+
+    engine.addConsumer("failing", failing)
+
+    async def run():
+        await engine.start()
+        await asyncio.sleep(0.01)
+        await engine.stop()
+
+    with pytest.raises(ValueError, match="consumer failed"):
+        asyncio.run(run())
+
+
+def test_cancelled_run_stops_and_propagates():
+    board = BufferBoard(CHUNKS)
+    engine = ReadoutEngine(board, pollInterval=0.001)
+    received = []
+    engine.addConsumer("store", received.append)
+
+    async def run():
+        task = asyncio.create_task(engine.run())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert engine.acquisitionTask is None
+    assert engine.stats.stopTime is not None
+    assert all(consumer.task is None for consumer in engine.consumers)
+
+
+def test_run_duration():
+    engine = ReadoutEngine(BufferBoard([]), pollInterval=0.001)
+    asyncio.run(engine.run(0.02))
+    assert engine.stats.stopTime is not None and engine.stats.polls > 0
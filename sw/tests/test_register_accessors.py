@@ -0,0 +1,143 @@
+import asyncio
+
+import drivers.boards  ## Adds the firmware package to the path
+import rfg.core
+import rfg.discovery
+from rfg.core import RFGIOCommand
+
+
+class StreamIO(rfg.core.RFGIO):
+    """Records the written byte streams, each read returns its register address repeated"""
+
+    def __init__(self):
+        super().__init__()
+        self.streams: list[bytes] = []
+        self.responses = bytearray()
+
+    async def writeBytes(self, stream: bytearray):
+        self.streams.append(bytes(stream))
+        for address, length, _ in rfg.core.decodeReadRequests(stream):
+            self.responses += bytes([address]) * length
+
+    async def readBytes(self, count: int) -> bytes:
+        result = bytes(self.responses[:count])
+        del self.responses[:count]
+        return result
+
+
+def openRFG():
+    firmwareRF = rfg.discovery.loadOneFSPRFGOrFail()
+    io = StreamIO()
+    firmwareRF.withIODriver(io)
+    return firmwareRF, io
+
+
+REGISTERS = ["LAYER_0_CFG_CTRL", "LAYER_1_STATUS", "LAYER_2_STAT_FRAME_COUNTER", "LAYERS_FPGA_TIMESTAMP_CTRL", "HK_FIRMWARE_ID"]
+
+
+def test_layer_groups_resolve_registers():
+    firmwareRF, _ = openRFG()
+    assert firmwareRF.layer[2].cfg_ctrl.register is firmwareRF.Registers.LAYER_2_CFG_CTRL
+    assert firmwareRF.layer[0].stat_frame_counter.register is firmwareRF.Registers.LAYER_0_STAT_FRAME_COUNTER
+    assert firmwareRF.layer[0].stat_frame_counter.size == 4 and firmwareRF.layer[0].stat_frame_counter.increment
+    assert len(firmwareRF.layer) == 3
+
+
+def test_accessor_bytes_match_encoded_commands():
+    async def run():
+        firmwareRF, io = openRFG()
+        for name in REGISTERS:
+            register = firmwareRF.Registers[name]
+            info = firmwareRF.RegistersInfo[name]
+            accessor = firmwareRF.registerAccessors[name]
+
+            ## Read with the prepared request and with the encoded command
+            io.streams.clear()
+            value = await accessor.read()
+            expected = rfg.core.encodeCommands([RFGIOCommand.read(register, info.size, info.increment)])
+            assert io.streams == [expected], name
+            assert value == int.from_bytes(bytes([register.value]) * info.size, "little")
+
+            if info.write:
+                io.streams.clear()
+                await accessor.write(0x12, flush=True)
+                firmwareRF.addWrite(register, 0x12, info.increment, info.size)
+                await firmwareRF.flush()
+                assert io.streams[0] == io.streams[1], name
+
+    asyncio.run(run())
+
+
+def test_named_methods_use_accessors():
+    async def run():
+        firmwareRF, io = openRFG()
+        await firmwareRF.write_layer_2_cfg_ctrl(0x7, flush=True)
+        await firmwareRF.layer[2].cfg_ctrl.write(0x7, flush=True)
+        assert await firmwareRF.read_layer_2_cfg_ctrl() == firmwareRF.Registers.LAYER_2_CFG_CTRL.value
+        await firmwareRF.layer[2].cfg_ctrl.read()
+        return io.streams
+
+    streams = asyncio.run(run())
+    assert streams[0] == streams[1] and streams[2] == streams[3]
+
+
+def test_prepared_read_falls_back_with_pending_writes():
+    async def run():
+        firmwareRF, io = openRFG()
+        await firmwareRF.layer[0].cfg_ctrl.write(0x5)
+        value = await firmwareRF.layer[0].status.read()
+        return firmwareRF, io, value
+
+    firmwareRF, io, value = asyncio.run(run())
+    ## The pending write is sent in the same flush as the read
+    assert io.streams == [
+        bytes(
+            rfg.core.encodeCommands(
+                [
+                    writeCommand(firmwareRF.Registers.LAYER_0_CFG_CTRL, b"\x05"),
+                    RFGIOCommand.read(firmwareRF.Registers.LAYER_0_STATUS, 1),
+                ]
+            )
+        )
+    ]
+    assert value == firmwareRF.Registers.LAYER_0_STATUS.value
+
+
+def test_prepared_read_falls_back_with_shadow_cache():
+    async def run():
+        firmwareRF, io = openRFG()
+        firmwareRF.enableShadowCache([firmwareRF.Registers.LAYER_0_CFG_CTRL])
+        await firmwareRF.layer[0].cfg_ctrl.write(0x5, flush=True)
+        io.streams.clear()
+        return await firmwareRF.layer[0].cfg_ctrl.read(), io.streams
+
+    ## Read from the cache, without IO access
+    assert asyncio.run(run()) == (0x5, [])
+
+
+def test_prepared_read_falls_back_in_batch():
+    async def run():
+        firmwareRF, io = openRFG()
+        async with firmwareRF.batch() as b:
+            status = b.submit(firmwareRF.layer[0].status.read())
+            ctrl = b.submit(firmwareRF.layer[1].cfg_ctrl.read())
+        return firmwareRF, io.streams, status.result(), ctrl.result()
+
+    firmwareRF, streams, status, ctrl = asyncio.run(run())
+    ## Both reads grouped in the batch flush
+    assert streams == [
+        bytes(
+            rfg.core.encodeCommands(
+                [RFGIOCommand.read(firmwareRF.Registers.LAYER_0_STATUS, 1), RFGIOCommand.read(firmwareRF.Registers.LAYER_1_CFG_CTRL, 1)]
+            )
+        )
+    ]
+    assert (status, ctrl) == (firmwareRF.Registers.LAYER_0_STATUS.value, firmwareRF.Registers.LAYER_1_CFG_CTRL.value)
+
+
+def writeCommand(register, values: bytes) -> RFGIOCommand:
+    command = RFGIOCommand()
+    command.write = True
+    command.register = register
+    command.addValues(values)
+    return command
@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+import drivers.boards
+from test_shadow_cache import CountingEmulatorIO
+
+
+class GatedEmulatorIO(CountingEmulatorIO):
+    """Counting emulator which also counts the flushes, reads can be held until the gate is opened"""
+
+    def __init__(self, registerFile, **kwargs):
+        super().__init__(registerFile, **kwargs)
+        self.writes = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def writeBytes(self, bytes: bytearray):
+        self.writes += 1
+        await super().writeBytes(bytes)
+
+    async def readBytes(self, count: int) -> bytes:
+        await self.gate.wait()
+        return await super().readBytes(count)
+
+
+async def openDriver():
+    board = drivers.boards.getCMODDriver()
+    io = GatedEmulatorIO(board.rfg, hitRate=0)
+    board.rfg.withIODriver(io)
+    await board.open()
+
+    ## Record the reads of each round trip
+    rounds = []
+    readCommands = board.rfg.readCommands
+
+    async def recordReadCommands(commands):
+        rounds.append([cmd.register.name for cmd in commands])
+        return await readCommands(commands)
+
+    board.rfg.readCommands = recordReadCommands
+    io.reads = io.writes = 0
+    return board, io, rounds
+
+
+def test_reads_sent_in_one_round_trip():
+    async def run():
+        board, io, rounds = await openDriver()
+        io.writeRegisterValue(io.reg("SPI_LAYERS_CKDIVIDER"), 0x12)
+        async with board.rfg.batch() as b:
+            status = b.read_layer_0_status()
+            ctrl = b.read_layer_1_cfg_ctrl()
+            divider = b.read_spi_layers_ckdivider()
+        await board.close()
+        return (status.result(), ctrl.result(), divider.result()), rounds, io.writes
+
+    results, rounds, writes = asyncio.run(run())
+    assert results == (0x1, 0b111, 0x12)
+    assert rounds == [["LAYER_0_STATUS", "LAYER_1_CFG_CTRL", "SPI_LAYERS_CKDIVIDER"]]
+    assert writes == 1
+
+
+def test_multi_round_coroutines_regrouped():
+    async def readStatusThenCtrl(rfg, layer):
+        status = await rfg.layer[layer].status.read()
+        return status, await rfg.layer[layer].cfg_ctrl.read()
+
+    async def run():
+        board, io, rounds = await openDriver()
+        async with board.rfg.batch() as b:
+            tasks = [b.submit(readStatusThenCtrl(board.rfg, layer)) for layer in range(3)]
+        await board.close()
+        return [task.result() for task in tasks], rounds
+
+    results, rounds = asyncio.run(run())
+    assert results == [(0x1, 0b111)] * 3
+    assert rounds == [
+        ["LAYER_0_STATUS", "LAYER_1_STATUS", "LAYER_2_STATUS"],
+        ["LAYER_0_CFG_CTRL", "LAYER_1_CFG_CTRL", "LAYER_2_CFG_CTRL"],
+    ]
+
+
+def test_pending_writes_sent_with_reads():
+    async def run():
+        board, io, rounds = await openDriver()
+        async with board.rfg.batch() as b:
+            await board.rfg.write_hk_ctrl(0x5)
+            ctrl = b.read_hk_ctrl()
+        await board.close()
+        return ctrl.result(), io.writes, rounds
+
+    ctrl, writes, rounds = asyncio.run(run())
+    assert ctrl == 0x5
+    assert writes == 1
+    assert rounds == [["HK_CTRL"]]
+
+
+def test_writes_without_reads_flushed_on_exit():
+    async def run():
+        board, io, rounds = await openDriver()
+        async with board.rfg.batch():
+            await board.rfg.write_hk_ctrl(0x5)
+        await board.close()
+        return io.memory[io.reg("HK_CTRL")], io.writes, rounds
+
+    assert asyncio.run(run()) == (0x5, 1, [])
+
+
+def test_exception_in_block_cancels_tasks():
+    async def run():
+        board, io, rounds = await openDriver()
+        with pytest.raises(RuntimeError):
+            async with board.rfg.batch() as b:
+                status = b.read_layer_0_status()
+                raise RuntimeError("Failed in block")
+        ## Nothing was sent, the task is done
+        assert status.cancelled()
+        assert rounds == []
+        await board.close()
+
+    asyncio.run(run())
+
+
+def test_task_failure_reported_after_other_results():
+    async def failing():
+        raise ValueError("Failed task")
+
+    async def run():
+        board, io, rounds = await openDriver()
+        with pytest.raises(ValueError):
+            async with board.rfg.batch() as b:
+                status = b.read_layer_0_status()
+                b.submit(failing())
+        assert status.result() == 0x1
+        await board.close()
+
+    asyncio.run(run())
+
+
+def test_cancellation_while_reading_cancels_tasks():
+    async def run():
+        board, io, rounds = await openDriver()
+        io.gate.clear()
+        tasks = []
+
+        async def runBatch():
+            async with board.rfg.batch() as b:
+                tasks.append(b.read_layer_0_status())
+                tasks.append(b.read_layer_1_status())
+
+        batch = asyncio.create_task(runBatch())
+        while len(rounds) == 0:
+            await asyncio.sleep(0)
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+        assert all(task.cancelled() for task in tasks)
+        await board.close()
+
+    asyncio.run(run())
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+import drivers.boards  ## Adds the firmware package to the path
+import rfg.core
+import rfg.discovery
+from rfg.core import MAX_TRANSFER_LENGTH, RFGIOCommand
+
+
+class RecordingIO(rfg.core.RFGIO):
+    """Records the read requests of each flush and the read sizes, responses are a running byte counter"""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes: list[list[tuple[int, int, int]]] = []
+        self.readSizes: list[int] = []
+        self.responses = bytearray()
+        self.counter = 0
+
+    async def writeBytes(self, bytes: bytearray):
+        reads = rfg.core.decodeReadRequests(bytes)
+        self.flushes.append(reads)
+        for _, length, _ in reads:
+            self.responses += counterBytes(self.counter, length)
+            self.counter += length
+
+    async def readBytes(self, count: int) -> bytes:
+        self.readSizes.append(count)
+        result = bytes(self.responses[:count])
+        del self.responses[:count]
+        return result
+
+
+def counterBytes(start: int, count: int) -> bytes:
+    return bytes((start + i) & 0xFF for i in range(count))
+
+
+def openRFG():
+    firmwareRF = rfg.discovery.loadOneFSPRFGOrFail()
+    io = RecordingIO()
+    firmwareRF.withIODriver(io)
+    return firmwareRF, io
+
+
+def test_split_read_at_limit():
+    firmwareRF, _ = openRFG()
+    readout = firmwareRF.Registers["LAYERS_READOUT"]
+    assert [cmd.length for cmd in RFGIOCommand.splitRead(readout, MAX_TRANSFER_LENGTH)] == [MAX_TRANSFER_LENGTH]
+    assert [cmd.length for cmd in RFGIOCommand.splitRead(readout, MAX_TRANSFER_LENGTH + 1)] == [MAX_TRANSFER_LENGTH, 1]
+    assert [cmd.length for cmd in RFGIOCommand.splitRead(readout, 10, chunkSize=4)] == [4, 4, 2]
+
+
+def test_split_increment_read_beyond_limit_rejected():
+    firmwareRF, _ = openRFG()
+    register = firmwareRF.Registers["HK_FIRMWARE_ID"]
+    assert len(RFGIOCommand.splitRead(register, MAX_TRANSFER_LENGTH, increment=True)) == 1
+    with pytest.raises(ValueError):
+        RFGIOCommand.splitRead(register, MAX_TRANSFER_LENGTH + 1, increment=True)
+
+
+def test_large_read_split_in_one_flush():
+    async def run():
+        firmwareRF, io = openRFG()
+        readout = firmwareRF.Registers["LAYERS_READOUT"]
+        return await firmwareRF.syncRead(readout, 2 * MAX_TRANSFER_LENGTH + 10), io, readout
+
+    data, io, readout = asyncio.run(run())
+    assert data == counterBytes(0, 2 * MAX_TRANSFER_LENGTH + 10)
+    assert io.flushes == [[(readout.value, MAX_TRANSFER_LENGTH, 0), (readout.value, MAX_TRANSFER_LENGTH, 0), (readout.value, 10, 0)]]
+
+
+def test_read_chunks_yields_each_response():
+    async def run():
+        firmwareRF, io = openRFG()
+        readout = firmwareRF.Registers["LAYERS_READOUT"]
+        chunks = [chunk async for chunk in firmwareRF.syncReadChunks(readout, 10, chunkSize=4)]
+        return chunks, io
+
+    chunks, io = asyncio.run(run())
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert [bytes(chunk) for chunk in chunks] == [counterBytes(0, 4), counterBytes(4, 4), counterBytes(8, 2)]
+    ## All sub-reads sent in one flush
+    assert len(io.flushes) == 1 and io.readSizes == [4, 4, 2]
+
+
+def test_read_chunks_stopped_early_drains_responses():
+    async def run():
+        firmwareRF, io = openRFG()
+        readout = firmwareRF.Registers["LAYERS_READOUT"]
+        chunks = firmwareRF.syncReadChunks(readout, 10, chunkSize=4)
+        first = None
+        async for chunk in chunks:
+            first = bytes(chunk)
+            break
+        await chunks.aclose()
+
+        ## The dropped responses were received, the next read gets its own response
+        status = await firmwareRF.syncRead(firmwareRF.Registers["LAYER_0_STATUS"], 1)
+        return first, status, io
+
+    first, status, io = asyncio.run(run())
+    assert first == counterBytes(0, 4)
+    assert io.readSizes == [4, 4, 2, 1]
+    assert status == counterBytes(10, 1)
+    assert len(io.responses) == 0
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+import drivers.boards
+import rfg.daemon
+from drivers.astep.emulator import ASTEPEmulatorIO
+from rfg.io.socketio import SocketIO
+
+
+class FailingEmulatorIO(ASTEPEmulatorIO):
+    """Emulator failing the streams which write to HK_CTRL"""
+
+    async def writeBytes(self, bytes: bytearray):
+        if any(address == self.reg("HK_CTRL") for address, _, _ in self.writes(bytes)):
+            raise OSError("HK_CTRL write failed")
+        await super().writeBytes(bytes)
+
+    @staticmethod
+    def writes(stream: bytes):
+        offset = 0
+        while offset + 4 <= len(stream):
+            header, address, length = rfg.core.HEADER_FORMAT.unpack_from(stream, offset)
+            offset += 4
+            if header & 0x01:
+                yield address, length, header
+                offset += length
+
+
+async def startDaemon(path, io=None):
+    board = drivers.boards.getCMODDriver()
+    io = io or ASTEPEmulatorIO(board.rfg, hitRate=0)
+    daemon = rfg.daemon.RFGDaemon(io, [board.rfg.Registers["LAYERS_READOUT"].value])
+    await daemon.start(str(path))
+    return daemon, io
+
+
+async def openClient(path):
+    board = drivers.boards.getCMODDriver().selectSocketIO(str(path))
+    await board.open()
+    return board
+
+
+def test_clients_share_io(tmp_path):
+    async def run():
+        daemon, _ = await startDaemon(tmp_path / "rfg.sock")
+        first, second = await openClient(tmp_path / "rfg.sock"), await openClient(tmp_path / "rfg.sock")
+        await first.rfg.write_hk_ctrl(0x3, flush=True)
+        values = await asyncio.gather(second.rfg.read_hk_ctrl(), first.rfg.read_hk_firmware_id())
+        await first.close()
+        await second.close()
+        await daemon.stop()
+        return values
+
+    assert asyncio.run(run()) == [0x3, 0xAC03]
+
+
+def test_failed_read_reported_to_its_transaction(tmp_path):
+    async def run():
+        board = drivers.boards.getCMODDriver()
+        daemon, _ = await startDaemon(tmp_path / "rfg.sock", FailingEmulatorIO(board.rfg, hitRate=0))
+        client = await openClient(tmp_path / "rfg.sock")
+        client.rfg.addWrite(client.rfg.Registers["HK_CTRL"], 1)
+        with pytest.raises(RuntimeError, match="HK_CTRL write failed"):
+            await client.rfg.read_hk_firmware_id()
+        ## The next read is not affected
+        value = await client.rfg.read_hk_firmware_id()
+        await client.close()
+        await daemon.stop()
+        return value
+
+    assert asyncio.run(run()) == 0xAC03
+
+
+def test_failed_write_closes_client(tmp_path):
+    async def run():
+        board = drivers.boards.getCMODDriver()
+        daemon, _ = await startDaemon(tmp_path / "rfg.sock", FailingEmulatorIO(board.rfg, hitRate=0))
+        failing, other = await openClient(tmp_path / "rfg.sock"), await openClient(tmp_path / "rfg.sock")
+        await failing.rfg.write_hk_ctrl(0x1, flush=True)
+        ## The error is not delivered to the next, unrelated read
+        with pytest.raises(ConnectionError):
+            await failing.rfg.read_hk_firmware_id()
+        value = await other.rfg.read_hk_firmware_id()
+        await failing.close()
+        await other.close()
+        await daemon.stop()
+        return value
+
+    assert asyncio.run(run()) == 0xAC03
+
+
+def test_priority_transactions_served_first():
+    daemon = rfg.daemon.RFGDaemon(None, [0x10])
+    slow = rfg.daemon.RFGDaemonClient("slow", None)
+    readout = rfg.daemon.RFGDaemonClient("readout", None)
+    daemon.clients = [slow, readout]
+    slow.pending.append((b"", [(0x20, 1, 0)], False))
+    readout.pending.append((b"", [(0x10, 4, 0)], True))
+    readout.pending.append((b"", [(0x10, 4, 0)], True))
+
+    order = []
+    while (selected := daemon.nextTransaction()) is not None:
+        order.append(selected[0].name)
+    assert order == ["readout", "readout", "slow"]
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+import drivers.boards  ## Adds the firmware package to the path
+import rfg.core
+import rfg.discovery
+
+
+class VChannelIO(rfg.core.RFGIO):
+    """IO echoing the vchannel of each read like SPI framing, the responses are held until released and can be reordered
+
+    Each read returns its register address repeated length times
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.requests: list[tuple[int, int, int]] = []
+        self.responses: list[tuple[int, bytes]] = []
+        self.released = asyncio.Event()
+        self.released.set()
+        self.reorder = None
+        self.error: BaseException | None = None
+
+    async def writeBytes(self, bytes: bytearray):
+        for address, length, vchannel in rfg.core.decodeReadRequests(bytes):
+            self.requests.append((address, length, vchannel))
+            self.responses.append((vchannel, responseBytes(address, length)))
+
+    async def readBytes(self, count: int) -> bytes:
+        await self.released.wait()
+        if self.error is not None:
+            raise self.error
+        if self.reorder is not None:
+            self.responses = self.reorder(self.responses)
+            self.reorder = None
+        self.lastReadChannel, payload = self.responses.pop(0)
+        return payload
+
+
+def responseBytes(address: int, length: int) -> bytes:
+    return bytes([address]) * length
+
+
+def openRFG(outstanding: int = 4):
+    firmwareRF = rfg.discovery.loadOneFSPRFGOrFail()
+    io = VChannelIO()
+    firmwareRF.withIODriver(io)
+    firmwareRF.setMaxOutstandingReads(outstanding)
+    return firmwareRF, io
+
+
+REGISTERS = ["LAYER_0_STATUS", "LAYER_1_STATUS", "LAYER_2_STATUS"]
+
+
+async def startReads(firmwareRF, io):
+    """Starts a read of each register in REGISTERS while the responses are held, returns once all are in flight"""
+    io.released.clear()
+    tasks = [asyncio.create_task(firmwareRF.syncRead(firmwareRF.Registers[name], 2)) for name in REGISTERS]
+    while len(io.requests) < len(REGISTERS):
+        await asyncio.sleep(0)
+    return tasks
+
+
+def test_reads_in_flight_resolved_in_order():
+    async def run():
+        firmwareRF, io = openRFG()
+        tasks = await startReads(firmwareRF, io)
+        io.released.set()
+        return await asyncio.gather(*tasks), io.requests, firmwareRF
+
+    results, requests, firmwareRF = asyncio.run(run())
+    assert results == [responseBytes(firmwareRF.Registers[name].value, 2) for name in REGISTERS]
+    ## All reads were sent before the first response, each on its own vchannel
+    assert [vchannel for _, _, vchannel in requests] == [1, 2, 3]
+
+
+def test_outstanding_reads_limited():
+    async def run():
+        firmwareRF, io = openRFG(outstanding=2)
+        io.released.clear()
+        tasks = [asyncio.create_task(firmwareRF.syncRead(firmwareRF.Registers[name], 2)) for name in REGISTERS]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        inflight = len(io.requests)
+        io.released.set()
+        await asyncio.gather(*tasks)
+        return inflight
+
+    assert asyncio.run(run()) == 2
+
+
+def test_out_of_order_responses_fail_all_reads():
+    async def run():
+        firmwareRF, io = openRFG()
+        tasks = await startReads(firmwareRF, io)
+        ## The firmware answers the second read first
+        io.reorder = lambda responses: [responses[1], responses[0]] + responses[2:]
+        io.released.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(run())
+    ## Responses are matched in request order, a mismatching vchannel fails every read in flight instead of returning wrong data
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert "vchannel 2 while expecting vchannel 1" in str(results[0])
+
+
+def test_unknown_vchannel_fails_read():
+    async def run():
+        firmwareRF, io = openRFG()
+        io.reorder = lambda responses: [(9, payload) for _, payload in responses]
+        with pytest.raises(RuntimeError, match="vchannel 9"):
+            await firmwareRF.syncRead(firmwareRF.Registers["LAYER_0_STATUS"], 1)
+
+    asyncio.run(run())
+
+
+def test_io_error_fails_pending_reads_then_recovers():
+    async def run():
+        firmwareRF, io = openRFG()
+        tasks = await startReads(firmwareRF, io)
+        io.error = OSError("Link lost")
+        io.released.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert len(firmwareRF.inflightReads) == 0
+
+        ## The failed responses are dropped by the IO, later reads work again
+        io.error = None
+        io.responses.clear()
+        value = await firmwareRF.syncRead(firmwareRF.Registers["LAYER_0_STATUS"], 1)
+        return results, value, firmwareRF
+
+    results, value, firmwareRF = asyncio.run(run())
+    assert all(isinstance(result, OSError) for result in results)
+    assert value == responseBytes(firmwareRF.Registers["LAYER_0_STATUS"].value, 1)
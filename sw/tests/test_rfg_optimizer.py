@@ -0,0 +1,103 @@
+import asyncio
+
+import drivers.boards
+import rfg.core
+from rfg.optimizer import RFGCommandOptimizer
+
+
+class Registers(rfg.core.RFGRegister):
+    CTRL = 0x10
+    STATUS = 0x11
+    SR_OUT = 0x20
+    WIDE = 0x30
+    WIDE_HIGH = 0x31
+
+
+def write(register, values, increment=False) -> rfg.core.RFGIOCommand:
+    cmd = rfg.core.RFGIOCommand()
+    cmd.write = True
+    cmd.register = register
+    cmd.addressIncrement = increment
+    cmd.addValues(bytes(values))
+    return cmd
+
+
+def read(register, count=1) -> rfg.core.RFGIOCommand:
+    return rfg.core.RFGIOCommand.read(register, count)
+
+
+def summary(commands) -> list:
+    return [(cmd.register, bytes(cmd.values)) if cmd.write else ("read", cmd.register, cmd.length) for cmd in commands]
+
+
+def test_state_register_repeated_value_removed():
+    optimizer = RFGCommandOptimizer(stateRegisters=[Registers.CTRL])
+    optimized = optimizer.optimize([write(Registers.CTRL, [1]), read(Registers.STATUS), write(Registers.CTRL, [1])])
+    assert summary(optimized) == [(Registers.CTRL, b"\x01"), ("read", Registers.STATUS, 1)]
+
+
+def test_state_register_pulse_kept():
+    optimizer = RFGCommandOptimizer(stateRegisters=[Registers.CTRL])
+    optimized = optimizer.optimize([write(Registers.CTRL, [1, 1, 0, 0, 1])])
+    assert summary(optimized) == [(Registers.CTRL, b"\x01\x00\x01")]
+
+
+def test_adjacent_writes_merged():
+    optimizer = RFGCommandOptimizer(stateRegisters=[Registers.CTRL])
+    optimized = optimizer.optimize([write(Registers.CTRL, [1]), write(Registers.CTRL, [0]), write(Registers.CTRL, [0])])
+    assert summary(optimized) == [(Registers.CTRL, b"\x01\x00")]
+
+
+def test_repeat_limit():
+    optimizer = RFGCommandOptimizer(repeatLimits={Registers.SR_OUT: 2})
+    optimized = optimizer.optimize([write(Registers.SR_OUT, [5, 5, 5, 5, 7, 7, 7, 5])])
+    assert summary(optimized) == [(Registers.SR_OUT, b"\x05\x05\x07\x07\x05")]
+
+
+def test_other_registers_unchanged():
+    optimizer = RFGCommandOptimizer(stateRegisters=[Registers.CTRL])
+    commands = [write(Registers.SR_OUT, [1, 1, 1]), write(Registers.STATUS, [2]), write(Registers.STATUS, [2])]
+    ## Values are kept, consecutive writes are only merged
+    assert summary(optimizer.optimize(commands)) == [(Registers.SR_OUT, b"\x01\x01\x01"), (Registers.STATUS, b"\x02\x02")]
+    ## Inputs are not modified
+    assert bytes(commands[0].values) == b"\x01\x01\x01"
+
+
+def test_reads_kept_in_order():
+    optimizer = RFGCommandOptimizer(stateRegisters=[Registers.CTRL])
+    commands = [read(Registers.STATUS), write(Registers.CTRL, [1]), read(Registers.STATUS, 4), write(Registers.CTRL, [2])]
+    assert summary(optimizer.optimize(commands)) == summary(commands)
+
+
+def test_overlapping_write_forgets_value():
+    ## WIDE_HIGH is also written by the 2 bytes incremented write to WIDE
+    optimizer = RFGCommandOptimizer(stateRegisters=[Registers.WIDE, Registers.WIDE_HIGH])
+    commands = [write(Registers.WIDE_HIGH, [1]), write(Registers.WIDE, [0, 2], increment=True), write(Registers.WIDE_HIGH, [1])]
+    assert summary(optimizer.optimize(commands)) == summary(commands)
+
+
+def test_report_counts_bytes():
+    optimizer = RFGCommandOptimizer(stateRegisters=[Registers.CTRL])
+    optimizer.optimize([write(Registers.CTRL, [1, 1, 1, 1])])
+    report = optimizer.report()
+    assert report["bytes_in"] == 8 and report["bytes_out"] == 5
+    assert abs(optimizer.reduction() - 3 / 8) < 1e-9
+
+
+def test_same_firmware_state_with_optimizer():
+    async def configure(optimize: bool) -> bytes:
+        board = drivers.boards.getCMODEmulatorDriver(hitRate=0)
+        optimizer = board.enableCommandOptimizer() if optimize else None
+        await board.open()
+        for _ in range(3):
+            await board.rfg.write_hk_ctrl(0x1)
+            await board.rfg.write_hk_ctrl(0x1)
+            await board.rfg.write_layer_0_cfg_ctrl(0x4)
+            await board.rfg.write_layer_0_cfg_ctrl(0x0)
+        await board.rfg.write_layer_0_cfg_ctrl(0x4, flush=True)
+        await board.close()
+        if optimizer is not None:
+            assert optimizer.bytesOut < optimizer.bytesIn
+        return bytes(board.rfg.io.memory)
+
+    assert asyncio.run(configure(True)) == asyncio.run(configure(False))
@@ -0,0 +1,54 @@
+import asyncio
+import json
+import time
+
+import drivers.boards
+
+
+def test_disabled_stats_are_not_timed(monkeypatch):
+    def noClock():
+        raise AssertionError("perf_counter_ns called with statistics disabled")
+
+    async def run():
+        board = drivers.boards.getCMODEmulatorDriver(hitRate=0)
+        await board.open()
+        monkeypatch.setattr(time, "perf_counter_ns", noClock)
+        await board.rfg.write_hk_ctrl(0x3, flush=True)
+        value = await board.rfg.read_hk_ctrl()
+        chunks = [bytes(chunk) async for chunk in board.rfg.syncReadChunks(board.rfg.Registers["LAYERS_READOUT"], 8, chunkSize=4)]
+        monkeypatch.undo()
+        await board.close()
+        return value, chunks
+
+    value, chunks = asyncio.run(run())
+    assert value == 0x3
+    assert chunks == [b"\xff" * 4] * 2
+
+
+def test_enabled_stats_count_transactions():
+    async def run():
+        board = drivers.boards.getCMODEmulatorDriver(hitRate=0)
+        stats = board.rfg.enableStats()
+        await board.open()
+        await board.rfg.write_hk_ctrl(0x3, flush=True)
+        await board.rfg.read_hk_ctrl()
+        await board.rfg.read_hk_ctrl()
+        await board.close()
+        return stats
+
+    stats = asyncio.run(run())
+    assert stats.registerWrites["HK_CTRL"] == 1
+    assert stats.registerReads["HK_CTRL"] == 2
+    ## One flush for the write, one per read request
+    assert stats.flushCount == 3
+    assert stats.bytesReceived == 2
+    assert json.loads(stats.toJSON())["flush_count"] == 3
+    assert "rfg_flush_total 3" in stats.toPrometheus()
+
+
+def test_disable_stats_detaches_io():
+    board = drivers.boards.getCMODEmulatorDriver(hitRate=0)
+    board.rfg.enableStats()
+    assert board.rfg.io.stats is board.rfg.stats
+    board.rfg.disableStats()
+    assert board.rfg.stats is None and board.rfg.io.stats is None
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+import pytest
+
+from rfg.io.ringbuffer import ByteRingBuffer
+
+
+def test_write_read_wraps_around():
+    ring = ByteRingBuffer(8)
+    assert ring.write(b"abcdef") == 6
+    assert ring.read(4) == b"abcd"
+    ## Wraps over the end of the storage
+    assert ring.write(b"ghijkl") == 6
+    assert ring.available() == 8 and ring.free() == 0
+    assert ring.read(8) == b"efghijkl"
+    assert ring.available() == 0
+
+
+def test_write_stops_when_full():
+    ring = ByteRingBuffer(4)
+    assert ring.write(b"abcdef") == 4
+    assert ring.write(b"x") == 0
+    assert ring.read(10) == b"abcd"
+
+
+def test_clear():
+    ring = ByteRingBuffer(4)
+    ring.write(b"abc")
+    ring.clear()
+    assert ring.available() == 0 and ring.free() == 4
+
+
+def test_read_exactly_waits_for_producer_thread():
+    ring = ByteRingBuffer(16)
+    data = bytes(range(256)) * 8
+
+    def produce():
+        offset = 0
+        while offset < len(data):
+            offset += ring.write(data[offset : offset + 5])
+
+    async def run():
+        producer = threading.Thread(target=produce)
+        producer.start()
+        ## Larger than the capacity: read in parts as the producer fills the buffer
+        result = await asyncio.wait_for(ring.readExactly(len(data)), 10)
+        producer.join()
+        return result
+
+    assert asyncio.run(run()) == data
+
+
+def test_read_exactly_timeout():
+    ring = ByteRingBuffer(16)
+    ring.write(b"ab")
+
+    async def run():
+        await asyncio.wait_for(ring.readExactly(4), 0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+
+
+def test_read_exactly_timeout_keeps_partial_data():
+    ring = ByteRingBuffer(8)
+
+    async def run():
+        ring.write(b"abc")
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(ring.readExactly(6), 0.05)
+        ## The 3 bytes taken before the timeout are returned first, the stream stays aligned
+        ring.write(b"def")
+        first = await asyncio.wait_for(ring.readExactly(2), 1)
+        ring.write(b"gh")
+        second = await asyncio.wait_for(ring.readExactly(6), 1)
+        return first, second
+
+    assert asyncio.run(run()) == (b"ab", b"cdefgh")
+    assert ring.available() == 0 and len(ring.partial) == 0
@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+import pytest
+
+from drivers.readout import ReadoutEngine, RunFileReader, RunFileWriter
+
+CHUNKS = [bytes([i % 256]) * (100 + i) for i in range(40)]
+
+
+def writeRun(path, close: bool = True):
+    writer = RunFileWriter(str(path), metadata={"script": "test"}, layerMask=0b101, indexSpacing=1000)
+    for i, chunk in enumerate(CHUNKS):
+        writer.write(chunk, layerMask=0b001 if i == 3 else None, hostTime=10.0 + i)
+    if close:
+        writer.close()
+    else:
+        writer.flush()
+    return writer
+
+
+@pytest.mark.parametrize("close", [True, False])
+def test_round_trip(tmp_path, close):
+    writeRun(tmp_path / "run.run", close=close)
+    with RunFileReader(str(tmp_path / "run.run")) as reader:
+        assert reader.complete == close
+        assert reader.metadata["script"] == "test"
+        assert len(reader) == len(CHUNKS)
+        ## One entry per 1000 bytes, or the default spacing when the index was rebuilt because the writer was not closed
+        assert len(reader.indexOffsets) == (6 if close else 1)
+        chunks = list(reader)
+    assert [chunk.data for chunk in chunks] == CHUNKS
+    assert [chunk.sequence for chunk in chunks] == list(range(len(CHUNKS)))
+    assert [chunk.hostTime for chunk in chunks] == [10.0 + i for i in range(len(CHUNKS))]
+    assert chunks[3].layerMask == 0b001 and chunks[4].layerMask == 0b101
+
+
+def test_seek(tmp_path):
+    writeRun(tmp_path / "run.run")
+    with RunFileReader(str(tmp_path / "run.run")) as reader:
+        assert reader.startTime() == 10.0
+        assert reader.seekTime(0.0) == 0
+        assert reader.seekTime(25.0) == 15
+        assert reader.seekTime(25.5) == 16
+        assert reader.seekTime(100.0) == len(CHUNKS)
+        assert [chunk.sequence for chunk in reader.chunks(17, 21)] == [17, 18, 19, 20]
+        assert reader.chunk(33).data == CHUNKS[33]
+        with pytest.raises(IndexError):
+            reader.chunk(len(CHUNKS))
+
+
+def test_not_a_run_file(tmp_path):
+    (tmp_path / "run.bin").write_bytes(b"\x0b" * 64)
+    with pytest.raises(ValueError):
+        RunFileReader(str(tmp_path / "run.bin"))
+
+
+class TimedBoard:
+    """Board driver stand in returning one chunk per poll, and recording the time of the reads"""
+
+    def __init__(self):
+        self.chunks = list(CHUNKS[:10])
+        self.readTimes = []
+
+    async def readoutGetBufferSize(self) -> int:
+        return len(self.chunks[0]) if len(self.chunks) > 0 else 0
+
+    async def readoutReadBytes(self, count: int) -> bytes:
+        self.readTimes.append(time.monotonic())
+        return self.chunks.pop(0)
+
+
+class SlowRunFileWriter(RunFileWriter):
+    """Run file writer slower than the reads, the chunks wait in the writer queue"""
+
+    def write(self, data, layerMask=None, hostTime=None) -> int:
+        time.sleep(0.002)
+        return super().write(data, layerMask, hostTime)
+
+
+def test_engine_writes_read_time(tmp_path):
+    board = TimedBoard()
+
+    async def run():
+        engine = ReadoutEngine(board)
+        with SlowRunFileWriter(str(tmp_path / "run.run")) as writer:
+            engine.addFileWriter(writer)
+            await engine.start()
+            while len(board.chunks) > 0:
+                await asyncio.sleep(0)
+            await engine.stop()
+
+    asyncio.run(run())
+    with RunFileReader(str(tmp_path / "run.run")) as reader:
+        chunks = list(reader)
+    assert [chunk.data for chunk in chunks] == CHUNKS[:10]
+    ## Each chunk time is taken after its read and before the next one
+    readTimes = board.readTimes + [float("inf")]
+    for i, chunk in enumerate(chunks):
+        assert readTimes[i] <= chunk.hostTime < readTimes[i + 1]
@@ -0,0 +1,76 @@
+import asyncio
+
+import drivers.boards
+from drivers.astep.emulator import ASTEPEmulatorIO
+
+
+class CountingEmulatorIO(ASTEPEmulatorIO):
+    """Emulator counting the reads sent to the firmware"""
+
+    def __init__(self, registerFile, **kwargs):
+        super().__init__(registerFile, **kwargs)
+        self.reads = 0
+
+    async def readBytes(self, count: int) -> bytes:
+        self.reads += 1
+        return await super().readBytes(count)
+
+
+async def openDriver():
+    board = drivers.boards.getCMODDriver()
+    io = CountingEmulatorIO(board.rfg, hitRate=0)
+    board.rfg.withIODriver(io)
+    await board.open()
+    board.enableShadowCache()
+    return board, io
+
+
+def test_cached_read_skips_io():
+    async def run():
+        board, io = await openDriver()
+        await board.rfg.write_hk_ctrl(0x5, flush=True)
+        assert await board.rfg.read_hk_ctrl() == 0x5
+        assert io.reads == 0
+        await board.close()
+
+    asyncio.run(run())
+
+
+def test_first_read_fills_cache():
+    async def run():
+        board, io = await openDriver()
+        io.writeRegisterValue(io.reg("SPI_LAYERS_CKDIVIDER"), 0x12)
+        assert await board.rfg.read_spi_layers_ckdivider() == 0x12
+        assert await board.rfg.read_spi_layers_ckdivider() == 0x12
+        assert io.reads == 1
+        await board.close()
+
+    asyncio.run(run())
+
+
+def test_invalidate_forces_read():
+    async def run():
+        board, io = await openDriver()
+        await board.rfg.write_hk_ctrl(0x5, flush=True)
+        ## Firmware reset behind the host
+        io.writeRegisterValue(io.reg("HK_CTRL"), 0)
+        assert await board.rfg.read_hk_ctrl() == 0x5
+
+        board.invalidateShadowCache()
+        assert await board.rfg.read_hk_ctrl() == 0
+        assert io.reads == 1
+        await board.close()
+
+    asyncio.run(run())
+
+
+def test_clock_ctrl_not_cached():
+    async def run():
+        board, io = await openDriver()
+        await board.rfg.write_clock_ctrl(0x1, flush=True)
+        assert (await board.rfg.read_clock_ctrl() >> 2) & 0x1 == 1
+        assert await board.rfg.read_clock_ctrl() is not None
+        assert io.reads == 2
+        await board.close()
+
+    asyncio.run(run())
@@ -0,0 +1,122 @@
+import asyncio
+
+import drivers.boards
+from drivers.astep.emulator import ASTEPEmulatorIO
+
+## Frames of 12 bytes ending with 0xFF bytes, which are also the filler of the empty buffer
+FRAMES = [bytes([11, layer]) + bytes(range(1, 9)) + b"\xFF\xFF" for layer in range(3)]
+
+
+class LateFrameEmulatorIO(ASTEPEmulatorIO):
+    """Emulator where a frame arrives in the readout buffer right after its size was read"""
+
+    def __init__(self, registerFile, **kwargs):
+        super().__init__(registerFile, hitRate=0, **kwargs)
+        self.lateFrames: list[bytes] = []
+
+    def read(self, address: int, length: int, increment: bool) -> bytes:
+        result = super().read(address, length, increment)
+        if address == self.reg("LAYERS_READOUT_READ_SIZE") and len(self.lateFrames) > 0:
+            self.readoutBuffer += self.lateFrames.pop(0)
+        return result
+
+
+async def openDriver():
+    board = drivers.boards.getCMODDriver()
+    io = LateFrameEmulatorIO(board.rfg)
+    board.rfg.withIODriver(io)
+    await board.open()
+    return board, io
+
+
+def test_filler_cut_after_size():
+    async def run():
+        board, io = await openDriver()
+        io.readoutBuffer += FRAMES[0] + b"\xBC"
+        size, data = await board.readoutReadSpeculative(64)
+        await board.close()
+        return size, data
+
+    assert asyncio.run(run()) == (13, FRAMES[0] + b"\xBC")
+
+
+def test_frame_arriving_after_size_is_kept():
+    async def run():
+        board, io = await openDriver()
+        io.readoutBuffer += FRAMES[0]
+        io.lateFrames.append(FRAMES[1])
+        size, data = await board.readoutReadSpeculative(64)
+        ## Nothing is left in the buffer, the late frame was read with its trailing 0xFF bytes
+        assert len(io.readoutBuffer) == 0
+        await board.close()
+        return size, data
+
+    assert asyncio.run(run()) == (12, FRAMES[0] + FRAMES[1])
+
+
+def test_frame_split_across_reads():
+    async def run():
+        board, io = await openDriver()
+        io.readoutBuffer += FRAMES[0][:6]
+        ## The frame end arrives after the first read, then the second read cuts the filler after it
+        _, first = await board.readoutReadSpeculative(6)
+        io.readoutBuffer += FRAMES[0][6:]
+        io.lateFrames.append(FRAMES[2])
+        size, second = await board.readoutReadSpeculative(64)
+        await board.close()
+        return first + second, size
+
+    data, size = asyncio.run(run())
+    assert size == 6
+    assert data == FRAMES[0] + FRAMES[2]
+
+
+def test_adaptive_chunk_reads_everything():
+    async def run():
+        board, io = await openDriver()
+        expected = b"".join(FRAMES * 20)
+        io.readoutBuffer += expected
+        read = b""
+        sizes = []
+        for _ in range(4):
+            size, data = await board.readoutReadSpeculative()
+            sizes.append(board.readoutChunkSize)
+            read += data
+        await board.close()
+        return expected, read, sizes
+
+    expected, read, sizes = asyncio.run(run())
+    assert read == expected
+    ## The chunk follows the occupancy while it decreases, without dropping to 0 when the buffer is idle
+    assert sizes[0] > sizes[1] > sizes[2] > sizes[3] >= drivers.boards.board_driver.BoardDriver.READOUT_MIN_CHUNK_SIZE
+
+
+def test_engine_dispatches_frames_read_after_an_empty_size():
+    from drivers.readout import ReadoutEngine
+
+    async def run():
+        board, io = await openDriver()
+        ## The buffer is empty when its size is read, the frames arrive before the data read
+        io.lateFrames += [FRAMES[0], FRAMES[1]]
+        engine = ReadoutEngine(board, speculative=True, readSize=64)
+        received = []
+        engine.addConsumer("store", received.append)
+        await engine.start()
+        while len(io.lateFrames) > 0:
+            await asyncio.sleep(0)
+        await engine.stop()
+        await board.close()
+        return engine, received
+
+    engine, received = asyncio.run(run())
+    assert b"".join(received) == FRAMES[0] + FRAMES[1]
+    assert engine.stats.bytes == 2 * len(FRAMES[0])
+
+
+def test_engine_rejects_scheduler_with_speculative():
+    import pytest
+
+    from drivers.readout import AdaptivePollScheduler, ReadoutEngine
+
+    with pytest.raises(ValueError):
+        ReadoutEngine(None, speculative=True, scheduler=AdaptivePollScheduler())
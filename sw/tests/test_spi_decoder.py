@@ -0,0 +1,40 @@
+from rfg.io.spi import SPIBytesDecoder
+
+
+def test_frame_after_idle_bytes():
+    decoder = SPIBytesDecoder()
+    decoder.expectReadLength(3)
+    buffer = bytearray(b"\xbc\xbc\x05\x01\x02\x03\xbc")
+    assert decoder.decodeBuffer(buffer) == b"\x01\x02\x03"
+    assert decoder.lastFrameQueue == 0x05
+    ## Trailing bytes are kept for the next frame
+    assert buffer == bytearray(b"\xbc")
+
+
+def test_incomplete_frame():
+    decoder = SPIBytesDecoder()
+    decoder.expectReadLength(4)
+    buffer = bytearray(b"\xbc\x02\x01")
+    assert decoder.decodeBuffer(buffer) is None
+    ## Leading idle bytes are dropped, the frame start is kept
+    assert buffer == bytearray(b"\x02\x01")
+    buffer += b"\x02\x03\x04"
+    assert decoder.decodeBuffer(buffer) == b"\x01\x02\x03\x04"
+    assert buffer == bytearray()
+
+
+def test_only_idle_bytes():
+    decoder = SPIBytesDecoder()
+    buffer = bytearray(b"\xbc" * 10)
+    assert decoder.decodeBuffer(buffer) is None
+    assert len(buffer) == 0
+    assert decoder.lastFrameQueue is None
+
+
+def test_consecutive_frames():
+    decoder = SPIBytesDecoder()
+    decoder.expectReadLength(1)
+    buffer = bytearray(b"\x01\xaa\xbc\x02\xbb")
+    assert decoder.decodeBuffer(buffer) == b"\xaa"
+    assert decoder.decodeBuffer(buffer) == b"\xbb"
+    assert decoder.lastFrameQueue == 0x02
@@ -0,0 +1,135 @@
+import asyncio
+import importlib.machinery
+import importlib.util
+import sys
+import types
+
+import rfg.core
+
+
+## Like scripts/benchmarks/bench_spidev_duplex.py, spidev and gpiod are only used by SPIDEVIO.open(), which is not called here
+def placeholderModule(name: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__spec__ = importlib.machinery.ModuleSpec(name, None)
+    sys.modules[name] = module
+    return module
+
+
+if importlib.util.find_spec("spidev") is None:
+    placeholderModule("spidev")
+if importlib.util.find_spec("gpiod") is None:
+    placeholderModule("gpiod").line = placeholderModule("gpiod.line")
+    sys.modules["gpiod.line"].Direction = sys.modules["gpiod.line"].Value = None
+
+import rfg.io.spidev
+
+
+class Registers(rfg.core.RFGRegister):
+    CTRL = 0x10
+    STATUS = 0x11
+    COUNTER = 0x12
+
+
+class ScriptedSpiDev:
+    """Records the full duplex transfers and returns the scripted MISO bytes of each one, padded with 0xBC idle bytes"""
+
+    def __init__(self, responses: list[bytes]):
+        self.responses = list(responses)
+        self.transfers: list[bytes] = []
+
+    def xfer3(self, data) -> tuple:
+        self.transfers.append(bytes(data))
+        miso = self.responses.pop(0) if len(self.responses) > 0 else b""
+        return tuple((miso + b"\xBC" * len(data))[: len(data)])
+
+    def readbytes(self, count: int) -> list:
+        raise AssertionError("Full duplex reads must not need a read transfer")
+
+
+def openIO(responses: list[bytes]) -> rfg.io.spidev.SPIDEVIO:
+    io = rfg.io.spidev.SPIDEVIO("/dev/null", "/dev/null", 0, fullDuplex=True)
+    io.spiDev = ScriptedSpiDev(responses)
+    return io
+
+
+def writeCommand(register, values: bytes) -> rfg.core.RFGIOCommand:
+    command = rfg.core.RFGIOCommand()
+    command.write = True
+    command.register = register
+    command.addValues(values)
+    return command
+
+
+MIXED = rfg.core.encodeCommands(
+    [
+        writeCommand(Registers.CTRL, b"\x01\x02\x03"),
+        rfg.core.RFGIOCommand.read(Registers.STATUS, 1),
+        writeCommand(Registers.CTRL, b"\x04"),
+        rfg.core.RFGIOCommand.read(Registers.COUNTER, 4, increment=True),
+    ]
+)
+
+
+def test_expected_response_length_of_mixed_batch():
+    ## One frame start byte and the payload per read, write payloads are skipped even if they look like read headers
+    assert rfg.io.spidev.expectedResponseLength(MIXED) == (1 + 1) + (1 + 4)
+    writes = rfg.core.encodeCommands([writeCommand(Registers.CTRL, b"\x02\x11\x04\x00")])
+    assert rfg.io.spidev.expectedResponseLength(writes) == 0
+
+
+def test_responses_decoded_from_the_command_transfer():
+    async def run():
+        io = openIO([b"\xBC\xBC\x01\x55\x02\x01\x02\x03\x04"])
+        await io.writeBytes(MIXED)
+        status = await io.readBytes(1)
+        statusChannel = io.lastReadChannel
+        counter = await io.readBytes(4)
+        return io, status, statusChannel, counter
+
+    io, status, statusChannel, counter = asyncio.run(run())
+    assert (status, statusChannel, counter) == (b"\x55", 0x01, b"\x01\x02\x03\x04")
+    ## One transfer: commands, dummy byte, and clocking for the responses with a 5 bytes margin
+    assert io.spiDev.transfers == [bytes(MIXED) + bytes(1 + 7 + 5)]
+    assert io.pendingResponseBytes == 0
+
+
+def test_response_tail_carried_over_to_next_transfer():
+    async def run():
+        read = rfg.core.encodeCommands([rfg.core.RFGIOCommand.read(Registers.COUNTER, 4, increment=True)])
+        ## The first response is late: its last bytes arrive in the next transfer, followed by the second response
+        io = openIO([b"\xBC" * 12 + b"\x00\x01\x02", b"\x03\x04\x00\x05\x06\x07\x08"])
+        await io.writeBytes(read)
+        await io.writeBytes(read)
+        first = await io.readBytes(4)
+        second = await io.readBytes(4)
+        return first, second, io
+
+    first, second, io = asyncio.run(run())
+    assert (first, second) == (b"\x01\x02\x03\x04", b"\x05\x06\x07\x08")
+    ## Only trailing idle bytes are left, they are skipped when decoding the next frame
+    assert set(io.spiReceiveBuffer) <= {0xBC} and io.pendingResponseBytes == 0
+
+
+def test_write_only_transfer_bytes_dropped():
+    async def run():
+        writes = rfg.core.encodeCommands([writeCommand(Registers.CTRL, b"\x01")])
+        io = openIO([b"\x00\x00\x11\x22\x33"])
+        await io.writeBytes(writes)
+        return io
+
+    io = asyncio.run(run())
+    ## No response expected: the received bytes are not kept, they would be taken for a frame start otherwise
+    assert len(io.spiReceiveBuffer) == 0
+
+
+def test_write_only_transfer_kept_while_response_pending():
+    async def run():
+        read = rfg.core.encodeCommands([rfg.core.RFGIOCommand.read(Registers.STATUS, 1)])
+        writes = rfg.core.encodeCommands([writeCommand(Registers.CTRL, b"\x01")])
+        ## The response of the read arrives during the following write only transfer
+        io = openIO([b"", b"\x03\x42"])
+        await io.writeBytes(read)
+        await io.writeBytes(writes)
+        return await io.readBytes(1), io.lastReadChannel
+
+    assert asyncio.run(run()) == (b"\x42", 0x03)
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+
+import pandas as pd
+
+import drivers.readout.decoder
+from drivers.astropix.decode import Decode
+from drivers.readout import StreamingDecoder
+
+## Frames of 12 bytes with an idle byte after every other frame
+FRAMES = b"".join(bytes([11, i % 3]) + bytes([(i * 7 + j) % 256 for j in range(10)]) + (b"\xBC" if i % 2 else b"") for i in range(400))
+
+
+def decodeStream(chunkSize: int, csvPath=None, windowSize: int = 1000):
+    windows = []
+
+    def decode(window, i):
+        windows.append(window)
+        return Decode().decode_readout_numpy(window, i)
+
+    decoder = StreamingDecoder(decode, None if csvPath is None else str(csvPath), windowSize=windowSize)
+
+    async def run():
+        for start in range(0, len(FRAMES), chunkSize):
+            await decoder(FRAMES[start : start + chunkSize])
+        await decoder.flush()
+
+    asyncio.run(run())
+    return decoder, windows
+
+
+def test_windows_end_on_frames():
+    decoder, windows = decodeStream(chunkSize=37)
+    assert b"".join(windows) == FRAMES
+    assert decoder.windows == len(windows) > 1
+    assert decoder.hits == 400
+    for window in windows:
+        assert len(Decode().prepare_readout(window)[0][-1]) == 12
+
+
+def test_csv_matches_whole_decode(tmp_path):
+    decodeStream(chunkSize=250, csvPath=tmp_path / "hits.csv")
+    written = pd.read_csv(tmp_path / "hits.csv", index_col=0)
+    expected = Decode().decode_readout_numpy(FRAMES, 0)
+    assert list(written.index) == list(range(400))
+    for column in ["layer", "chipID", "location", "tot_total", "fpga_ts"]:
+        assert (written[column].values == expected[column].values).all()
+
+
+def test_final_window_keeps_incomplete_frame():
+    decoder = StreamingDecoder(lambda window, i: Decode().decode_readout_numpy(window, i), windowSize=10)
+
+    async def run():
+        await decoder(FRAMES[:30])
+        assert len(decoder.pending) == 30 - 25
+        await decoder.flush()
+
+    asyncio.run(run())
+    ## The cut off frame is decoded as an invalid hit by the last window
+    assert decoder.hits == 3 and decoder.windows == 2
+
+
+def test_boundary_search_off_loop(monkeypatch):
+    threads = []
+    findBoundary = drivers.readout.decoder.find_frame_boundary
+
+    def recordThread(*args):
+        threads.append(threading.current_thread())
+        return findBoundary(*args)
+
+    monkeypatch.setattr(drivers.readout.decoder, "find_frame_boundary", recordThread)
+    decodeStream(chunkSize=500)
+    assert len(threads) > 0 and threading.main_thread() not in threads
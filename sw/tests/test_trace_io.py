@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+import drivers.boards
+import rfg.io.trace
+
+
+async def readSequence(board) -> list:
+    await board.open()
+    await board.rfg.write_hk_ctrl(0x3, flush=True)
+    values = [await board.rfg.read_hk_ctrl(), await board.rfg.read_hk_firmware_id()]
+    size = await board.readoutGetBufferSize()
+    values.append(await board.readoutReadBytes(size))
+    await board.close()
+    return values
+
+
+def recordTrace(path) -> list:
+    board = drivers.boards.getCMODEmulatorDriver(hitRate=0)
+    board.rfg.io.readoutBuffer += bytes([3, 1, 2, 3])
+    board.selectTraceRecording(str(path))
+    return asyncio.run(readSequence(board))
+
+
+def test_record_then_replay(tmp_path):
+    path = tmp_path / "run.trace"
+    recorded = recordTrace(path)
+    assert recorded == [0x3, 0xAC03, bytes([3, 1, 2, 3])]
+
+    board = drivers.boards.getCMODDriver().selectTraceReplayIO(str(path), strict=True)
+    assert asyncio.run(readSequence(board)) == recorded
+    assert board.rfg.io.remainingBytes() == 0
+
+
+def test_trace_records_in_order(tmp_path):
+    path = tmp_path / "run.trace"
+    recordTrace(path)
+    records = list(rfg.io.trace.readTrace(str(path)))
+    assert records[0][0] == rfg.io.trace.RECORD_WRITE
+    assert [record[0] for record in records[1:3]] == [rfg.io.trace.RECORD_WRITE, rfg.io.trace.RECORD_READ]
+    times = [record[1] for record in records]
+    assert times == sorted(times)
+
+
+def test_strict_replay_rejects_other_writes(tmp_path):
+    path = tmp_path / "run.trace"
+    recordTrace(path)
+
+    async def run():
+        board = drivers.boards.getCMODDriver().selectTraceReplayIO(str(path), strict=True)
+        await board.open()
+        await board.rfg.write_hk_ctrl(0x1, flush=True)
+
+    with pytest.raises(RuntimeError, match="doesn't match"):
+        asyncio.run(run())
+
+
+def test_truncated_trace(tmp_path):
+    path = tmp_path / "run.trace"
+    recordTrace(path)
+    complete = list(rfg.io.trace.readTrace(str(path)))
+    data = path.read_bytes()
+    path.write_bytes(data[:-2])
+    assert list(rfg.io.trace.readTrace(str(path))) == complete[:-1]
+
+
+def test_not_a_trace(tmp_path):
+    path = tmp_path / "run.trace"
+    path.write_bytes(b"NOTATRACE0")
+    with pytest.raises(ValueError):
+        list(rfg.io.trace.readTrace(str(path)))
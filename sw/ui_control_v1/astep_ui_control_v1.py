@@ -138,6 +138,33 @@ def uiStartup(app,window):
 
     pass
 
+async def uiReadMonitoring(boardDriver):
+    """Reads the values refreshed every update tick with batched reads"""
+    async with boardDriver.rfg.batch() as b:
+        temp = b.submit(boardDriver.houseKeeping.readFPGATemperature())
+        bufferSize = b.submit(boardDriver.readoutGetBufferSize())
+        layers = [ { "bytesCount": b.submit(boardDriver.getLayerMISOBytesCount(i)), "status": b.submit(boardDriver.getLayerStatus(i)) } for i in range(3)]
+    return { 
+        "temp": temp.result(),
+        "bufferSize": bufferSize.result(),
+        "layers": [ {k: task.result() for k,task in layer.items()} for layer in layers]
+    }
+
+async def uiReadRegisters(boardDriver):
+    """Reads the status registers updated on request with batched reads"""
+    async with boardDriver.rfg.batch() as b:
+        ioCtrl = b.submit(boardDriver.getIOControlRegister())
+        layers = [ {
+            "status": b.submit(boardDriver.getLayerStatus(i)),
+            "control": b.submit(boardDriver.getLayerControl(i)),
+            "idleCounter": b.submit(boardDriver.getLayerStatIDLECounter(i)),
+            "frameCounter": b.submit(boardDriver.getLayerStatFRAMECounter(i))
+            } for i in range(3)]
+    return {
+        "ioCtrl": ioCtrl.result(),
+        "layers": [ {k: task.result() for k,task in layer.items()} for layer in layers]
+    }
+
 def uiUpdater(app,window):
     """This method runs in a thread with a 1s sleep, it updates all the fields that should be monitored"""
     while not uiStop.is_set():
@@ -153,30 +180,34 @@ def uiUpdater(app,window):
         if  uiRunning.is_set():
             boardDriver = window.boardDriver
 
+            ## Monitored values are read in one round trip
+            monitor = onIO(uiReadMonitoring(boardDriver))
+
             ## FPGA values
-            temp = onIO(window.boardDriver.houseKeeping.readFPGATemperature())
+            temp = monitor["temp"]
             window.fpgaTemperatureCanvas.addPoint(temp)
             window.fpgaTemperatureText.setText(f"{temp} °C")
 
             ## Main Buffer
-            window.readoutBufferSize.setText(f"{onIO(window.boardDriver.readoutGetBufferSize())} bytes")
+            window.readoutBufferSize.setText(f"{monitor['bufferSize']} bytes")
 
             ## Layers: MISO Bytes count, interrupt status
             for i in range(3):
 
-                bytesCount = onIO(window.boardDriver.getLayerMISOBytesCount(i))
+                bytesCount = monitor["layers"][i]["bytesCount"]
                 layerInfoWidget = window.leftLayerBoxesLayout.itemAt(i).widget()
                 layerInfoWidget.setMISOBytesCount(bytesCount)
 
-                layerStatus = onIO(boardDriver.getLayerStatus(i))
+                layerStatus = monitor["layers"][i]["status"]
                 layerInfoWidget.setStatusInterrupt(False if layerStatus & 0x1 != 0 else True) # Interrupt is negactive, so interrupt is true if bit is 0
 
             ## Update status registers which are not always updated on request
             if uiUpdateRegs.is_set() is True:
                 uiUpdateRegs.clear()
+                registers = onIO(uiReadRegisters(boardDriver))
 
                 ## IO Control
-                ioCtrl = onIO(boardDriver.getIOControlRegister())
+                ioCtrl = registers["ioCtrl"]
                 window.ioSampleClockEnBox.blockSignals(True)
                 window.ioTimestampClockEnBox.blockSignals(True)
                 window.ioSampleClockSEBox.blockSignals(True)
@@ -195,10 +226,10 @@ def uiUpdater(app,window):
                 ## Layer Status
                 for i in range(3):
 
-                    layerStatus = onIO(boardDriver.getLayerStatus(i))
-                    layerControl = onIO(boardDriver.getLayerControl(i))
-                    layerStatIDLECounter = onIO(boardDriver.getLayerStatIDLECounter(i))
-                    layerStatFRAMECounter = onIO(boardDriver.getLayerStatFRAMECounter(i))
+                    layerStatus = registers["layers"][i]["status"]
+                    layerControl = registers["layers"][i]["control"]
+                    layerStatIDLECounter = registers["layers"][i]["idleCounter"]
+                    layerStatFRAMECounter = registers["layers"][i]["frameCounter"]
                     
                     layerInfoWidget = window.leftLayerBoxesLayout.itemAt(i).widget()
                     layerInfoWidget.boardDriver = boardDriver